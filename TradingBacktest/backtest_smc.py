@@ -12,6 +12,11 @@ import pandas as pd
 import numpy as np
 from datetime import timedelta
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tradingbot.bar_stream import read_range, tail_bars
+from tradingbot.resample import bucket_bounds, bucket_start, resample_frame
 
 # --------------------
 # CONFIG
@@ -22,6 +27,8 @@ SYMBOL = "GBPUSD"
 LOT = 0.1
 SL_PIPS = 15
 TP_PIPS = 30
+M15_BARS = 480  # last N M15 bars to simulate (~5 trading days)
+DERIVE_M15 = True  # build M15 from the M1 export instead of reading M15_CSV
 CONTRACT_SIZE = 100000
 OUTPUT_DIR = "backtest_output"
 
@@ -30,32 +37,6 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 # --------------------
 # Helpers
 # --------------------
-def load_csv(filename):
-    df = pd.read_csv(filename)
-
-    # Try to automatically find a timestamp column
-    time_col = None
-    for c in df.columns:
-        c_lower = c.lower()
-        if 'time' in c_lower or 'date' in c_lower or 'datetime' in c_lower:
-            time_col = c
-            break
-
-    if time_col is None:
-        # If no suitable column is found, pick the first column of type object
-        for c in df.columns:
-            if df[c].dtype == object:
-                time_col = c
-                break
-
-    if time_col is None:
-        raise ValueError(f"No timestamp column found in {filename}. Please check your CSV.")
-
-    df[time_col] = pd.to_datetime(df[time_col])
-    df = df.sort_values(time_col).reset_index(drop=True)
-    df.rename(columns={time_col: 'time'}, inplace=True)
-    return df
-
 def pip_value(symbol):
     return 0.01 if symbol.endswith('JPY') else 0.0001
 
@@ -116,8 +97,14 @@ def find_last_swing_high_low(m15_window):
 # Simulator core
 # --------------------
 def run_backtest(m15_df, m1_df, strategy='original'):
-    m15_slice = m15_df.tail(480).reset_index(drop=True)
-    m1_slice = m1_df[m1_df['time'] >= m15_slice['time'].iloc[0]].reset_index(drop=True)
+    m15_slice = m15_df.tail(M15_BARS).reset_index(drop=True)
+
+    # Assign every M1 row to its M15 bar once (M1 is sorted by time), so
+    # each bucket below is a contiguous slice of these arrays.
+    m1_time = m1_df['time'].to_numpy(dtype='datetime64[ns]')
+    m1_open, m1_high, m1_low, m1_close = (m1_df[c].to_numpy(dtype=float) for c in ('open', 'high', 'low', 'close'))
+    m15_time = m15_slice['time'].to_numpy(dtype='datetime64[ns]')
+    bucket_lo, bucket_hi = bucket_bounds(m1_time.view('int64'), m15_time.view('int64'), 'M15')
 
     trades = []
     open_trade = None
@@ -131,7 +118,7 @@ def run_backtest(m15_df, m1_df, strategy='original'):
         m15_window = m15_slice.iloc[window_start_idx:idx+1]
 
         zones = detect_smc_from_m15(m15_bar, m15_window)
-        signal = zones['signal']
+        signal = zones['signal'] if zones else None
 
         pivot_h, pivot_l = find_last_swing_high_low(m15_window)
         last_m15_close = m15_window['close'].iloc[-1]
@@ -141,12 +128,19 @@ def run_backtest(m15_df, m1_df, strategy='original'):
         if pivot_l is not None and last_m15_close < pivot_l:
             broken = 'sell'
 
-        m1_start = m15_bar['time']
-        m1_end = m1_start + pd.Timedelta(minutes=15)
-        m1_bars = m1_slice[(m1_slice['time'] >= m1_start) & (m1_slice['time'] < m1_end)].reset_index(drop=True)
+        lo_row, hi_row = bucket_lo[idx], bucket_hi[idx]
+        bar_time = m1_time[lo_row:hi_row]
+        bar_open, bar_high = m1_open[lo_row:hi_row], m1_high[lo_row:hi_row]
+        bar_low, bar_close = m1_low[lo_row:hi_row], m1_close[lo_row:hi_row]
 
-        for j in range(len(m1_bars)):
-            row = m1_bars.iloc[j]
+        # M1 bars of this bucket touching any zone, in one pass
+        hit = np.zeros(hi_row - lo_row, dtype=bool)
+        if signal is not None:
+            for z in [zones['fvg'], zones['order_block'], zones['liquidity_grab']]:
+                if z is not None:
+                    hit |= (bar_low <= max(z)) & (bar_high >= min(z))
+
+        for j in range(hi_row - lo_row):
             if strategy == 'original':
                 can_enter = signal is not None
             else:
@@ -156,28 +150,18 @@ def run_backtest(m15_df, m1_df, strategy='original'):
                     can_enter = open_trade is None
 
             if can_enter and signal is not None:
-                zones_list = [zones['fvg'], zones['order_block'], zones['liquidity_grab']]
-                price = row['close']
-                hit_zone = False
-                for z in zones_list:
-                    if z is None:
-                        continue
-                    lo, hi = min(z), max(z)
-                    if row['low'] <= hi and row['high'] >= lo:
-                        hit_zone = True
-                        break
-                if hit_zone:
-                    if signal == 'buy' and row['close'] > row['open']:
-                        entry_price = row['close']
-                    elif signal == 'sell' and row['close'] < row['open']:
-                        entry_price = row['close']
+                if hit[j]:
+                    if signal == 'buy' and bar_close[j] > bar_open[j]:
+                        entry_price = bar_close[j]
+                    elif signal == 'sell' and bar_close[j] < bar_open[j]:
+                        entry_price = bar_close[j]
                     else:
                         continue
 
                     sl = entry_price - SL_PIPS * pv if signal == 'buy' else entry_price + SL_PIPS * pv
                     tp = entry_price + TP_PIPS * pv if signal == 'buy' else entry_price - TP_PIPS * pv
                     open_trade = {
-                        'entry_time': row['time'],
+                        'entry_time': pd.Timestamp(bar_time[j]),
                         'entry_price': entry_price,
                         'side': signal,
                         'sl': sl,
@@ -185,25 +169,25 @@ def run_backtest(m15_df, m1_df, strategy='original'):
                         'm1_index': j,
                         'm15_index': idx
                     }
-                    last_trade_time = row['time']
+                    last_trade_time = pd.Timestamp(bar_time[j])
 
             if open_trade is not None:
                 ot = open_trade
                 if ot['side'] == 'buy':
-                    if row['high'] >= ot['tp']:
+                    if bar_high[j] >= ot['tp']:
                         exit_price = ot['tp']
                         result = 'win'
-                    elif row['low'] <= ot['sl']:
+                    elif bar_low[j] <= ot['sl']:
                         exit_price = ot['sl']
                         result = 'loss'
                     else:
                         continue
                     profit = (exit_price - ot['entry_price']) * LOT * CONTRACT_SIZE
                 else:
-                    if row['low'] <= ot['tp']:
+                    if bar_low[j] <= ot['tp']:
                         exit_price = ot['tp']
                         result = 'win'
-                    elif row['high'] >= ot['sl']:
+                    elif bar_high[j] >= ot['sl']:
                         exit_price = ot['sl']
                         result = 'loss'
                     else:
@@ -212,7 +196,7 @@ def run_backtest(m15_df, m1_df, strategy='original'):
 
                 trade_record = {
                     'entry_time': ot['entry_time'],
-                    'exit_time': row['time'],
+                    'exit_time': pd.Timestamp(bar_time[j]),
                     'side': ot['side'],
                     'entry': ot['entry_price'],
                     'exit': exit_price,
@@ -251,8 +235,21 @@ def summarize(trades_df):
 # Main
 # --------------------
 def main():
-    m15 = load_csv(M15_CSV)
-    m1 = load_csv(M1_CSV)
+    # Stream the files: keep only the last M15_BARS M15 bars and the M1 bars
+    # from the first of those onwards, so long histories fit in memory.
+    if DERIVE_M15:
+        # (M15_BARS + 1) * 15 M1 rows span at least M15_BARS + 1 buckets (gaps
+        # only spread them over more), so one may be dropped and M15_BARS remain
+        m1 = tail_bars(M1_CSV, (M15_BARS + 1) * 15).rename(columns={'timestamp': 'time'})
+        m15 = resample_frame(m1, 'M15')
+        first = m1['time'].to_numpy(dtype='datetime64[ns]')[:1].view('int64')
+        if len(first) and bucket_start(first, 'M15')[0] != first[0]:
+            m15 = m15.iloc[1:].reset_index(drop=True)  # the read started mid-bucket
+        print(f"M15 bars resampled from {M1_CSV} ({M15_CSV} not used; set DERIVE_M15 = False to read it)")
+    else:
+        m15 = tail_bars(M15_CSV, M15_BARS).rename(columns={'timestamp': 'time'})
+        m1 = read_range(M1_CSV, start=m15['time'].iloc[0]).rename(columns={'timestamp': 'time'})
+        print(f"M15 bars read from {M15_CSV}")
 
     print("Running backtest for last 5 days (approx 480 M15 bars)...")
 
@@ -1,13 +1,19 @@
+import os
+import sys
 import pandas as pd
 import numpy as np
 import datetime as dt
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tradingbot.bar_stream import read_range
+from tradingbot.resample import resample_frame
+
 # ======================
 # CONFIGURATION
 # ======================
 SYMBOL = "XAUUSD"
 ENTRY_TF = "M1"       # Your saved CSV for M1
-ANALYSIS_TF = "M15"   # Your saved CSV for M15
+ANALYSIS_TF = "M15"   # Built from the M1 CSV unless an analysis file is given
 LOT_SIZE = 0.1
 RR = 2
 ATR_PERIOD = 14
@@ -81,9 +87,13 @@ def get_smc_signal(entry_df, analysis_df, i):
 # ======================
 # BACKTEST
 # ======================
-def run_backtest(entry_file, analysis_file):
-    df_low = pd.read_csv(entry_file, parse_dates=['time'])
-    df_high = pd.read_csv(analysis_file, parse_dates=['time'])
+def run_backtest(entry_file, analysis_file=None):
+    df_low = read_range(entry_file).rename(columns={'timestamp': 'time'})
+    if analysis_file is None:
+        log(f"{ANALYSIS_TF} bars resampled from {entry_file}")
+        df_high = resample_frame(df_low, ANALYSIS_TF)
+    else:
+        df_high = read_range(analysis_file).rename(columns={'timestamp': 'time'})
 
     df_high = calc_atr(df_high)
     df_high = get_trend(df_high)
@@ -162,4 +172,4 @@ def run_backtest(entry_file, analysis_file):
 # RUN
 # ======================
 if __name__=="__main__":
-    trades_df = run_backtest("XAUUSD_M1.csv","XAUUSD_M15.csv")
+    trades_df = run_backtest("XAUUSD_M1.csv")
@@ -13,6 +13,9 @@ from datetime import datetime
 import csv
 import os
 
+from tradingbot.smc_rates import smc_zones
+from tradingbot.zone_registry import ZoneRegistry
+
 # --------------------
 # CONFIG
 # --------------------
@@ -29,6 +32,8 @@ ANALYSIS_TF = mt5.TIMEFRAME_M15
 EXECUTION_TF = mt5.TIMEFRAME_M1
 BARS_ANALYSIS = 100
 LOG_FILE = "smc_trades_log.csv"
+ZONE_TTL  = 24 * 3600  # seconds a traded zone stays blocked; it is also unblocked once an M1 bar closes through it
+MAX_ZONES = 500        # zones remembered per symbol; live zones are never evicted
 
 # --------------------
 # Logging helpers
@@ -137,46 +142,7 @@ def detect_smc_zones(symbol, bars=BARS_ANALYSIS, analysis_tf=ANALYSIS_TF):
     if rates is None or len(rates) < 3:
         return None
 
-    highs = [r['high'] for r in rates]
-    lows = [r['low'] for r in rates]
-    closes = [r['close'] for r in rates]
-    opens = [r['open'] for r in rates]
-
-    signal = None
-    fvg_zone = None
-    lb_zone = None
-    ob_zone = None
-
-    # FVG detection
-    for i in range(1, len(rates)-1):
-        if opens[i+1] > closes[i-1]:
-            fvg_zone = (closes[i-1], opens[i+1])
-        elif opens[i+1] < closes[i-1]:
-            fvg_zone = (opens[i+1], closes[i-1])
-
-    # Liquidity Grab detection
-    prev_high = max(highs[:-1])
-    prev_low = min(lows[:-1])
-    last_candle = rates[-1]
-    if last_candle['high'] > prev_high:
-        lb_zone = (prev_high, last_candle['high'])
-        signal = "sell"
-    elif last_candle['low'] < prev_low:
-        lb_zone = (last_candle['low'], prev_low)
-        signal = "buy"
-
-    # Order Block detection
-    for i in range(len(rates)-2, -1, -1):
-        if closes[i] < opens[i] and closes[i+1] > closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "buy"
-            break
-        elif closes[i] > opens[i] and closes[i+1] < closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "sell"
-            break
+    signal, fvg_zone, lb_zone, ob_zone = smc_zones(rates)
 
     if signal:
         # Log detected zones to CSV
@@ -208,19 +174,23 @@ def is_price_in_zone(price, zone):
 # --------------------
 # Track traded zones
 # --------------------
-traded_zones = []
+zone_registry = ZoneRegistry(ttl=ZONE_TTL, max_zones=MAX_ZONES)
 
-def is_zone_traded(zone):
+def is_zone_traded(zone, symbol=SYMBOL):
     if zone is None:
         return False
-    for tz in traded_zones:
-        if max(zone[0], tz[0]) <= min(zone[1], tz[1]):  # overlapping zone
-            return True
-    return False
+    return zone_registry.is_traded(symbol, *zone)
+
+def mark_zone_traded(zone, signal=None, symbol=SYMBOL):
+    if zone and zone_registry.mark_traded(symbol, zone[0], zone[1], signal) is None:
+        log(f"⚠️ Zone registry full ({MAX_ZONES} live zones for {symbol}); zone {zone} not recorded")
 
-def mark_zone_traded(zone):
-    if zone:
-        traded_zones.append(zone)
+def expire_zones(symbol=SYMBOL):
+    """Drop zones past ZONE_TTL or closed through by the last closed M1 bar."""
+    rates = mt5.copy_rates_from_pos(symbol, EXECUTION_TF, 1, 1)
+    close = float(rates[-1]['close']) if rates is not None and len(rates) else None
+    for zone in zone_registry.update(symbol, price=close):
+        log(f"🗑️ Zone {zone['low']}-{zone['high']} ({zone['side']}) invalidated")
 
 # --------------------
 # M1 confirmation
@@ -264,6 +234,7 @@ def main():
         while True:
             smc_info = detect_smc_zones(SYMBOL)
             current_time = time.time()
+            expire_zones(SYMBOL)
 
             if smc_info and can_trade() and current_time - last_trade_time > COOLDOWN:
                 signal = smc_info['signal']
@@ -274,7 +245,7 @@ def main():
                         if m1_confirmation(SYMBOL, zone, signal):
                             log(f"💡 Confirmed {signal.upper()} inside zone {zone}")
                             place_order(SYMBOL, LOT_SIZE, signal, SL_PIPS, TP_PIPS)
-                            mark_zone_traded(zone)
+                            mark_zone_traded(zone, signal)
                             last_trade_time = current_time
                         else:
                             log("📊 Waiting for M1 confirmation...")
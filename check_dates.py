@@ -1,7 +1,8 @@
 import pandas as pd
+from tradingbot.bar_index import index_for_file
 
 trades = pd.read_csv("USTEC_trades.csv")
-candles = pd.read_csv("USTEC_candles.csv")
+candle_index = index_for_file("USTEC_candles.csv")
 
 # Detect which column holds the date
 if 'timestamp_entry' in trades.columns:
@@ -11,8 +12,8 @@ elif 'timestamp' in trades.columns:
 else:
     raise Exception("No timestamp column found in trades CSV")
 
-candles['time'] = pd.to_datetime(candles['time'])
-
 # Show unique trade days
 print("🟩 Trade days:", sorted(trades['timestamp'].dt.date.unique()))
-print("🟦 Candle days:", sorted(candles['time'].dt.date.unique()))
+print("🟦 Candle days:", candle_index.dates())
+print("⏸️ Candle gaps > 5 min:")
+print(candle_index.gaps().to_string(index=False))
@@ -1,14 +1,18 @@
 import MetaTrader5 as mt5
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from tradingbot.bar_export import export_all
 
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
-SYMBOL = "USTEC"
-TIMEFRAME = mt5.TIMEFRAME_M1  # 1-minute candles (adjust if needed)
-DAYS_BACK = 5  # Week 2 = 5 trading days
-OUTPUT_FILE = "USTEC_week2_candles.csv"
+# (symbol, timeframe, output file). Each file is appended to with only the
+# bars newer than its last stored bar, so re-running is cheap.
+EXPORTS = [
+    ("USTEC", "M1", "USTEC_week2_candles.csv"),
+]
+START_DATE = datetime(2025, 10, 13)  # used only when a file does not exist yet
+END_DATE = None                      # None = up to now
 
 # -----------------------------
 # CONNECT TO MT5
@@ -19,27 +23,17 @@ if not mt5.initialize():
     exit()
 print("✅ MT5 initialized")
 
-# -----------------------------
-# DEFINE START AND END DATES
-# -----------------------------
-# Week 2: 2025-10-13 to 2025-10-17
-start_date = datetime(2025, 10, 13)
-end_date = datetime(2025, 10, 17, 23, 59)
-
-print(f"📅 Requesting candles from {start_date} to {end_date}...")
-
 # -----------------------------
 # EXPORT CANDLES
 # -----------------------------
-rates = mt5.copy_rates_range(SYMBOL, TIMEFRAME, start_date, end_date)
-
-if rates is None or len(rates) == 0:
-    print("⚠️ No candle data received. Check symbol or timeframe.")
-else:
-    df = pd.DataFrame(rates)
-    df['time'] = pd.to_datetime(df['time'], unit='s')
-    df.to_csv(OUTPUT_FILE, index=False)
-    print(f"✅ Exported {len(df)} candles to {OUTPUT_FILE}")
+print(f"📅 Updating {len(EXPORTS)} candle file(s)...")
+written = export_all(mt5, EXPORTS, START_DATE, END_DATE)
+for symbol, timeframe, path in EXPORTS:
+    n = written[path]
+    if n:
+        print(f"✅ {symbol} {timeframe}: appended {n} new candles to {path}")
+    else:
+        print(f"⚠️ {symbol} {timeframe}: no new candles")
 
 # -----------------------------
 # SHUTDOWN MT5
@@ -1,10 +1,11 @@
 # fx_gold_engine.py
 import pandas as pd
 import numpy as np
-import yfinance as yf
 import matplotlib.pyplot as plt
 from pypfopt.hierarchical_portfolio import HRPOpt
 
+from tradingbot.price_cache import CsvSource, PriceCache, YahooSource
+
 # -----------------------------
 # Config (you can tweak these)
 # -----------------------------
@@ -14,12 +15,21 @@ TEST_DAYS = 30
 COST = 0.0002          # 2 bps per trade
 TARGET_VOL = 0.01      # target daily vol ~1%
 KILL_SWITCH_DD = -0.20 # stop if drawdown worse than -20%
+START, END = "2015-01-01", "2023-01-01"
+PRICE_FILE = None      # wide CSV of closes to run offline without Yahoo (None = Yahoo)
 
 # -----------------------------
 # Data
 # -----------------------------
-prices = yf.download(SYMBOLS, start="2015-01-01", end="2023-01-01")["Close"].dropna()
-returns = prices.pct_change().dropna()
+def load_prices(source=None, start=START, end=END):
+    """Daily closes for SYMBOLS, served from the local price cache.
+
+    Only dates not already cached are fetched from `source` (Yahoo by
+    default), so repeat runs work offline.
+    """
+    if source is None:
+        source = CsvSource(PRICE_FILE) if PRICE_FILE else YahooSource()
+    return PriceCache(source).get(SYMBOLS, start, end).dropna()
 
 # -----------------------------
 # Kill-Switch
@@ -151,6 +161,9 @@ def main():
     sma = SMACrossover(20, 100)
     rsi = RSI(14, 70, 30)
 
+    prices = load_prices()
+    returns = prices.pct_change().dropna()
+
     eq_sma = walkforward_per_asset(prices[SYMBOLS], sma)
     eq_rsi = walkforward_per_asset(prices[SYMBOLS], rsi)
     eq_hrp = walkforward_hrp(returns[SYMBOLS])
@@ -13,6 +13,8 @@ import time
 import csv
 import os
 
+from tradingbot.smc_rates import smc_zones
+
 # --------------------
 # CONFIG
 # --------------------
@@ -143,46 +145,7 @@ def detect_smc_zones(symbol, bars=BARS_ANALYSIS, analysis_tf=ANALYSIS_TF):
         log(f"⚠️ Not enough data to detect SMC for {symbol}")
         return None
 
-    highs = [r['high'] for r in rates]
-    lows = [r['low'] for r in rates]
-    closes = [r['close'] for r in rates]
-    opens = [r['open'] for r in rates]
-
-    signal = None
-    fvg_zone = None
-    lb_zone = None
-    ob_zone = None
-
-    # FVG detection
-    for i in range(1, len(rates)-1):
-        if opens[i+1] > closes[i-1]:
-            fvg_zone = (closes[i-1], opens[i+1])
-        elif opens[i+1] < closes[i-1]:
-            fvg_zone = (opens[i+1], closes[i-1])
-
-    # Liquidity Grab detection
-    prev_high = max(highs[:-1])
-    prev_low = min(lows[:-1])
-    last_candle = rates[-1]
-    if last_candle['high'] > prev_high:
-        lb_zone = (prev_high, last_candle['high'])
-        signal = "sell"
-    elif last_candle['low'] < prev_low:
-        lb_zone = (last_candle['low'], prev_low)
-        signal = "buy"
-
-    # Order Block detection
-    for i in range(len(rates)-2, -1, -1):
-        if closes[i] < opens[i] and closes[i+1] > closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "buy"
-            break
-        elif closes[i] > opens[i] and closes[i+1] < closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "sell"
-            break
+    signal, fvg_zone, lb_zone, ob_zone = smc_zones(rates)
 
     if signal:
         return {
@@ -3,6 +3,8 @@ import pandas as pd
 import time
 from datetime import datetime
 
+from tradingbot.tick_archive import TickRecorder
+
 # ======================
 # CONFIGURATION
 # ======================
@@ -17,6 +19,7 @@ LWR_THRESHOLD = 0.25
 UWR_THRESHOLD = 0.25
 MIN_ATR = 0.5
 ATR_MULTIPLIER_SL = 1
+TICK_ARCHIVE = "tick_archive"  # folder for recorded ticks (None to disable)
 
 # ======================
 # LOGIN
@@ -26,12 +29,19 @@ if not mt5.initialize(login=ACCOUNT, password=PASSWORD, server=SERVER):
     quit()
 print(f"{datetime.now()} | ✅ Logged in successfully | Account={ACCOUNT}")
 
+recorders = {}
+if TICK_ARCHIVE:
+    for symbol in SYMBOLS:
+        recorders[symbol] = TickRecorder(TICK_ARCHIVE, symbol, mt5.symbol_info(symbol).digits)
+
 # ======================
 # HELPER FUNCTIONS
 # ======================
 def get_ticks(symbol, n=50):
     """Get last n ticks as DataFrame"""
     ticks = mt5.copy_ticks_from(symbol, datetime.now(), n, mt5.COPY_TICKS_ALL)
+    if symbol in recorders and ticks is not None:
+        recorders[symbol].append(ticks)
     df = pd.DataFrame(ticks)
     return df
 
@@ -3,6 +3,9 @@ import pandas as pd
 import mplfinance as mpf
 import matplotlib.patches as patches
 import time
+from collections import deque
+
+from tradingbot.smc_engine import StructureEngine
 
 # ====== CONFIG ======
 SYMBOL = "GBPUSD"
@@ -11,12 +14,13 @@ BARS = 480
 SWING_LEFT = 3
 SWING_RIGHT = 3
 REFRESH = 60  # seconds
+NEW_BARS = 50  # closed bars requested per refresh; only those newer than the engine's last bar are used
 
 # ====== MT5 DATA FETCH ======
-def get_mt5_data():
+def get_mt5_data(count=BARS, start_pos=0):
     if not mt5.initialize():
         raise RuntimeError("MT5 initialize failed - check MT5 login.")
-    rates = mt5.copy_rates_from_pos(SYMBOL, TIMEFRAME, 0, BARS)
+    rates = mt5.copy_rates_from_pos(SYMBOL, TIMEFRAME, start_pos, count)
     mt5.shutdown()
     if rates is None or len(rates) == 0:
         raise RuntimeError("No data from MT5.")
@@ -24,73 +28,6 @@ def get_mt5_data():
     df["time"] = pd.to_datetime(df["time"], unit="s")
     return df[["time", "open", "high", "low", "close"]]
 
-# ====== SWING DETECTION ======
-def detect_swings(df, left=SWING_LEFT, right=SWING_RIGHT):
-    highs = df["high"].values
-    lows = df["low"].values
-    swings = []
-    n = len(df)
-    for i in range(left, n-right):
-        is_high = all(highs[i] > highs[i-j] for j in range(1, left+1)) and all(highs[i] > highs[i+j] for j in range(1, right+1))
-        is_low = all(lows[i] < lows[i-j] for j in range(1, left+1)) and all(lows[i] < lows[i+j] for j in range(1, right+1))
-        if is_high:
-            swings.append({'index': i, 'time': df['time'].iloc[i], 'type': 'H', 'price': float(highs[i])})
-        if is_low:
-            swings.append({'index': i, 'time': df['time'].iloc[i], 'type': 'L', 'price': float(lows[i])})
-    return swings
-
-# ====== BOS / CHoCH DETECTION ======
-def detect_bos_choch(swings):
-    bos_events = []
-    choch_events = []
-    last_high, last_low = None, None
-    trend = None
-    for s in swings:
-        if s['type'] == 'H':
-            if last_high is None: last_high = s['price']; continue
-            if s['price'] > last_high:
-                bos_events.append({'time': s['time'], 'type': 'BOS_up', 'price': s['price']})
-                if trend == 'down':
-                    choch_events.append({'time': s['time'], 'type': 'CHoCH_up', 'price': s['price']})
-                trend = 'up'
-                last_high = s['price']
-        else:
-            if last_low is None: last_low = s['price']; continue
-            if s['price'] < last_low:
-                bos_events.append({'time': s['time'], 'type': 'BOS_down', 'price': s['price']})
-                if trend == 'up':
-                    choch_events.append({'time': s['time'], 'type': 'CHoCH_down', 'price': s['price']})
-                trend = 'down'
-                last_low = s['price']
-    return bos_events, choch_events
-
-# ====== SUPPLY & DEMAND DETECTION ======
-def detect_supply_demand(df, swings):
-    zones = []
-    for s in swings:
-        idx = s['index']
-        if s['type'] == 'H':  # Possible supply zone
-            if idx+2 < len(df):
-                if df['close'].iloc[idx+2] < df['low'].iloc[idx+1]:  # Strong drop
-                    zones.append({
-                        'type': 'supply',
-                        'start': df['time'].iloc[idx],
-                        'end': df['time'].iloc[min(idx+5, len(df)-1)],
-                        'high': df['high'].iloc[idx],
-                        'low': df['low'].iloc[idx]
-                    })
-        if s['type'] == 'L':  # Possible demand zone
-            if idx+2 < len(df):
-                if df['close'].iloc[idx+2] > df['high'].iloc[idx+1]:  # Strong rally
-                    zones.append({
-                        'type': 'demand',
-                        'start': df['time'].iloc[idx],
-                        'end': df['time'].iloc[min(idx+5, len(df)-1)],
-                        'high': df['high'].iloc[idx],
-                        'low': df['low'].iloc[idx]
-                    })
-    return zones
-
 # ====== PLOT ======
 def plot_chart(df, bos, choch, zones):
     df_plot = df.rename(columns={'open':'Open','high':'High','low':'Low','close':'Close'}).set_index('time')
@@ -118,15 +55,40 @@ def plot_chart(df, bos, choch, zones):
     mpf.show()
 
 # ====== MAIN LOOP ======
+def engine_view(df, engine, events):
+    """BOS/CHoCH markers and active SD zones from the engine, limited to the bars in df."""
+    first = df['time'].iloc[0]
+    last = df['time'].iloc[-1]
+    recent = [e for e in events if pd.Timestamp(e.time) >= first]
+    bos = [{'time': pd.Timestamp(e.time), 'type': e.kind, 'price': e.price} for e in recent if e.kind.startswith('BOS')]
+    choch = [{'time': pd.Timestamp(e.time), 'type': e.kind, 'price': e.price} for e in recent if e.kind.startswith('CHoCH')]
+    zones = []
+    for z in engine.zones.values():
+        start = pd.Timestamp(z['start'])
+        if start >= first:
+            zones.append({'type': z['type'], 'start': start, 'end': min(start + 5 * pd.Timedelta(minutes=15), last),
+                          'high': z['high'], 'low': z['low']})
+    return bos, choch, zones
+
+
 def main():
+    # Closed bars only (start_pos=1). The engine is fed the history once and
+    # then just the bars that closed since the previous refresh.
+    engine = StructureEngine(SWING_LEFT, SWING_RIGHT)
+    df = get_mt5_data(BARS, start_pos=1)
+    events = deque(engine.update_many(df['time'].values, df['high'].values, df['low'].values, df['close'].values),
+                   maxlen=5 * BARS)
     while True:
-        df = get_mt5_data()
-        swings = detect_swings(df)
-        bos, choch = detect_bos_choch(swings)
-        zones = detect_supply_demand(df, swings)
+        bos, choch, zones = engine_view(df, engine, events)
         print(f"{len(bos)} BOS | {len(choch)} CHoCH | {len(zones)} SD Zones")
         plot_chart(df, bos, choch, zones)
         time.sleep(REFRESH)
 
+        latest = get_mt5_data(NEW_BARS, start_pos=1)
+        new = latest[latest['time'] > pd.Timestamp(engine.last_time)]
+        for row in new.itertuples(index=False):
+            events.extend(engine.update(row.time, row.high, row.low, row.close))
+        df = pd.concat([df, new], ignore_index=True).tail(BARS).reset_index(drop=True)
+
 if __name__ == "__main__":
     main()
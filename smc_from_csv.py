@@ -1,6 +1,7 @@
 """
 smc_from_csv.py
-Loads GBPUSD_M15.csv and GBPUSD_M1.csv (exported from MT5 History Center),
+Loads GBPUSD_M1.csv (exported from MT5 History Center) and builds M15 from it
+(or reads GBPUSD_M15.csv when DERIVE_M15 is False),
 runs a simple Smart Money Concepts style backtest (BoS + order block + 1m confirmation),
 and writes detected trades to trades_log.csv.
 """
@@ -9,6 +10,9 @@ import os
 import pandas as pd
 from datetime import timedelta
 
+from tradingbot.bar_stream import read_range
+from tradingbot.resample import resample_frame
+
 # --------------------
 # CONFIG
 # --------------------
@@ -17,106 +21,35 @@ M1_CSV  = "GBPUSD_M1.csv"
 TRADES_LOG = "trades_log.csv"
 DAYS_LOOKAHEAD_MIN = 24 * 60  # how many minutes to search after a 15m signal for 1m confirmation
 ORDERBLOCK_LOOKBACK = 3       # number of 15m candles to consider as "order block" consolidation
-
-# --------------------
-# Helper: robust CSV reader for MT5 exports
-# --------------------
-def read_mt5_csv(path):
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"File not found: {path}")
-
-    # Try different separators commonly used in MT5 exports
-    df = None
-    last_exc = None
-    for sep in [',', ';', '\t']:
-        try:
-            df_try = pd.read_csv(path, sep=sep, engine='python')
-            # require at least 5 cols (time,open,high,low,close)
-            if df_try.shape[1] >= 5:
-                df = df_try
-                break
-        except Exception as e:
-            last_exc = e
-            continue
-    if df is None:
-        raise ValueError(f"Could not parse CSV: {path}. Last error: {last_exc}")
-
-    # find time column
-    cols_lower = [c.lower() for c in df.columns]
-    time_col = None
-    for name in ('time', 'date', 'datetime'):
-        for c in df.columns:
-            if c.lower().startswith(name):
-                time_col = c
-                break
-        if time_col:
-            break
-    if time_col is None:
-        time_col = df.columns[0]  # fallback to first column
-
-    # parse datetimes robustly
-    df[time_col] = df[time_col].astype(str).str.strip()
-    df['time'] = pd.to_datetime(df[time_col], infer_datetime_format=True, errors='coerce')
-
-    # find OHLC columns
-    def find_col(prefixes):
-        for p in prefixes:
-            for c in df.columns:
-                if c.lower().startswith(p):
-                    return c
-        return None
-
-    open_col  = find_col(['open'])
-    high_col  = find_col(['high'])
-    low_col   = find_col(['low'])
-    close_col = find_col(['close'])
-    vol_col   = find_col(['tick','vol','volume'])
-
-    # fallback: if columns are unnamed or different order, attempt positional mapping
-    if any(x is None for x in (open_col, high_col, low_col, close_col)):
-        # expect common order: time,open,high,low,close,vol (or similar)
-        if df.shape[1] >= 6:
-            # assume columns[1:6] are OHLCV
-            open_col, high_col, low_col, close_col = df.columns[1], df.columns[2], df.columns[3], df.columns[4]
-            if vol_col is None and df.shape[1] >= 6:
-                vol_col = df.columns[5]
-
-    # Ensure we have required columns now
-    if any(x is None for x in (open_col, high_col, low_col, close_col)):
-        raise ValueError(f"Could not detect OHLC columns in {path}. Columns found: {list(df.columns)}")
-
-    # build normalized dataframe
-    use_cols = {'time': 'time', open_col: 'open', high_col: 'high', low_col: 'low', close_col: 'close'}
-    if vol_col:
-        use_cols[vol_col] = 'volume'
-
-    df2 = df[list(use_cols.keys())].rename(columns=use_cols)
-    # coerce numeric
-    for c in ['open','high','low','close','volume']:
-        if c in df2.columns:
-            df2[c] = pd.to_numeric(df2[c], errors='coerce')
-
-    df2 = df2.dropna(subset=['time']).sort_values('time').reset_index(drop=True)
-
-    return df2
+START = None  # e.g. "2025-01-01"; only bars in [START, END] are read (None = whole file)
+END = None
+DERIVE_M15 = True  # build M15 from the M1 export instead of reading M15_CSV
 
 # --------------------
 # Load CSVs
 # --------------------
+needed = (M1_CSV,) if DERIVE_M15 else (M15_CSV, M1_CSV)
 print("Looking for CSV files in current folder:", os.getcwd())
-for f in (M15_CSV, M1_CSV):
+for f in needed:
     print(" -", f, "→", "FOUND" if os.path.exists(f) else "MISSING")
 
-if not os.path.exists(M15_CSV) or not os.path.exists(M1_CSV):
+if not all(os.path.exists(f) for f in needed):
     raise SystemExit(
-        "One or both CSV files are missing. Export GBPUSD M15 and M1 from MT5 History Center\n"
-        f"and place them as '{M15_CSV}' and '{M1_CSV}' in this folder."
+        "CSV files are missing. Export GBPUSD M1 (and M15 if DERIVE_M15 is False) from MT5 History Center\n"
+        f"and place them as {' and '.join(repr(f) for f in needed)} in this folder."
     )
 
-print("Reading M15 CSV...")
-df_15m = read_mt5_csv(M15_CSV)
-print("Reading M1 CSV...")
-df_1m  = read_mt5_csv(M1_CSV)
+# Stream the files, keeping only the requested range (M1 from the first M15 bar on)
+if DERIVE_M15:
+    print(f"Reading M1 CSV and resampling to M15 ({M15_CSV} not used)...")
+    df_1m = read_range(M1_CSV, start=START, end=END).rename(columns={'timestamp': 'time'})
+    df_15m = resample_frame(df_1m, 'M15')
+else:
+    print("Reading M15 CSV...")
+    df_15m = read_range(M15_CSV, start=START, end=END).rename(columns={'timestamp': 'time'})
+    print("Reading M1 CSV...")
+    df_1m  = read_range(M1_CSV, start=df_15m['time'].iloc[0] if len(df_15m) else START, end=END) \
+        .rename(columns={'timestamp': 'time'})
 
 print(f"M15 range: {df_15m['time'].iloc[0]} → {df_15m['time'].iloc[-1]}   ({len(df_15m)} rows)")
 print(f"M1  range: {df_1m['time'].iloc[0]} → {df_1m['time'].iloc[-1]}   ({len(df_1m)} rows)")
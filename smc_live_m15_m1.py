@@ -11,6 +11,8 @@ import MetaTrader5 as mt5
 import time
 from datetime import datetime
 
+from tradingbot.smc_rates import break_of_structure
+
 # --------------------
 # CONFIG
 # --------------------
@@ -118,19 +120,7 @@ def detect_smc(symbol, analysis_tf=ANALYSIS_TF, bars=50):
     if rates is None or len(rates) < 3:
         return None
 
-    highs = [r['high'] for r in rates]
-    lows = [r['low'] for r in rates]
-    closes = [r['close'] for r in rates]
-
-    last_close = closes[-1]
-    prev_high = max(highs[:-1])
-    prev_low = min(lows[:-1])
-
-    if last_close > prev_high:
-        return "buy"
-    if last_close < prev_low:
-        return "sell"
-    return None
+    return break_of_structure(rates)
 
 # --------------------
 # Main loop
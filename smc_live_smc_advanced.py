@@ -11,6 +11,8 @@ import MetaTrader5 as mt5
 import time
 from datetime import datetime
 
+from tradingbot.smc_rates import smc_zones
+
 # --------------------
 # CONFIG
 # --------------------
@@ -122,58 +124,7 @@ def detect_smc_zones(symbol, bars=BARS_ANALYSIS, analysis_tf=ANALYSIS_TF):
     if rates is None or len(rates) < 3:
         return None
 
-    highs = [r['high'] for r in rates]
-    lows = [r['low'] for r in rates]
-    closes = [r['close'] for r in rates]
-    opens = [r['open'] for r in rates]
-
-    signal = None
-    fvg_zone = None
-    lb_zone = None
-    ob_zone = None
-
-    # --------------------
-    # Detect Fair Value Gap (FVG)
-    # --------------------
-    for i in range(1, len(rates)-1):
-        # bullish FVG: gap between low of current and high of previous candle
-        if opens[i+1] > closes[i-1]:
-            fvg_zone = (closes[i-1], opens[i+1])
-        # bearish FVG: gap between high of current and low of previous candle
-        elif opens[i+1] < closes[i-1]:
-            fvg_zone = (opens[i+1], closes[i-1])
-
-    # --------------------
-    # Detect Liquidity Grab (stop hunt wicks)
-    # --------------------
-    prev_high = max(highs[:-1])
-    prev_low = min(lows[:-1])
-    last_candle = rates[-1]
-
-    # wick above previous high -> buy liquidity grab
-    if last_candle['high'] > prev_high:
-        lb_zone = (prev_high, last_candle['high'])
-        signal = "sell"  # price likely reverses down
-    # wick below previous low -> sell liquidity grab
-    elif last_candle['low'] < prev_low:
-        lb_zone = (last_candle['low'], prev_low)
-        signal = "buy"  # price likely reverses up
-
-    # --------------------
-    # Detect Order Block (last opposite candle before move)
-    # --------------------
-    # simple heuristic: last bearish candle before bullish breakout
-    for i in range(len(rates)-2, -1, -1):
-        if closes[i] < opens[i] and closes[i+1] > closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "buy"
-            break
-        elif closes[i] > opens[i] and closes[i+1] < closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "sell"
-            break
+    signal, fvg_zone, lb_zone, ob_zone = smc_zones(rates)
 
     if signal:
         return {
@@ -7,6 +7,8 @@ import MetaTrader5 as mt5
 import time
 from datetime import datetime
 
+from tradingbot.smc_rates import break_of_structure
+
 # --------------------
 # CONFIG
 # --------------------
@@ -109,21 +111,7 @@ def detect_smc(symbol, bars=50):
     if rates is None or len(rates) < 3:
         return None
 
-    highs = [r.high for r in rates]
-    lows = [r.low for r in rates]
-
-    last_close = rates[-1].close
-    prev_high = max(highs[:-1])
-    prev_low = min(lows[:-1])
-
-    # Buy: last close > previous swing high
-    if last_close > prev_high:
-        return "buy"
-    # Sell: last close < previous swing low
-    if last_close < prev_low:
-        return "sell"
-
-    return None
+    return break_of_structure(rates)
 
 # --------------------
 # Main loop
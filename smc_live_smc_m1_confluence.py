@@ -8,6 +8,9 @@ from datetime import datetime
 import csv
 import os
 
+from tradingbot.confluence import ConfluenceMap
+from tradingbot.smc_rates import smc_zones
+
 # --------------------
 # CONFIG
 # --------------------
@@ -131,46 +134,7 @@ def detect_smc_zones(symbol, bars=BARS_ANALYSIS, analysis_tf=ANALYSIS_TF):
     if rates is None or len(rates) < 3:
         return None
 
-    highs = [r['high'] for r in rates]
-    lows = [r['low'] for r in rates]
-    closes = [r['close'] for r in rates]
-    opens = [r['open'] for r in rates]
-
-    signal = None
-    fvg_zone = None
-    lb_zone = None
-    ob_zone = None
-
-    # FVG
-    for i in range(1, len(rates)-1):
-        if opens[i+1] > closes[i-1]:
-            fvg_zone = (closes[i-1], opens[i+1])
-        elif opens[i+1] < closes[i-1]:
-            fvg_zone = (opens[i+1], closes[i-1])
-
-    # Liquidity Grab
-    prev_high = max(highs[:-1])
-    prev_low = min(lows[:-1])
-    last_candle = rates[-1]
-    if last_candle['high'] > prev_high:
-        lb_zone = (prev_high, last_candle['high'])
-        signal = "sell"
-    elif last_candle['low'] < prev_low:
-        lb_zone = (last_candle['low'], prev_low)
-        signal = "buy"
-
-    # Order Block
-    for i in range(len(rates)-2, -1, -1):
-        if closes[i] < opens[i] and closes[i+1] > closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "buy"
-            break
-        elif closes[i] > opens[i] and closes[i+1] < closes[i]:
-            ob_zone = (lows[i], highs[i])
-            if signal is None:
-                signal = "sell"
-            break
+    signal, fvg_zone, lb_zone, ob_zone = smc_zones(rates)
 
     if signal:
         log_to_csv({
@@ -185,10 +149,20 @@ def detect_smc_zones(symbol, bars=BARS_ANALYSIS, analysis_tf=ANALYSIS_TF):
             'signal': signal,
             'fvg': fvg_zone,
             'liquidity_grab': lb_zone,
-            'order_block': ob_zone
+            'order_block': ob_zone,
+            'confluence': confluence_map((fvg_zone, ob_zone, lb_zone))
         }
     return None
 
+_confluence = (None, None)  # (zone bounds, ConfluenceMap) of the last build
+
+def confluence_map(zones):
+    # the zones only move when a new M15 bar closes: rebuild the map then, reuse it otherwise
+    global _confluence
+    if _confluence[0] != zones:
+        _confluence = (zones, ConfluenceMap(zones, min_count=2))
+    return _confluence[1]
+
 # --------------------
 # Helpers
 # --------------------
@@ -198,8 +172,9 @@ def is_price_in_zone(price, zone):
     low, high = zone
     return low <= price <= high
 
-def is_confluence(price, zone_list):
-    return sum(1 for z in zone_list if is_price_in_zone(price, z)) >= 2
+def is_confluence(price, confluence):
+    # confluence: the ConfluenceMap built with the zones in detect_smc_zones
+    return price in confluence
 
 def draw_zone(symbol, zone, name, color):
     if zone is None:
@@ -249,7 +224,7 @@ def main():
 
             # Only trade if SMC detected, cooldown passed, and price in confluence zones
             if smc_info and can_trade() and current_time - last_trade_time > COOLDOWN:
-                if is_confluence(current_price, [smc_info['fvg'], smc_info['order_block'], smc_info['liquidity_grab']]):
+                if is_confluence(current_price, smc_info['confluence']):
                     log(f"💡 SMC Signal inside confluence zone: {smc_info['signal'].upper()}")
                     place_order(SYMBOL, LOT_SIZE, smc_info['signal'], SL_PIPS, TP_PIPS)
                     last_trade_time = current_time
@@ -1,10 +1,16 @@
 import MetaTrader5 as mt5
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime
 import time
 
+from tradingbot.liquidity import atr_tolerance, liquidity_pools
+from tradingbot.structure import bos_choch
+from tradingbot.swings import swing_points, swing_records
+from tradingbot.zones import fvg_zones, supply_demand_zones
+
 # =========================
 # SETTINGS
 # =========================
@@ -12,16 +18,18 @@ SYMBOL = "GBPUSD"
 TIMEFRAME = mt5.TIMEFRAME_M15
 BARS = 480
 REFRESH_SECONDS = 30  # Auto-refresh interval
+NEW_BARS = 50  # closed bars requested per refresh; only those newer than the chart's last bar are used
 IMPULSE_FACTOR = 1.5  # Multiplier to detect strong moves
+LIQUIDITY_ATR_MULT = 0.1  # swing levels within this many ATRs form one liquidity pool
 
 # =========================
 # FETCH DATA FROM MT5
 # =========================
-def fetch_mt5_data(symbol, timeframe, bars):
+def fetch_mt5_data(symbol, timeframe, bars, start_pos=0):
     if not mt5.initialize():
         raise RuntimeError("MT5 initialization failed")
 
-    rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, bars)
+    rates = mt5.copy_rates_from_pos(symbol, timeframe, start_pos, bars)
     mt5.shutdown()
 
     if rates is None or len(rates) == 0:
@@ -35,119 +43,52 @@ def fetch_mt5_data(symbol, timeframe, bars):
 # DETECT SWINGS
 # =========================
 def find_swings(df, lookback=2):
-    swing_highs = []
-    swing_lows = []
-
-    for i in range(lookback, len(df)-lookback):
-        high = df["high"].iloc[i]
-        low = df["low"].iloc[i]
-        if high == max(df["high"].iloc[i-lookback:i+lookback+1]):
-            swing_highs.append((df["time"].iloc[i], high))
-        if low == min(df["low"].iloc[i-lookback:i+lookback+1]):
-            swing_lows.append((df["time"].iloc[i], low))
-
-    return swing_highs, swing_lows
+    """Swing highs/lows as a SWING_DTYPE array (index, time, type, price) ordered by bar."""
+    high, low = df["high"].to_numpy(), df["low"].to_numpy()
+    hi_idx, lo_idx = swing_points(high, low, lookback)
+    return swing_records(df["time"].to_numpy(), high, low, hi_idx, lo_idx)
 
 # =========================
 # DETECT BOS & CHoCH
 # =========================
-def detect_bos_choch(swing_highs, swing_lows):
-    bos_points = []
-    choch_points = []
-    trend = None
-
-    for i in range(1, len(swing_highs)):
-        if swing_highs[i][1] > swing_highs[i-1][1]:
-            if trend == "down":
-                choch_points.append(swing_highs[i])
-            bos_points.append(swing_highs[i])
-            trend = "up"
-
-    for i in range(1, len(swing_lows)):
-        if swing_lows[i][1] < swing_lows[i-1][1]:
-            if trend == "up":
-                choch_points.append(swing_lows[i])
-            bos_points.append(swing_lows[i])
-            trend = "down"
-
-    return bos_points, choch_points
+def detect_bos_choch(swings):
+    """Time-ordered BOS/CHoCH events (STRUCTURE_DTYPE) from the merged swing stream."""
+    return bos_choch(swings)
 
 # =========================
 # DETECT LIQUIDITY POOLS
 # =========================
-def detect_liquidity_pools(swing_highs, swing_lows, tolerance=0.0005):
-    liquidity_highs = []
-    liquidity_lows = []
-
-    for i in range(len(swing_highs)-1):
-        if abs(swing_highs[i][1] - swing_highs[i+1][1]) <= tolerance:
-            liquidity_highs.append(swing_highs[i])
-            liquidity_highs.append(swing_highs[i+1])
-
-    for i in range(len(swing_lows)-1):
-        if abs(swing_lows[i][1] - swing_lows[i+1][1]) <= tolerance:
-            liquidity_lows.append(swing_lows[i])
-            liquidity_lows.append(swing_lows[i+1])
-
-    liquidity_highs = list(set(liquidity_highs))
-    liquidity_lows = list(set(liquidity_lows))
-
-    return liquidity_highs, liquidity_lows
+def detect_liquidity_pools(df, swings, atr_mult=LIQUIDITY_ATR_MULT):
+    """Equal-high/equal-low pools (POOL_DTYPE) clustered within atr_mult * ATR(14)."""
+    tolerance = atr_tolerance(df["high"].to_numpy(), df["low"].to_numpy(), df["close"].to_numpy(), atr_mult)
+    return liquidity_pools(swings, tolerance)
 
 # =========================
 # DETECT FAIR VALUE GAPS
 # =========================
 def detect_fvgs(df):
-    fvg_zones = []
-
-    for i in range(2, len(df)):
-        c1 = df.iloc[i-2]
-        c3 = df.iloc[i]
-
-        if c3["low"] > c1["high"]:  # Bullish FVG
-            fvg_zones.append((c1["time"], c3["time"], c1["high"], c3["low"], "bullish"))
-        if c3["high"] < c1["low"]:  # Bearish FVG
-            fvg_zones.append((c1["time"], c3["time"], c3["high"], c1["low"], "bearish"))
-
-    return fvg_zones
+    """(start, end, low, high, label) per fair value gap, from tradingbot.zones.fvg_zones."""
+    fvg = fvg_zones(df["time"].to_numpy(), df["high"].to_numpy(), df["low"].to_numpy())
+    labels = {"bull": "bullish", "bear": "bearish"}
+    return [(pd.Timestamp(z["start_time"]), pd.Timestamp(z["end_time"]), z["low"], z["high"], labels[z["type"]])
+            for z in fvg]
 
 # =========================
 # DETECT SUPPLY & DEMAND ZONES (EXTENDED)
 # =========================
 def detect_supply_demand(df):
-    zones = []
-    avg_range = df["high"] - df["low"]
-    avg_candle = avg_range.mean()
-
-    for i in range(2, len(df)-2):
-        # Demand Zone: Big bullish impulse
-        if df["close"].iloc[i+1] > df["high"].iloc[i] + avg_candle * IMPULSE_FACTOR:
-            zones.append({
-                "time": df["time"].iloc[i],
-                "low": df["low"].iloc[i],
-                "high": df["high"].iloc[i],
-                "type": "demand",
-                "valid": True
-            })
-
-        # Supply Zone: Big bearish impulse
-        if df["close"].iloc[i+1] < df["low"].iloc[i] - avg_candle * IMPULSE_FACTOR:
-            zones.append({
-                "time": df["time"].iloc[i],
-                "low": df["low"].iloc[i],
-                "high": df["high"].iloc[i],
-                "type": "supply",
-                "valid": True
-            })
-
-    # Invalidate zones if price later fully breaks them
-    for z in zones:
-        if z["type"] == "demand" and (df["close"] < z["low"]).any():
-            z["valid"] = False
-        if z["type"] == "supply" and (df["close"] > z["high"]).any():
-            z["valid"] = False
-
-    return zones
+    """Supply/demand zone dicts; a zone is invalid once a later close breaks through it."""
+    zones = supply_demand_zones(df["time"].to_numpy(), df["high"].to_numpy(), df["low"].to_numpy(),
+                                df["close"].to_numpy(), IMPULSE_FACTOR)
+    times = df["time"].to_numpy()
+    return [{
+        "time": pd.Timestamp(z["time"]),
+        "low": z["low"],
+        "high": z["high"],
+        "type": str(z["type"]),
+        "valid": bool(z["valid"]),
+        "broken_time": pd.Timestamp(times[z["broken"]]) if z["broken"] >= 0 else None,
+    } for z in zones]
 
 # =========================
 # PLOT SUPPLY/DEMAND ZONES
@@ -171,7 +112,7 @@ def plot_supply_demand(ax, df, zones):
 # =========================
 # PLOT CHART
 # =========================
-def plot_chart(df, bos_points, choch_points, liq_highs, liq_lows, fvgs, zones):
+def plot_chart(df, structure, pools, fvgs, zones):
     plt.clf()
     fig, ax = plt.subplots(figsize=(14, 7))
     ax.set_title(f"{SYMBOL} M15 - SMC with Supply/Demand", fontsize=14, fontweight="bold")
@@ -189,19 +130,15 @@ def plot_chart(df, bos_points, choch_points, liq_highs, liq_lows, fvgs, zones):
             color=color
         ))
 
-    # BOS
-    for t, p in bos_points:
-        ax.scatter(t, p, color="blue", marker="^", s=100)
-
-    # CHoCH
-    for t, p in choch_points:
-        ax.scatter(t, p, color="orange", marker="v", s=100)
+    # BOS / CHoCH
+    is_bos = np.char.startswith(structure["type"], "BOS")
+    ax.scatter(structure["time"][is_bos], structure["price"][is_bos], color="blue", marker="^", s=100)
+    ax.scatter(structure["time"][~is_bos], structure["price"][~is_bos], color="orange", marker="v", s=100)
 
     # Liquidity Pools
-    for _, p in liq_highs:
-        ax.axhline(y=p, color="purple", linestyle="--", alpha=0.7)
-    for _, p in liq_lows:
-        ax.axhline(y=p, color="brown", linestyle="--", alpha=0.7)
+    for pool in pools:
+        color = "purple" if pool["type"] == "H" else "brown"
+        ax.axhline(y=pool["level"], color=color, linestyle="--", alpha=0.7)
 
     # FVG Zones
     for start, end, high, low, fvg_type in fvgs:
@@ -222,17 +159,28 @@ def plot_chart(df, bos_points, choch_points, liq_highs, liq_lows, fvgs, zones):
 # MAIN (AUTO-REFRESH)
 # =========================
 def main():
+    # Closed bars only (start_pos=1). The full window is fetched once; each
+    # refresh asks for the last NEW_BARS and the detectors only rerun when a
+    # bar has closed since the previous pass.
     plt.ion()
+    df = fetch_mt5_data(SYMBOL, TIMEFRAME, BARS, start_pos=1)
+    changed = True
     while True:
-        df = fetch_mt5_data(SYMBOL, TIMEFRAME, BARS)
-        swing_highs, swing_lows = find_swings(df)
-        bos_points, choch_points = detect_bos_choch(swing_highs, swing_lows)
-        liq_highs, liq_lows = detect_liquidity_pools(swing_highs, swing_lows)
-        fvgs = detect_fvgs(df)
-        zones = detect_supply_demand(df)
-        plot_chart(df, bos_points, choch_points, liq_highs, liq_lows, fvgs, zones)
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Chart updated.")
+        if changed:
+            swings = find_swings(df)
+            structure = detect_bos_choch(swings)
+            pools = detect_liquidity_pools(df, swings)
+            fvgs = detect_fvgs(df)
+            zones = detect_supply_demand(df)
+            plot_chart(df, structure, pools, fvgs, zones)
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Chart updated.")
         time.sleep(REFRESH_SECONDS)
 
+        latest = fetch_mt5_data(SYMBOL, TIMEFRAME, NEW_BARS, start_pos=1)
+        new = latest[latest["time"] > df["time"].iloc[-1]]
+        changed = len(new) > 0
+        if changed:
+            df = pd.concat([df, new], ignore_index=True).tail(BARS).reset_index(drop=True)
+
 if __name__ == "__main__":
     main()
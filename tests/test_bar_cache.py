@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.bar_cache import load_bars, is_fresh, sidecar_path
+
+CSV = (
+    "time,open,high,low,close,tick_volume,spread,real_volume\n"
+    "2025-10-06 01:00:00,24827.9,24830.9,24814.9,24819.2,158,100,0\n"
+    "2025-10-06 01:01:00,24819.3,24823.7,24810.7,24814.7,188,100,0\n"
+)
+
+
+def test_sidecar_is_memory_mapped_and_rebuilt_when_stale(tmp_path):
+    path = tmp_path / "bars.csv"
+    path.write_text(CSV)
+    cache_dir = str(tmp_path / "cache")
+
+    bars = load_bars(str(path), cache_dir)
+    assert is_fresh(str(path), cache_dir)
+    bars = load_bars(str(path), cache_dir)
+    assert isinstance(bars.close, np.memmap)
+    assert bars.time[1] - bars.time[0] == 60 * 10**9
+    assert len(bars) == 2
+
+    path.write_text(CSV + "2025-10-06 01:02:00,24814.7,24820.0,24810.0,24818.0,120,100,0\n")
+    assert not is_fresh(str(path), cache_dir)
+    assert len(load_bars(str(path), cache_dir)) == 3
+
+
+def test_rebuild_swaps_sidecar_before_cleanup(tmp_path):
+    path = tmp_path / "bars.csv"
+    path.write_text(CSV)
+    cache_dir = tmp_path / "cache"
+
+    held = load_bars(str(path), str(cache_dir)).close    # a reader keeps the old map open
+    sidecar = sidecar_path(str(path), str(cache_dir))
+    mask = os.umask(0)
+    os.umask(mask)
+    assert os.stat(sidecar).st_mode & 0o777 == 0o777 & ~mask
+
+    path.write_text(CSV + "2025-10-06 01:02:00,24814.7,24820.0,24810.0,24818.0,120,100,0\n")
+    assert len(load_bars(str(path), str(cache_dir))) == 3
+    assert held.tolist() == [24819.2, 24814.7]
+    assert [p.name for p in cache_dir.iterdir()] == [os.path.basename(sidecar)]
@@ -0,0 +1,30 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.bar_catalog import BarCatalog
+
+HEADER = "time,open,high,low,close,tick_volume,spread,real_volume\n"
+
+
+def write_bars(path, minutes, price):
+    rows = [f"2025-10-06 10:{m:02d}:00,{price},{price + 1},{price - 1},{price},10,1,0" for m in minutes]
+    path.write_text(HEADER + "\n".join(rows) + "\n")
+
+
+def test_read_bars_merges_and_dedupes_overlaps(tmp_path):
+    write_bars(tmp_path / "a.csv", range(0, 10), 100.0)
+    write_bars(tmp_path / "b.csv", range(5, 15), 200.0)
+    write_bars(tmp_path / "c.csv", range(40, 45), 300.0)
+    sources = [('USTEC', 'M1', 'a.csv'), ('USTEC', 'M1', 'b.csv'), ('USTEC', 'M1', 'c.csv')]
+    catalog = BarCatalog.from_folder(str(tmp_path), sources, cache_dir=str(tmp_path / "cache"))
+
+    assert len(catalog.find('ustec', 'm1', '2025-10-06 10:00', '2025-10-06 10:20')) == 2
+
+    bars = catalog.read_bars('USTEC', 'M1', '2025-10-06 10:03', '2025-10-06 10:12')
+    assert len(bars) == 10
+    assert (np.diff(bars.time) == 60 * 10**9).all()
+    # a.csv is registered first, so it wins on the overlapping minutes
+    assert bars.close[:7].tolist() == [100.0] * 7
+    assert bars.close[7:].tolist() == [200.0] * 3
@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from tradingbot.bar_export import export_all, last_bar_time
+from tradingbot.mt5_csv import read_mt5_csv
+
+RATE_DTYPE = [('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+              ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')]
+
+
+class FakeTerminal:
+    """copy_rates_range over an in-memory history, recording each request."""
+    TIMEFRAME_M1 = 1
+
+    def __init__(self, history):
+        self.history = history
+        self.requests = []
+
+    def copy_rates_range(self, symbol, timeframe, date_from, date_to):
+        self.requests.append((symbol, date_from))
+        t = self.history[symbol]['time']
+        keep = (t >= date_from.timestamp()) & (t <= date_to.timestamp())
+        return self.history[symbol][keep]
+
+
+def make_rates(start, n):
+    rates = np.zeros(n, dtype=RATE_DTYPE)
+    rates['time'] = pd.Timestamp(start).value // 10**9 + 60 * np.arange(n)
+    rates['open'] = rates['high'] = rates['low'] = rates['close'] = 100 + np.arange(n)
+    rates['tick_volume'] = 10
+    return rates
+
+
+def test_appends_only_new_bars(tmp_path):
+    full = {'USTEC': make_rates('2025-10-13 01:00', 30), 'XAUUSD': make_rates('2025-10-13 01:00', 20)}
+    exports = [(s, 'M1', str(tmp_path / f"{s}.csv")) for s in full]
+    paths = [p for _, _, p in exports]
+    first = {s: r[:10] for s, r in full.items()}
+    term = FakeTerminal(first)
+    # an explicit end in the past: the last bar is closed and kept
+    assert export_all(term, exports, '2025-10-13', '2025-10-14') == dict(zip(paths, [10, 10]))
+
+    term.history = full
+    assert export_all(term, exports, '2025-10-13', '2025-10-14') == dict(zip(paths, [20, 10]))
+    # second run starts at the last stored bar, not at START
+    assert term.requests[-1][1] == pd.Timestamp('2025-10-13 01:09', tz='UTC')
+
+    df = read_mt5_csv(paths[0])
+    assert len(df) == 30 and df['timestamp'].is_unique
+    assert df['close'].tolist() == list(100 + np.arange(30.0))
+    assert last_bar_time(paths[0]) == pd.Timestamp('2025-10-13 01:29').value
+
+
+def test_holds_back_forming_bar_up_to_now(tmp_path):
+    now = pd.Timestamp.now(tz='UTC').floor('min').tz_localize(None)
+    term = FakeTerminal({'USTEC': make_rates(now - pd.Timedelta(minutes=9), 10)})
+    exports = [('USTEC', 'M1', str(tmp_path / 'a.csv')), ('USTEC', 'M1', str(tmp_path / 'b.csv'))]
+    # two files for the same pair are reported separately; the newest bar is still forming
+    assert export_all(term, exports, now - pd.Timedelta(hours=1)) == {exports[0][2]: 9, exports[1][2]: 9}
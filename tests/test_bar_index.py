@@ -0,0 +1,28 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from tradingbot.bar_index import BarIndex
+
+
+def make_times():
+    day1 = pd.date_range('2025-10-06 13:00', '2025-10-06 18:59', freq='min')
+    day2 = pd.date_range('2025-10-07 13:00', '2025-10-07 18:59', freq='min').delete(slice(100, 110))
+    return pd.DatetimeIndex(day1.append(day2)).as_unit('ns').asi8
+
+
+def test_days_sessions_and_gaps():
+    t = make_times()
+    index = BarIndex(t, gap_minutes=5)
+    assert [str(d) for d in index.dates()] == ['2025-10-06', '2025-10-07']
+    assert index.day('2025-10-07') == slice(360, len(t))
+
+    sessions = index.sessions('14:00', '18:00')
+    assert [s.stop - s.start for s in sessions] == [240, 230]
+    assert pd.Timestamp(t[sessions[1].start]) == pd.Timestamp('2025-10-07 14:00')
+
+    # overnight break and the 10-minute hole on day 2
+    assert index.gap_rows.tolist() == [360, 460]
+    assert index.next_gap(np.array([0, 359, 360, 500])).tolist() == [360, 360, 460, len(t)]
@@ -0,0 +1,36 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+from tradingbot.bar_stream import iter_bars, read_range, tail_bars
+
+
+def write_m1(path, days=3, per_day=30):
+    lines = ["<DATE>\t<TIME>\t<OPEN>\t<HIGH>\t<LOW>\t<CLOSE>\t<TICKVOL>\t<VOL>\t<SPREAD>"]
+    for d in range(days):
+        for m in range(per_day):
+            px = 100 + d + m / 100
+            lines.append(f"2025.10.{6 + d:02d}\t10:{m:02d}:00\t{px}\t{px + 1}\t{px - 1}\t{px}\t10\t0\t5")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_day_chunks_span_read_boundaries(tmp_path):
+    path = tmp_path / "m1.csv"
+    write_m1(path)
+    days = list(iter_bars(str(path), chunk='day', rows=7))
+    assert [len(d) for d in days] == [30, 30, 30]
+    assert days[1]['timestamp'].dt.day.unique().tolist() == [7]
+
+
+def test_range_pushdown_and_tail(tmp_path):
+    path = tmp_path / "m1.csv"
+    write_m1(path)
+    r = read_range(str(path), start='2025-10-07 10:25', end='2025-10-08 10:04', rows=10)
+    assert r['timestamp'].iloc[0] == pd.Timestamp('2025-10-07 10:25')
+    assert r['timestamp'].iloc[-1] == pd.Timestamp('2025-10-08 10:04')
+    assert len(r) == 10
+
+    t = tail_bars(str(path), 45, rows=8)
+    assert len(t) == 45
+    assert t['timestamp'].iloc[-1] == pd.Timestamp('2025-10-08 10:29')
@@ -0,0 +1,25 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.confluence import ConfluenceMap
+
+
+def test_counts_match_scan():
+    rng = np.random.default_rng(5)
+    a = np.round(rng.uniform(1.0, 1.1, 6), 3)
+    b = np.round(rng.uniform(1.0, 1.1, 6), 3)
+    zones = list(zip(a, b)) + [None]
+    cmap = ConfluenceMap(zones)
+    prices = np.concatenate([np.round(rng.uniform(0.99, 1.11, 2000), 3), a, b])
+    expected = np.array([sum(min(z) <= p <= max(z) for z in zones if z is not None) for p in prices])
+    assert (cmap.count(prices) == expected).all()
+    assert (cmap.mask(prices) == (expected >= 2)).all()
+    assert (prices[0] in cmap) == (expected[0] >= 2)
+
+
+def test_empty_and_single():
+    assert not (1.0 in ConfluenceMap([None, None, None]))
+    cmap = ConfluenceMap([(1.2, 1.1), (1.15, 1.3)])
+    assert list(cmap.count([1.05, 1.1, 1.15, 1.2, 1.25, 1.35])) == [0, 1, 2, 2, 1, 0]
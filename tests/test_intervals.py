@@ -0,0 +1,24 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.intervals import IntervalIndex
+
+
+def test_interval_index_matches_brute_force():
+    rng = np.random.default_rng(1)
+    low = np.round(rng.uniform(0, 10, 200), 1)
+    high = low + np.round(rng.uniform(0, 2, 200), 1)
+    index = IntervalIndex(low, high)
+    prices = np.concatenate([np.round(rng.uniform(-1, 13, 500), 2), low[:20], high[:20]])  # edges are inside
+
+    inside = (low[None, :] <= prices[:, None]) & (prices[:, None] <= high[None, :])
+    assert index.count(prices).tolist() == inside.sum(axis=1).tolist()
+    for p, row in zip(prices[:50], inside[:50]):
+        assert index.query(p).tolist() == np.flatnonzero(row).tolist()
+
+    rows, ids = index.query_batch(prices)
+    ref_rows, ref_ids = np.nonzero(inside)
+    assert rows.tolist() == ref_rows.tolist() and ids.tolist() == ref_ids.tolist()
+    assert IntervalIndex([], []).count([1.0]).tolist() == [0]
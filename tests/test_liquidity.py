@@ -0,0 +1,26 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.liquidity import liquidity_pools
+from tradingbot.swings import SWING_DTYPE
+
+
+def test_pools_group_non_adjacent_equal_levels():
+    # equal highs at 2050.0/2050.3/2049.9 are separated in time by other swings
+    prices = [2050.0, 2061.0, 2050.3, 2072.0, 2049.9, 2061.2, 2030.0]
+    swings = np.zeros(len(prices) + 2, dtype=SWING_DTYPE)
+    swings['type'][:len(prices)] = 'H'
+    swings['price'][:len(prices)] = prices
+    swings['type'][len(prices):] = 'L'
+    swings['price'][len(prices):] = [2000.0, 2000.2]
+    swings['index'] = np.arange(len(swings)) * 5
+    swings['time'] = np.datetime64('2025-10-06T00:00', 'ns') + swings['index'] * np.timedelta64(1, 'm')
+
+    pools = liquidity_pools(swings, tolerance=0.5)
+    assert pools['type'].tolist() == ['H', 'H', 'L']
+    assert pools['touches'].tolist() == [3, 2, 2]
+    np.testing.assert_allclose(pools['level'], [(2050.0 + 2050.3 + 2049.9) / 3, 2061.1, 2000.1])
+    assert pools['first_time'][0] == swings['time'][0] and pools['last_time'][0] == swings['time'][4]
+    assert len(liquidity_pools(swings, tolerance=0.05)) == 0
@@ -0,0 +1,31 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from tradingbot.monte_carlo import bootstrap, block_stats
+
+
+def make_trades():
+    times = pd.to_datetime(['2025-10-06 14:00', '2025-10-06 15:00', '2025-10-07 14:00',
+                            '2025-10-07 16:00', '2025-10-08 14:30'])
+    return pd.DataFrame({'timestamp': times, 'result_pips': [10.0, -5.0, -8.0, 3.0, 6.0]})
+
+
+def test_block_stats_drawdown():
+    stats = block_stats(np.array([2.0, -5.0, 1.0]), np.zeros(3))
+    assert stats['total'][0] == -2.0
+    assert stats['mdd'][0] == 5.0
+    assert stats['trough'][0] == -3.0
+
+
+def test_day_block_paths_reuse_daily_totals():
+    trades = make_trades()
+    paths = bootstrap(trades, n_paths=200, block='day', seed=3, mem_mb=0.0001)
+    assert len(paths) == 200
+    assert (paths['max_drawdown'] >= 0).all()
+    # Every day-block path totals to a sum of three daily totals
+    daily = {5.0, -5.0, 6.0}
+    sums = {a + b + c for a in daily for b in daily for c in daily}
+    assert set(np.round(paths['total_pips'], 6)) <= {round(s, 6) for s in sums}
@@ -0,0 +1,41 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+from tradingbot.mt5_csv import read_mt5_csv, sniff
+
+MT5_EXPORT = (
+    "<DATE>\t<TIME>\t<OPEN>\t<HIGH>\t<LOW>\t<CLOSE>\t<TICKVOL>\t<VOL>\t<SPREAD>\n"
+    "2025.10.06\t01:01:00\t3886.89\t3888.52\t3886.39\t3886.49\t134\t0\t18\n"
+    "2025.10.06\t01:00:00\t3888.47\t3888.90\t3885.80\t3886.89\t107\t0\t19\n"
+)
+PANDAS_EXPORT = (
+    "time,open,high,low,close,tick_volume,spread,real_volume\n"
+    "2025-10-06 01:00:00,24827.9,24830.9,24814.9,24819.2,158,100,0\n"
+    "2025-10-06 01:01:00,24819.3,24823.7,24810.7,24814.7,188,100,0\n"
+)
+
+
+def test_sniff_mt5_tab_export_utf16(tmp_path):
+    path = tmp_path / "xau.csv"
+    path.write_text(MT5_EXPORT, encoding='utf-16')
+    fmt = sniff(str(path))
+    assert fmt.encoding == 'utf-16'
+    assert fmt.sep == '\t'
+    assert fmt.split_datetime
+    assert fmt.datetime_format == '%Y.%m.%d %H:%M:%S'
+
+    df = read_mt5_csv(str(path))
+    assert list(df['timestamp']) == [pd.Timestamp('2025-10-06 01:00:00'), pd.Timestamp('2025-10-06 01:01:00')]
+    assert df['tickvol'].dtype == 'int64'
+    assert df['close'].iloc[0] == 3886.89
+
+
+def test_pandas_export_normalised(tmp_path):
+    path = tmp_path / "ustec.csv"
+    path.write_text(PANDAS_EXPORT)
+    df = read_mt5_csv(str(path))
+    assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'tickvol', 'volume', 'spread']
+    assert df['tickvol'].tolist() == [158, 188]
+    assert df['timestamp'].iloc[1] == pd.Timestamp('2025-10-06 01:01:00')
@@ -0,0 +1,51 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+import numpy as np
+import pandas as pd
+from tradingbot.price_cache import CsvSource, PriceCache
+
+
+def test_serves_from_cache_and_fetches_only_tail(tmp_path):
+    dates = pd.bdate_range('2022-01-03', periods=60)
+    wide = pd.DataFrame({'EURUSD=X': np.linspace(1.1, 1.2, 60), 'XAUUSD=X': np.linspace(1800, 1900, 60)},
+                        index=pd.Index(dates, name='Date'))
+    wide.to_csv(tmp_path / 'closes.csv')
+
+    source = CsvSource(str(tmp_path / 'closes.csv'))
+    fetched = source.requests
+    cache = PriceCache(source, cache_dir=str(tmp_path / 'cache'))
+
+    first = cache.get(['EURUSD=X', 'XAUUSD=X'], '2022-01-01', '2022-02-01')
+    assert list(first.index) == list(dates[:21])
+    np.testing.assert_allclose(first.to_numpy(), wide.to_numpy()[:21])
+    assert len(fetched) == 1
+
+    # same range again: no fetch; a longer range: only the missing tail
+    cache.get(['EURUSD=X', 'XAUUSD=X'], '2022-01-01', '2022-02-01')
+    assert len(fetched) == 1
+    full = PriceCache(source, cache_dir=str(tmp_path / 'cache')).get(['EURUSD=X', 'XAUUSD=X'], '2022-01-01', '2022-04-01')
+    assert fetched[1] == (pd.Timestamp('2022-02-01'), pd.Timestamp('2022-04-01'))
+    assert list(full.index) == list(dates)
+    np.testing.assert_allclose(full.to_numpy(), wide.to_numpy())
+
+
+def test_covered_range_stops_at_last_close(tmp_path):
+    dates = pd.bdate_range('2022-01-03', periods=10)   # last close 2022-01-14
+    pd.DataFrame({'EURUSD=X': np.linspace(1.1, 1.2, 10)}, index=pd.Index(dates, name='Date')) \
+        .to_csv(tmp_path / 'closes.csv')
+    source = CsvSource(str(tmp_path / 'closes.csv'))
+    cache = PriceCache(source, cache_dir=str(tmp_path / 'cache'))
+
+    cache.get('EURUSD=X', '2022-01-03', '2022-02-01')
+    # days after the last close were not returned yet, so they are asked for again
+    cache.get('EURUSD=X', '2022-01-03', '2022-02-01')
+    assert source.requests[1] == (pd.Timestamp('2022-01-15'), pd.Timestamp('2022-02-01'))
+
+    # a range ending in the future is never covered past today
+    cache.get('EURUSD=X', '2022-01-03', pd.Timestamp.now() + pd.Timedelta(days=30))
+    meta = json.loads((tmp_path / 'cache' / 'EURUSD_X' / 'meta.json').read_text())
+    assert meta['end'] <= pd.Timestamp.now().as_unit('ns').value
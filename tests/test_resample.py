@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.resample import IncrementalResampler, bucket_bounds, resample
+
+MIN = 60 * 10**9
+
+
+def make_m1():
+    # 10:00-10:19 with 10:07 missing
+    minutes = [m for m in range(20) if m != 7]
+    t0 = np.datetime64('2025-10-06T10:00', 'ns').astype(np.int64)
+    n = len(minutes)
+    return {
+        'time': t0 + np.array(minutes) * MIN,
+        'open': np.arange(n, dtype=float), 'high': np.arange(n, dtype=float) + 1,
+        'low': np.arange(n, dtype=float) - 1, 'close': np.arange(n, dtype=float) + 0.5,
+        'tickvol': np.ones(n, dtype=np.int64), 'volume': np.zeros(n, dtype=np.int64),
+        'spread': np.full(n, 5, dtype=np.int64),
+    }
+
+
+def test_resample_m5_ohlcv():
+    bars = resample(make_m1(), 'M5')
+    assert len(bars) == 4
+    assert bars.open.tolist() == [0, 5, 9, 14]
+    assert bars.close.tolist() == [4.5, 8.5, 13.5, 18.5]
+    assert bars.high.tolist() == [5, 9, 14, 19]
+    assert bars.tickvol.tolist() == [5, 4, 5, 5]
+
+
+def test_incremental_matches_batch():
+    m1 = make_m1()
+    inc = IncrementalResampler('M5')
+    done = []
+    for i in range(len(m1['time'])):
+        bar = inc.update(*(m1[f][i] for f in ['time', 'open', 'high', 'low', 'close', 'tickvol', 'volume', 'spread']))
+        if bar is not None:
+            done.append(bar)
+    done.append(inc.flush())
+    batch = resample(m1, 'M5')
+    assert [b['close'] for b in done] == batch.close.tolist()
+    assert [b['time'] for b in done] == batch.time.tolist()
+
+
+def test_bucket_bounds_match_filter():
+    rng = np.random.default_rng(4)
+    m1 = np.sort(rng.choice(np.arange(0, 3000), 1500, replace=False)) * 60 * 10**9
+    m15 = np.arange(-2, 210) * 15 * 60 * 10**9
+    starts, ends = bucket_bounds(m1, m15, 'M15')
+    for k, t in enumerate(m15):
+        rows = np.flatnonzero((m1 >= t) & (m1 < t + 15 * 60 * 10**9))
+        assert list(range(starts[k], ends[k])) == list(rows)
@@ -0,0 +1,69 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.smc_engine import StructureEngine
+from tradingbot.swings import swing_array
+
+
+def make_bars(n, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    high = close + rng.uniform(0, 0.8, n)
+    low = close - rng.uniform(0, 0.8, n)
+    time = np.datetime64('2025-10-06T00:00', 'ns') + np.arange(n) * np.timedelta64(15, 'm')
+    return time, high, low, close
+
+
+def batch_reference(time, high, low, close):
+    # the full recompute smc_chart_live used to do: swings, BOS/CHoCH, swing-based zones
+    swings = swing_array(time, high, low, 3, 3)
+    structure, zones = [], []
+    last_high = last_low = trend = None
+    for s in swings:
+        i, price = int(s['index']), float(s['price'])
+        if s['type'] == 'H':
+            if last_high is None:
+                last_high = price
+            elif price > last_high:
+                structure.append(('BOS_up', i))
+                if trend == 'down':
+                    structure.append(('CHoCH_up', i))
+                trend, last_high = 'up', price
+            if i + 2 < len(close) and close[i + 2] < low[i + 1]:
+                zones.append(('supply', i))
+        else:
+            if last_low is None:
+                last_low = price
+            elif price < last_low:
+                structure.append(('BOS_down', i))
+                if trend == 'up':
+                    structure.append(('CHoCH_down', i))
+                trend, last_low = 'down', price
+            if i + 2 < len(close) and close[i + 2] > high[i + 1]:
+                zones.append(('demand', i))
+    return swings, structure, zones
+
+
+def test_incremental_engine_matches_full_recompute():
+    time, high, low, close = make_bars(3000)
+    engine = StructureEngine(3, 3, max_zones=10_000)
+    events = []
+    for bar in zip(time, high, low, close):
+        events += engine.update(*bar)
+
+    swings, structure, zones = batch_reference(time, high, low, close)
+    assert [e.index for e in events if e.kind.startswith('swing')] == swings['index'].tolist()
+    assert [(e.kind, e.index) for e in events if e.kind[:3] in ('BOS', 'CHo')] == structure
+    assert sorted((e.zone['type'], e.index) for e in events if e.kind == 'zone') == sorted(zones)
+
+    # a zone is broken by the first close through it after it was reported
+    created = {e.zone['id']: n for n, e in enumerate(events) if e.kind == 'zone'}
+    for e in events:
+        if e.kind == 'zone_broken':
+            z = e.zone
+            assert (close[e.index] < z['low']) if z['type'] == 'demand' else (close[e.index] > z['high'])
+    active = set(engine.zones)
+    assert active == set(created) - {e.zone['id'] for e in events if e.kind == 'zone_broken'}
+    assert len(engine.bars) == 7
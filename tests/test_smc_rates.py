@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.smc_rates import break_of_structure, smc_zones
+
+RATE_DTYPE = [('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+              ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')]
+
+
+def reference_zones(rates):
+    # the loop copied across the live bots
+    highs = [r['high'] for r in rates]
+    lows = [r['low'] for r in rates]
+    closes = [r['close'] for r in rates]
+    opens = [r['open'] for r in rates]
+    signal = fvg_zone = lb_zone = ob_zone = None
+    for i in range(1, len(rates)-1):
+        if opens[i+1] > closes[i-1]:
+            fvg_zone = (closes[i-1], opens[i+1])
+        elif opens[i+1] < closes[i-1]:
+            fvg_zone = (opens[i+1], closes[i-1])
+    prev_high = max(highs[:-1])
+    prev_low = min(lows[:-1])
+    if rates[-1]['high'] > prev_high:
+        lb_zone, signal = (prev_high, rates[-1]['high']), "sell"
+    elif rates[-1]['low'] < prev_low:
+        lb_zone, signal = (rates[-1]['low'], prev_low), "buy"
+    for i in range(len(rates)-2, -1, -1):
+        if closes[i] < opens[i] and closes[i+1] > closes[i]:
+            ob_zone = (lows[i], highs[i])
+            signal = signal or "buy"
+            break
+        elif closes[i] > opens[i] and closes[i+1] < closes[i]:
+            ob_zone = (lows[i], highs[i])
+            signal = signal or "sell"
+            break
+    return signal, fvg_zone, lb_zone, ob_zone
+
+
+def test_smc_zones_match_bot_loop():
+    rng = np.random.default_rng(8)
+    for trial in range(300):
+        n = int(rng.integers(3, 40))
+        rates = np.zeros(n, dtype=RATE_DTYPE)
+        rates['open'] = np.round(rng.uniform(1, 2, n), 1)  # coarse prices give ties and flat candles
+        rates['close'] = np.round(rng.uniform(1, 2, n), 1)
+        rates['high'] = np.maximum(rates['open'], rates['close']) + np.round(rng.uniform(0, 0.3, n), 1)
+        rates['low'] = np.minimum(rates['open'], rates['close']) - np.round(rng.uniform(0, 0.3, n), 1)
+        assert smc_zones(rates) == reference_zones(rates)
+
+    rates['close'][-1] = rates['high'][:-1].max() + 0.1
+    assert break_of_structure(rates) == "buy"
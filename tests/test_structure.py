@@ -0,0 +1,31 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.structure import bos_choch
+from tradingbot.swings import swing_array
+
+
+def test_bos_choch_walks_swings_in_time_order():
+    rng = np.random.default_rng(12)
+    close = 100 + rng.normal(0, 1, 3000).cumsum()
+    high, low = close + rng.uniform(0, 0.8, 3000), close - rng.uniform(0, 0.8, 3000)
+    time = np.datetime64('2025-10-06T00:00', 'ns') + np.arange(3000) * np.timedelta64(15, 'm')
+    swings = swing_array(time, high, low, 2, 2)
+
+    ref, prev, trend = [], {}, None
+    for s in swings:
+        kind, price = str(s['type']), float(s['price'])
+        if kind in prev and (price > prev[kind] if kind == 'H' else price < prev[kind]):
+            direction = 'up' if kind == 'H' else 'down'
+            ref.append((int(s['index']), 'BOS_' + direction))
+            if trend is not None and trend != direction:
+                ref.append((int(s['index']), 'CHoCH_' + direction))
+            trend = direction
+        prev[kind] = price
+
+    events = bos_choch(swings)
+    assert [(int(e['index']), str(e['type'])) for e in events] == ref
+    assert (np.diff(events['time'].astype('int64')) >= 0).all()
+    assert len(bos_choch(swings[:1])) == 0
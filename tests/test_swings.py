@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.swings import swing_array, swing_points
+
+
+def reference_swings(high, low, lookback):
+    # the original smc_tools.find_swings loop
+    hs, ls = [], []
+    for i in range(lookback, len(high) - lookback):
+        if high[i] == max(high[i - lookback:i + lookback + 1]):
+            hs.append(i)
+        if low[i] == min(low[i - lookback:i + lookback + 1]):
+            ls.append(i)
+    return hs, ls
+
+
+def test_swing_points_match_loop():
+    rng = np.random.default_rng(3)
+    close = np.round(100 + rng.normal(0, 1, 2000).cumsum(), 1)  # rounding creates ties
+    high, low = close + 0.3, close - 0.3
+    for lookback in (1, 2, 5):
+        hi, lo = swing_points(high, low, lookback)
+        ref_hi, ref_lo = reference_swings(high, low, lookback)
+        assert hi.tolist() == ref_hi and lo.tolist() == ref_lo
+    assert [len(a) for a in swing_points(high[:4], low[:4], 2)] == [0, 0]
+
+
+def reference_pivots(high, low, left, right):
+    # the original tg_executor.detect_swings loop
+    out = []
+    for i in range(left, len(high) - right):
+        is_h = all(high[i] > high[i - j] for j in range(1, left + 1)) and \
+            all(high[i] > high[i + j] for j in range(1, right + 1))
+        is_l = all(low[i] < low[i - j] for j in range(1, left + 1)) and \
+            all(low[i] < low[i + j] for j in range(1, right + 1))
+        if is_h:
+            out.append((i, 'H', high[i]))
+        if is_l:
+            out.append((i, 'L', low[i]))
+    return out
+
+
+def test_swing_array_matches_strict_loop():
+    rng = np.random.default_rng(5)
+    close = np.round(100 + rng.normal(0, 1, 3000).cumsum(), 1)
+    high, low = close + rng.uniform(0, 1, 3000).round(1), close - rng.uniform(0, 1, 3000).round(1)
+    time = np.datetime64('2025-10-06T00:00', 'ns') + np.arange(3000) * np.timedelta64(15, 'm')
+    for left, right in ((3, 3), (1, 4), (5, 0)):
+        swings = swing_array(time, high, low, left, right)
+        got = [(int(s['index']), str(s['type']), float(s['price'])) for s in swings]
+        assert got == reference_pivots(high, low, left, right)
+        assert (swings['time'] == time[swings['index']]).all()
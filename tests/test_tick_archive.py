@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.tick_archive import TickRecorder, read_ticks, RECORD_DTYPE
+
+
+def make_ticks(start_ms, n, step_ms=500):
+    t = start_ms + np.arange(n, dtype=np.int64) * step_ms
+    bid = 3900 + np.arange(n) * 0.01
+    return {'time_msc': t, 'bid': bid, 'ask': bid + 0.2}
+
+
+def test_round_trip_with_overlap_rotation_and_restart(tmp_path):
+    day0 = np.datetime64('2025-10-06T23:59:00', 'ms').astype(np.int64)
+    ticks = make_ticks(day0, 400)  # crosses midnight
+    rec = TickRecorder(str(tmp_path), 'xauusd', 2)
+    assert rec.append({k: v[:250] for k, v in ticks.items()}) == 250
+    # overlapping poll after a restart only writes the new ticks
+    rec = TickRecorder(str(tmp_path), 'XAUUSD', 2)
+    assert rec.append({k: v[200:] for k, v in ticks.items()}) == 150
+
+    files = sorted(os.listdir(tmp_path / 'XAUUSD'))
+    assert files == ['2025-10-06.ticks', '2025-10-07.ticks']
+    size = sum(os.path.getsize(tmp_path / 'XAUUSD' / f) for f in files)
+    assert size == 2 * 32 + 400 * RECORD_DTYPE.itemsize
+
+    out = read_ticks(str(tmp_path), 'XAUUSD')
+    assert (out['time_msc'] == ticks['time_msc']).all()
+    assert np.allclose(out['ask'], ticks['ask'])
+
+    part = read_ticks(str(tmp_path), 'XAUUSD', '2025-10-07 00:00:00', '2025-10-07 00:00:10')
+    assert len(part['time_msc']) == 21
+
+
+def test_restart_poll_crossing_midnight_and_same_ms_ticks(tmp_path):
+    day0 = np.datetime64('2025-10-06T23:59:00', 'ms').astype(np.int64)
+    ticks = make_ticks(day0, 250)  # 120 ticks on day 1, 130 after midnight
+    TickRecorder(str(tmp_path), 'XAUUSD', 2).append(ticks)
+    # restart, then a poll that starts before midnight: nothing is new on either day
+    rec = TickRecorder(str(tmp_path), 'XAUUSD', 2)
+    assert rec.append({k: v[100:] for k, v in ticks.items()}) == 0
+    out = read_ticks(str(tmp_path), 'XAUUSD')
+    assert (out['time_msc'] == ticks['time_msc']).all()
+
+    # a real tick sharing the last millisecond is kept, a repeat is not
+    last = ticks['time_msc'][-1]
+    extra = {'time_msc': np.array([last, last, last + 5]),
+             'bid': np.array([ticks['bid'][-1], 3999.0, 3999.5]),
+             'ask': np.array([ticks['ask'][-1], 3999.2, 3999.7])}
+    assert TickRecorder(str(tmp_path), 'XAUUSD', 2).append(extra) == 2
+    out = read_ticks(str(tmp_path), 'XAUUSD')
+    assert list(out['time_msc'][-3:]) == [last, last, last + 5]
+    assert np.allclose(out['bid'][-2:], [3999.0, 3999.5])
+
+
+def test_header_only_file_is_restarted(tmp_path):
+    day0 = np.datetime64('2025-10-06T10:00:00', 'ms').astype(np.int64)
+    ticks = make_ticks(day0, 10)
+    path = tmp_path / 'XAUUSD' / '2025-10-06.ticks'
+    TickRecorder(str(tmp_path), 'XAUUSD', 2).append({k: v[:1] for k, v in ticks.items()})
+    path.write_bytes(path.read_bytes()[:32])      # header written, records lost
+
+    rec = TickRecorder(str(tmp_path), 'XAUUSD', 2)
+    assert rec.append({k: v[3:] for k, v in ticks.items()}) == 7
+    assert rec.append({k: v[5:] for k, v in ticks.items()}) == 0
+    out = read_ticks(str(tmp_path), 'XAUUSD')
+    assert (out['time_msc'] == ticks['time_msc'][3:]).all()
+    assert os.path.getsize(path) == 32 + 7 * RECORD_DTYPE.itemsize
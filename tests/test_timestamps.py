@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from tradingbot.timestamps import NAT, guess_format, locate, parse_date_time, parse_datetime
+
+
+def test_parse_formats_to_epoch_ns():
+    truth = pd.date_range('2025-10-06 01:00', periods=5, freq='37min').as_unit('ns').asi8
+
+    dotted = pd.to_datetime(truth).strftime('%Y.%m.%d %H:%M:%S').to_numpy()
+    assert guess_format(dotted[0]) == '%Y.%m.%d %H:%M:%S'
+    assert parse_datetime(dotted).tolist() == truth.tolist()
+
+    dashed = pd.to_datetime(truth).strftime('%Y-%m-%d %H:%M').to_numpy()
+    assert parse_datetime(dashed).tolist() == truth.tolist()
+
+    dates = pd.to_datetime(truth).strftime('%Y.%m.%d').to_numpy()
+    times = pd.to_datetime(truth).strftime(' %H:%M:%S').to_numpy()
+    times[3] = 'garbage'
+    out = parse_date_time(dates, times)
+    assert out[3] == NAT
+    assert np.delete(out, 3).tolist() == np.delete(truth, 3).tolist()
+
+
+def test_locate_is_integer_search():
+    t = pd.date_range('2025-10-06', periods=10, freq='min').as_unit('ns').asi8
+    assert locate(t, pd.Timestamp('2025-10-06 00:04')).tolist() == [4]
+    assert locate(t, [t[9], t[0] + 1]).tolist() == [9, -1]
+
+
+def test_split_columns_match_pandas():
+    truth = pd.date_range('2024-12-30 22:00', periods=3000, freq='7min').as_unit('ns').asi8
+    stamps = pd.to_datetime(truth)
+    assert parse_datetime(stamps.strftime('%Y.%m.%d %H:%M:%S').to_numpy()).tolist() == truth.tolist()
+
+    # dates out of order, a bad date and a bad time: runs are per row change, bad rows are NAT
+    order = np.r_[1500:3000, 0:1500]
+    dates = stamps.strftime('%Y.%m.%d').to_numpy()[order]
+    times = stamps.strftime('%H:%M:%S').to_numpy()[order]
+    dates[10], times[20] = '2025.13.01', '25:00:00'
+    out = parse_date_time(dates, times)
+    assert out[10] == NAT and out[20] == NAT
+    assert np.delete(out, [10, 20]).tolist() == np.delete(truth[order], [10, 20]).tolist()
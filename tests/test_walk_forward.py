@@ -0,0 +1,34 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from tradingbot.walk_forward import FeatureCache, WalkForwardOptimizer, simulate, WeekFeatures
+
+
+def make_week(seed, n=400):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, n))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-10-06 14:00', periods=n, freq='min'),
+        'open': close, 'high': close + 0.4, 'low': close - 0.4, 'close': close,
+        'tick_volume': rng.integers(50, 500, n), 'real_volume': 0,
+    })
+
+
+def test_features_built_once_per_week():
+    cache = FeatureCache({w: make_week(w) for w in range(1, 5)})
+    grid = [(1.5, 1.0, 0.0, 0.01, 20), (2.0, 1.0, 0.0, 0.01, 50)]
+    folds = WalkForwardOptimizer(cache, param_grid=grid).run()
+    assert cache.builds == 4
+    assert list(folds['test']) == [2, 3, 4]
+
+
+def test_simulate_outcomes_are_consistent():
+    feat = WeekFeatures(make_week(7))
+    params = {'TP_mult': 1.5, 'SL_mult': 1.0, 'ATR_min': 0.0, 'VWAP_tol': 0.01, 'T_stop': 20}
+    trades = simulate(feat, params)
+    assert set(trades['outcome']) <= {'TP', 'SL', 'TIMEOUT'}
+    assert (trades.loc[trades['outcome'] == 'TP', 'result_pips'] > 0).all()
+    assert (trades.loc[trades['outcome'] == 'TIMEOUT', 'result_pips'] == 0).all()
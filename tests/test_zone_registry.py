@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.zone_registry import ZoneRegistry
+
+
+def test_overlap_matches_scan():
+    rng = np.random.default_rng(11)
+    reg = ZoneRegistry(max_zones=10_000)
+    lows = np.round(rng.uniform(1.0, 2.0, 300), 2)
+    highs = lows + np.round(rng.uniform(0, 0.1, 300), 2)
+    for lo, hi in zip(lows, highs):
+        reg.add('EURUSD', lo, hi)
+    zones = list(reg.books['EURUSD'].zones.values())
+    for _ in range(300):
+        a, b = np.sort(np.round(rng.uniform(0.95, 2.15, 2), 2))
+        expected = [z['id'] for z in zones if max(a, z['low']) <= min(b, z['high'])]
+        assert [z['id'] for z in reg.overlapping('EURUSD', a, b)] == expected
+
+
+def test_lifecycle():
+    reg = ZoneRegistry(ttl=60, max_zones=3)
+    reg.mark_traded('EURUSD', 1.10, 1.11, 'buy', now=0)
+    assert reg.is_traded('EURUSD', 1.105, 1.12)
+    assert not reg.is_traded('GBPUSD', 1.105, 1.12)     # per symbol
+    assert not reg.is_traded('EURUSD', 1.111, 1.12)
+
+    # same zone re-detected is the same record
+    assert reg.add('EURUSD', 1.10, 1.11, 'buy', now=10)['state'] == 'traded'
+    assert len(reg) == 1
+
+    # price through a buy zone invalidates it; a sell zone above survives
+    reg.add('EURUSD', 1.20, 1.21, 'sell', now=20)
+    dropped = reg.update('EURUSD', price=1.09, now=30)
+    assert [(z['low'], z['state']) for z in dropped] == [(1.10, 'invalidated')]
+    assert not reg.is_traded('EURUSD', 1.10, 1.11)
+
+    # time expiry and the size cap: live zones are never evicted, expired ones make room
+    reg.add('EURUSD', 1.30, 1.31, 'sell', now=50)
+    assert [z['low'] for z in reg.update('EURUSD', now=85)] == [1.20]
+    reg.mark_traded('EURUSD', 14, 15, 'buy', now=90)
+    reg.add('EURUSD', 15, 16, now=90)
+    assert reg.add('EURUSD', 16, 17, now=100) is None
+    assert reg.mark_traded('EURUSD', 16, 17, now=100) is None
+    assert reg.is_traded('EURUSD', 14, 15) and len(reg) == 3
+    assert reg.add('EURUSD', 16, 17, now=120)['low'] == 16        # the 1.30 zone expired
+    assert [z['low'] for z in reg.overlapping('EURUSD', 0, 30)] == [14, 15, 16]
+
+
+def test_count_matches_scan_across_states():
+    rng = np.random.default_rng(12)
+    reg = ZoneRegistry(max_zones=10_000)
+    for k in range(400):
+        lo = round(rng.uniform(1.0, 2.0), 2)
+        hi = lo + round(rng.uniform(0, 0.1), 2)
+        (reg.mark_traded if k % 3 == 0 else reg.add)('EURUSD', lo, hi, 'buy')
+    zones = list(reg.books['EURUSD'].zones.values())
+    for _ in range(300):
+        a, b = np.sort(np.round(rng.uniform(0.95, 2.15, 2), 2))
+        traded = [z for z in zones if z['state'] == 'traded' and max(a, z['low']) <= min(b, z['high'])]
+        assert reg.count('EURUSD', a, b) == len(traded)
+        assert reg.is_traded('EURUSD', a, b) == bool(traded)
+        assert reg.overlapping('EURUSD', a, b, 'traded') == traded
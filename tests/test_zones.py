@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tradingbot.zones import FvgStream, fvg_zones, order_block_zones, supply_demand_zones
+
+
+def make_bars(n, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    high = close + rng.uniform(0, 0.6, n)
+    low = close - rng.uniform(0, 0.6, n)
+    time = np.datetime64('2025-10-06T00:00', 'ns') + np.arange(n) * np.timedelta64(15, 'm')
+    return time, high, low
+
+
+def test_fvg_kernel_and_stream_match_loop():
+    time, high, low = make_bars(1500)
+    ref = []
+    for i in range(2, len(high)):
+        if low[i] > high[i - 2]:
+            ref.append((i - 2, i, 'bull', high[i - 2], low[i]))
+        if high[i] < low[i - 2]:
+            ref.append((i - 2, i, 'bear', high[i], low[i - 2]))
+
+    zones = fvg_zones(time, high, low)
+    assert [(z['start'], z['end'], z['type'], z['low'], z['high']) for z in zones] == ref
+    assert (zones['end_time'] == time[zones['end']]).all()
+
+    stream = FvgStream()
+    streamed = [z for z in (stream.update(t, h, l) for t, h, l in zip(time, high, low)) if z is not None]
+    assert np.array(streamed, dtype=zones.dtype).tolist() == zones.tolist()
+
+
+def test_supply_demand_breaks_only_after_formation():
+    time, high, low = make_bars(2000, seed=4)
+    close = (high + low) / 2
+    zones = supply_demand_zones(time, high, low, close, impulse_factor=0.8)
+    assert len(zones) > 10 and zones['valid'].any() and (~zones['valid']).any()
+    for z in zones:
+        later = close[z['index'] + 1:]
+        crossed = later < z['low'] if z['type'] == 'demand' else later > z['high']
+        first = np.flatnonzero(crossed)
+        assert z['broken'] == (z['index'] + 1 + first[0] if len(first) else -1)
+        assert z['valid'] == (len(first) == 0)
+
+
+def test_order_blocks_match_loop():
+    time, high, low = make_bars(1200, seed=9)
+    rng = np.random.default_rng(9)
+    open_ = low + (high - low) * rng.uniform(0, 1, len(high))
+    close = low + (high - low) * rng.uniform(0, 1, len(high))
+    move = (high - low).mean() * 0.5
+    ref = []
+    for i in range(1, len(high) - 8):
+        if close[i] < open_[i] and high[i + 1:i + 9].max() > high[i] + move:
+            ref.append((i, 'bull'))
+        if close[i] > open_[i] and low[i + 1:i + 9].min() < low[i] - move:
+            ref.append((i, 'bear'))
+    obs = order_block_zones(time, open_, high, low, close, lookahead=8)
+    assert [(z['index'], z['type']) for z in obs] == ref
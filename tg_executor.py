@@ -11,6 +11,11 @@ from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 
+from tradingbot.intervals import IntervalIndex
+from tradingbot.swings import swing_array
+from tradingbot.timestamps import locate, to_epoch_ns
+from tradingbot.zones import fvg_zones, order_block_zones
+
 try:
     import MetaTrader5 as mt5
     MT5_PRESENT = True
@@ -71,55 +76,23 @@ def fetch_mt5_rates(symbol, timeframe, bars):
 # SMC helpers (simple heuristics)
 # -------------------------
 def detect_swings(df, left=3, right=3):
-    highs = df['high'].values
-    lows = df['low'].values
-    swings = []
-    n = len(df)
-    for i in range(left, n-right):
-        is_h = True
-        is_l = True
-        for j in range(1, left+1):
-            if highs[i] <= highs[i-j]: is_h = False
-            if lows[i] >= lows[i-j]: is_l = False
-        for j in range(1, right+1):
-            if highs[i] <= highs[i+j]: is_h = False
-            if lows[i] >= lows[i+j]: is_l = False
-        if is_h: swings.append({'index': i, 'time': df['time'].iloc[i], 'type': 'H', 'price': highs[i]})
-        if is_l: swings.append({'index': i, 'time': df['time'].iloc[i], 'type': 'L', 'price': lows[i]})
-    return swings
+    """Strict pivot highs/lows as a structured array (index, time, type, price)."""
+    return swing_array(df['time'].to_numpy(), df['high'].to_numpy(), df['low'].to_numpy(), left, right)
 
 def detect_order_blocks_and_fvgs(df):
     """
     Heuristic detection:
     - Order block candidate: candle that has a strong subsequent move in opposite direction
     - FVG (3-candle gap) detection as in SMC
-    Returns lists: ob_zones, fvg_zones where zone is dict with low/high/start_time
+    Returns ob_zones (ZONE_DTYPE array) and fvg_zones (FVG_DTYPE array)
     """
-    obs = []
-    fvgs = []
     n = len(df)
-    for i in range(2, n-1):
-        c1 = df.iloc[i-2]; c2 = df.iloc[i-1]; c3 = df.iloc[i]
-        # FVG bullish
-        if c3['low'] > c1['high']:
-            fvgs.append({'type': 'bull', 'start': c1['time'], 'end': c3['time'], 'low': c1['high'], 'high': c3['low']})
-        # FVG bearish
-        if c3['high'] < c1['low']:
-            fvgs.append({'type': 'bear', 'start': c1['time'], 'end': c3['time'], 'low': c3['high'], 'high': c1['low']})
-    # simple OB detection: find candles where next N bars move substantially
-    lookahead = 8
-    avg_range = (df['high'] - df['low']).mean()
-    for i in range(1, n-lookahead):
-        base_h = df['high'].iloc[i]
-        base_l = df['low'].iloc[i]
-        future_max = df['high'].iloc[i+1:i+1+lookahead].max()
-        future_min = df['low'].iloc[i+1:i+1+lookahead].min()
-        # Bullish OB candidate (bearish candle then strong rally)
-        if df['close'].iloc[i] < df['open'].iloc[i] and future_max > base_h + avg_range*0.5:
-            obs.append({'type': 'bull', 'time': df['time'].iloc[i], 'low': base_l, 'high': base_h})
-        # Bearish OB candidate (bullish candle then strong drop)
-        if df['close'].iloc[i] > df['open'].iloc[i] and future_min < base_l - avg_range*0.5:
-            obs.append({'type': 'bear', 'time': df['time'].iloc[i], 'low': base_l, 'high': base_h})
+    # FVG: 3-candle gaps; gaps completed by the last (possibly still forming) bar are skipped
+    fvgs = fvg_zones(df['time'].to_numpy(), df['high'].to_numpy(), df['low'].to_numpy())
+    fvgs = fvgs[fvgs['end'] < n-1]
+    # OB: candles where the next `lookahead` bars move substantially the other way
+    obs = order_block_zones(df['time'].to_numpy(), df['open'].to_numpy(), df['high'].to_numpy(),
+                            df['low'].to_numpy(), df['close'].to_numpy(), lookahead=8, move_factor=0.5)
     return obs, fvgs
 
 # -------------------------
@@ -147,10 +120,10 @@ def find_entries_1m(higher_df, entry_df):
     obs, fvgs = detect_order_blocks_and_fvgs(higher_df)
     all_zones = []
     for o in obs:
-        all_zones.append({'type': 'OB_'+o['type'], 'low': o['low'], 'high': o['high'], 'time': o['time']})
+        all_zones.append({'type': 'OB_'+o['type'], 'low': o['low'], 'high': o['high'], 'time': pd.Timestamp(o['time'])})
     for f in fvgs:
         tag = 'FVG_bull' if f['type']=='bull' else 'FVG_bear'
-        all_zones.append({'type': tag, 'low': f['low'], 'high': f['high'], 'time': f['start']})
+        all_zones.append({'type': tag, 'low': f['low'], 'high': f['high'], 'time': pd.Timestamp(f['start_time'])})
 
     all_zones = filter_zones(all_zones)
 
@@ -159,26 +132,29 @@ def find_entries_1m(higher_df, entry_df):
     trend = 'bull' if closes[-1] > closes[-10] else 'bear'
 
     signals = []
-    # iterate entry candles; when price enters zone, check confirmation candle
-    for i in range(2, len(entry_df)):
-        close = entry_df['close'].iloc[i]
-        t = entry_df['time'].iloc[i]
-        prev_c = entry_df.iloc[i-1]
-        # check zones
-        for z in all_zones:
-            if z['low'] <= close <= z['high']:
-                # require bias match: if zone is bullish FVG or OB_bull expect buy when higher TF is bull
-                want_buy = ('bull' in z['type'] and trend=='bull')
-                want_sell = ('bear' in z['type'] and trend=='bear')
-                # confirmation: current candle close > previous high for buy, or < prev low for sell
-                if want_buy and close > prev_c['high']:
-                    sl = z['low'] - pips_to_price(BUFFER_PIPS)
-                    tp = close + (close - sl) * RR
-                    signals.append({'side':'buy','time':t,'price':close,'sl':sl,'tp':tp,'zone':z})
-                if want_sell and close < prev_c['low']:
-                    sl = z['high'] + pips_to_price(BUFFER_PIPS)
-                    tp = close - (sl - close) * RR
-                    signals.append({'side':'sell','time':t,'price':close,'sl':sl,'tp':tp,'zone':z})
+    if not all_zones or len(entry_df) < 3:
+        return signals
+    # every (bar, zone) pair where the close sits inside the zone, via binary search
+    index = IntervalIndex([z['low'] for z in all_zones], [z['high'] for z in all_zones])
+    bullish = np.array(['bull' in z['type'] for z in all_zones])
+    close = entry_df['close'].to_numpy()
+    high = entry_df['high'].to_numpy()
+    low = entry_df['low'].to_numpy()
+    times = entry_df['time'].to_numpy()
+    rows, ids = index.query_batch(close[2:])
+    rows += 2
+    # bias match + confirmation: close beyond the previous candle's high (buy) or low (sell)
+    buy = bullish[ids] & (trend == 'bull') & (close[rows] > high[rows-1])
+    sell = ~bullish[ids] & (trend == 'bear') & (close[rows] < low[rows-1])
+    for i, k, is_buy in zip(rows[buy | sell], ids[buy | sell], buy[buy | sell]):
+        z = all_zones[k]
+        c = close[i]
+        if is_buy:
+            sl = z['low'] - pips_to_price(BUFFER_PIPS)
+            signals.append({'side':'buy','time':pd.Timestamp(times[i]),'price':c,'sl':sl,'tp':c + (c - sl) * RR,'zone':z})
+        else:
+            sl = z['high'] + pips_to_price(BUFFER_PIPS)
+            signals.append({'side':'sell','time':pd.Timestamp(times[i]),'price':c,'sl':sl,'tp':c - (sl - c) * RR,'zone':z})
     return signals
 
 # -------------------------
@@ -187,9 +163,14 @@ def find_entries_1m(higher_df, entry_df):
 def backtest_on_data(higher_df, entry_df):
     signals = find_entries_1m(higher_df, entry_df)
     trades = []
-    for s in signals:
+    # signal times come from entry_df, so each lookup is a binary search
+    # on the int64 time column instead of a full boolean scan
+    entry_rows = locate(to_epoch_ns(entry_df['time']), [s['time'] for s in signals]) if signals else []
+    for s, entry_index in zip(signals, entry_rows):
+        if entry_index < 0:
+            # locate() needs entry_df sorted by time; never rescan from row 0
+            raise ValueError(f"Signal time {s['time']} not found in entry_df (is it sorted by time?)")
         # simulate execution at s['price']; then scan future candles to see SL/TP
-        entry_index = entry_df[entry_df['time'] == s['time']].index[0]
         for j in range(entry_index+1, len(entry_df)):
             hi = entry_df['high'].iloc[j]; lo = entry_df['low'].iloc[j]
             if s['side']=='buy':
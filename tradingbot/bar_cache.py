@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .mt5_csv import read_mt5_csv
+
+# ==========================
+# Memory-mapped sidecar cache for bar CSVs
+# ==========================
+# The first load of a CSV parses it with read_mt5_csv and writes one .npy
+# file per column into a sidecar directory. Later loads memory-map those
+# files, so the time and OHLCV columns are available without parsing or
+# copying. The sidecar records the source path, size and mtime; if the CSV
+# changes, the sidecar is rebuilt on the next load.
+
+CACHE_DIR = ".bar_cache"
+CACHE_VERSION = 1
+
+# Column name -> on-disk dtype. `time` is int64 epoch nanoseconds.
+CACHE_COLUMNS = {
+    'time': 'int64',
+    'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64',
+    'tickvol': 'int64', 'volume': 'int64', 'spread': 'int64',
+}
+
+
+class Bars:
+    """Column arrays for one bar file (memory-mapped when loaded from a sidecar)."""
+
+    def __init__(self, columns: dict, source: str = None):
+        self.columns = columns
+        self.source = source
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.columns['time'])
+
+    def frame(self) -> pd.DataFrame:
+        """Copy into a DataFrame with a datetime64 `timestamp` column."""
+        data = {'timestamp': self.columns['time'].view('datetime64[ns]')}
+        data.update({k: v for k, v in self.columns.items() if k != 'time'})
+        return pd.DataFrame(data)
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _source_key(path: str) -> dict:
+    st = os.stat(path)
+    return {'version': CACHE_VERSION, 'source': os.path.abspath(path),
+            'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def sidecar_path(path: str, cache_dir: str = None) -> str:
+    """Sidecar directory for `path`; defaults to a .bar_cache folder next to it."""
+    src = os.path.abspath(path)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(src), CACHE_DIR)
+    digest = hashlib.sha1(src.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{os.path.basename(src)}.{digest}")
+
+
+def is_fresh(path: str, cache_dir: str = None) -> bool:
+    meta_file = os.path.join(sidecar_path(path, cache_dir), 'meta.json')
+    if not os.path.exists(meta_file):
+        return False
+    with open(meta_file) as f:
+        meta = json.load(f)
+    return meta.get('key') == _source_key(path)
+
+
+def build_sidecar(path: str, cache_dir: str = None, df: pd.DataFrame = None) -> str:
+    """Parse `path` (unless `df` is given) and write its sidecar atomically."""
+    key = _source_key(path)
+    if df is None:
+        df = read_mt5_csv(path)
+    target = sidecar_path(path, cache_dir)
+    parent = os.path.dirname(target)
+    os.makedirs(parent, exist_ok=True)
+
+    tmp = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+    os.chmod(tmp, 0o777 & ~_umask())  # mkdtemp creates 0700
+    try:
+        stamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        arrays = {'time': stamps.view('int64')}
+        for col in CACHE_COLUMNS:
+            if col != 'time':
+                arrays[col] = df[col].to_numpy(dtype=CACHE_COLUMNS[col])
+        for col, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{col}.npy"), np.ascontiguousarray(arr))
+        with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+            json.dump({'key': key, 'rows': len(df), 'columns': list(arrays)}, f)
+        # Move the old sidecar aside and swap the new one in before deleting
+        # anything: on Windows the old files cannot be removed while a reader
+        # still has them memory-mapped.
+        if os.path.exists(target):
+            old = tempfile.mkdtemp(prefix='.old-', dir=parent)
+            os.replace(target, os.path.join(old, 'sidecar'))
+        os.replace(tmp, target)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    # best effort: this build's old sidecar and any an earlier build could not delete
+    for name in os.listdir(parent):
+        if name.startswith('.old-'):
+            shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+    return target
+
+
+def load_bars(path: str, cache_dir: str = None) -> Bars:
+    """Return memory-mapped bar columns for `path`, building the sidecar if stale."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+    if not is_fresh(path, cache_dir):
+        build_sidecar(path, cache_dir)
+    target = sidecar_path(path, cache_dir)
+    columns = {col: np.load(os.path.join(target, f"{col}.npy"), mmap_mode='r') for col in CACHE_COLUMNS}
+    return Bars(columns, source=path)
+
+
+def read_bars_cached(path: str, cache_dir: str = None) -> pd.DataFrame:
+    """DataFrame convenience wrapper around load_bars."""
+    return load_bars(path, cache_dir).frame()
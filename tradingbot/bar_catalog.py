@@ -0,0 +1,133 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from .bar_cache import CACHE_COLUMNS, Bars, load_bars
+
+# ==========================
+# Unified bar catalog
+# ==========================
+# Indexes the bar files in the repo by symbol, timeframe and time range.
+# read_bars() opens only the files that overlap the requested range (through
+# the memory-mapped sidecar cache), slices each one with a binary search,
+# merges them, and drops duplicate bars. When files overlap, the bar from the
+# file registered first wins.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (symbol, timeframe, glob relative to the repo root), highest priority first
+DEFAULT_SOURCES = [
+    ('USTEC', 'M1', 'USTEC_candles.csv'),
+    ('USTEC', 'M1', 'USTEC_week2_candles.csv'),
+    ('USTEC', 'M1', 'USTEC_Week*_data.csv'),
+    ('XAUUSD', 'M1', 'XAUUSD_1min.csv'),
+    ('XAUUSD', 'M1', 'TradingBacktest/XAUUSD_M1.csv'),
+    ('XAUUSD', 'M15', 'TradingBacktest/XAUUSD_M15.csv'),
+]
+
+
+def _to_ns(value, default):
+    if value is None:
+        return default
+    return pd.Timestamp(value).as_unit('ns').value
+
+
+class CatalogEntry:
+    def __init__(self, symbol, timeframe, path, start_ns, end_ns, rows):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.path = path
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.rows = rows
+
+    def overlaps(self, start_ns, end_ns):
+        return self.start_ns <= end_ns and self.end_ns >= start_ns
+
+    def __repr__(self):
+        start = pd.Timestamp(self.start_ns)
+        end = pd.Timestamp(self.end_ns)
+        return f"CatalogEntry({self.symbol} {self.timeframe} {self.path} {start} → {end}, {self.rows} rows)"
+
+
+class BarCatalog:
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir
+        self.entries = []
+
+    @classmethod
+    def from_folder(cls, root: str = REPO_ROOT, sources=DEFAULT_SOURCES, cache_dir: str = None):
+        catalog = cls(cache_dir)
+        for symbol, timeframe, pattern in sources:
+            for path in sorted(glob.glob(os.path.join(root, pattern))):
+                catalog.add(path, symbol, timeframe)
+        return catalog
+
+    def add(self, path: str, symbol: str, timeframe: str) -> CatalogEntry:
+        bars = load_bars(path, self.cache_dir)
+        if len(bars) == 0:
+            return None
+        entry = CatalogEntry(symbol.upper(), timeframe.upper(), path,
+                             int(bars.time[0]), int(bars.time[-1]), len(bars))
+        self.entries.append(entry)
+        return entry
+
+    def find(self, symbol: str, timeframe: str, start=None, end=None) -> list:
+        """Entries for symbol/timeframe that overlap [start, end], in priority order."""
+        start_ns = _to_ns(start, np.iinfo(np.int64).min)
+        end_ns = _to_ns(end, np.iinfo(np.int64).max)
+        return [e for e in self.entries
+                if e.symbol == symbol.upper() and e.timeframe == timeframe.upper()
+                and e.overlaps(start_ns, end_ns)]
+
+    def symbols(self) -> pd.DataFrame:
+        rows = [{'symbol': e.symbol, 'timeframe': e.timeframe, 'path': e.path,
+                 'start': pd.Timestamp(e.start_ns), 'end': pd.Timestamp(e.end_ns), 'rows': e.rows}
+                for e in self.entries]
+        return pd.DataFrame(rows)
+
+    def read_bars(self, symbol: str, timeframe: str, start=None, end=None) -> Bars:
+        """Sorted, de-duplicated bars for symbol/timeframe in [start, end]."""
+        start_ns = _to_ns(start, np.iinfo(np.int64).min)
+        end_ns = _to_ns(end, np.iinfo(np.int64).max)
+
+        parts = []
+        for entry in self.find(symbol, timeframe, start, end):
+            bars = load_bars(entry.path, self.cache_dir)
+            lo = np.searchsorted(bars.time, start_ns, side='left')
+            hi = np.searchsorted(bars.time, end_ns, side='right')
+            if hi > lo:
+                parts.append({col: bars[col][lo:hi] for col in CACHE_COLUMNS})
+        if not parts:
+            return Bars({col: np.empty(0, dtype=dt) for col, dt in CACHE_COLUMNS.items()})
+        if len(parts) == 1:
+            return Bars({col: np.array(arr) for col, arr in parts[0].items()})
+
+        merged = {col: np.concatenate([p[col] for p in parts]) for col in CACHE_COLUMNS}
+        # Stable sort keeps higher-priority files first among equal timestamps,
+        # so np.unique's first index picks the bar from the preferred file.
+        order = np.argsort(merged['time'], kind='stable')
+        _, first = np.unique(merged['time'][order], return_index=True)
+        keep = order[first]
+        return Bars({col: arr[keep] for col, arr in merged.items()})
+
+
+_default_catalog = None
+
+
+def default_catalog() -> BarCatalog:
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = BarCatalog.from_folder()
+    return _default_catalog
+
+
+def read_bars(symbol: str, timeframe: str, start=None, end=None) -> Bars:
+    """read_bars on the repo's default catalog of bar files."""
+    return default_catalog().read_bars(symbol, timeframe, start, end)
+
+
+if __name__ == "__main__":
+    print(default_catalog().symbols().to_string(index=False))
@@ -0,0 +1,112 @@
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from .bar_stream import tail_bars
+from .mt5_csv import sniff
+from .resample import period_ns
+from .timestamps import NAT, parse_date_time, parse_datetime
+
+# ==========================
+# Incremental MT5 bar export
+# ==========================
+# Each (symbol, timeframe) has one CSV in the pandas layout written by our
+# export scripts (time,open,high,low,close,tick_volume,spread,real_volume).
+# A run reads only the last line of each file, asks the terminal for bars
+# from that bar onwards, drops the boundary bar it already has, and appends
+# the rest in one write. When the request runs up to now, the newest bar is
+# normally still forming, so it is held back until a later run sees it
+# closed; a request with an explicit `end` in the past keeps every bar.
+
+RATE_FIELDS = ['time', 'open', 'high', 'low', 'close', 'tick_volume', 'spread', 'real_volume']
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+TAIL_BYTES = 4096
+
+
+def last_bar_time(path: str):
+    """Open time (int64 ns) of the last bar stored in `path`, or None."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    fmt = sniff(path)
+    if not fmt.encoding.startswith('utf-8'):
+        last = tail_bars(path, 1, fmt=fmt)
+        return int(last['timestamp'].iloc[0].value) if len(last) else None
+
+    # Only the final line is needed: read the end of the file
+    with open(path, 'rb') as f:
+        f.seek(max(0, os.path.getsize(path) - TAIL_BYTES))
+        lines = [ln for ln in f.read().decode(fmt.encoding, errors='ignore').splitlines() if ln.strip()]
+    fields = [s.strip() for s in lines[-1].split(fmt.sep)]
+    if not fields[0][:1].isdigit():
+        return None  # header only
+    if fmt.split_datetime:
+        stamp = parse_date_time([fields[0]], [fields[1]], fmt.datetime_format.split(' ')[0])[0]
+    else:
+        stamp = parse_datetime([fields[0]], fmt.datetime_format)[0]
+    return None if stamp == NAT else int(stamp)
+
+
+def _header(path: str) -> list:
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return [s.strip() for s in f.readline().split(',')]
+
+
+def append_rates(path: str, rates, after_ns=None, drop_forming: bool = True) -> int:
+    """Append MT5 rates newer than `after_ns` to `path` in one write.
+
+    `rates` is the structured array from copy_rates_*. Bars at or before
+    `after_ns` (the boundary bar) are dropped, as is the newest bar when
+    `drop_forming` is set. Returns the number of bars written.
+    """
+    if rates is None or len(rates) == 0:
+        return 0
+    times = np.asarray(rates['time'], dtype=np.int64) * 10**9
+    keep = np.ones(len(rates), dtype=bool) if after_ns is None else times > after_ns
+    if drop_forming:
+        keep[-1] = False
+    if not keep.any():
+        return 0
+
+    df = pd.DataFrame({f: rates[f][keep] for f in RATE_FIELDS})
+    df['time'] = times[keep].view('datetime64[ns]')
+    exists = os.path.exists(path) and os.path.getsize(path) > 0
+    if exists:
+        header = _header(path)
+        if sorted(header) != sorted(RATE_FIELDS):
+            raise ValueError(f"{path} is not a pandas-layout rate export: {header}")
+        df = df[header]
+    df.to_csv(path, mode='a' if exists else 'w', header=not exists, index=False, date_format=TIME_FORMAT)
+    return int(keep.sum())
+
+
+def _utc(time_ns: int) -> datetime:
+    return datetime.fromtimestamp(time_ns / 10**9, tz=timezone.utc)
+
+
+def export_incremental(terminal, symbol: str, timeframe: str, path: str, start, end=None,
+                       drop_forming: bool = True) -> int:
+    """Bring `path` up to date with `symbol` bars from an MT5 terminal.
+
+    `terminal` is the MetaTrader5 module (anything with copy_rates_range
+    and TIMEFRAME_* constants). An empty or missing file is filled from
+    `start`; otherwise only bars after the last stored one are requested.
+    `drop_forming` only applies when the range reaches the present (`end`
+    is None or in the future).
+    """
+    last = last_bar_time(path)
+    first = pd.Timestamp(start).as_unit('ns').value if last is None else last
+    now = pd.Timestamp.now(tz='UTC').as_unit('ns').value
+    stop = now + period_ns(timeframe) if end is None else pd.Timestamp(end).as_unit('ns').value
+    tf = getattr(terminal, f"TIMEFRAME_{timeframe.upper()}")
+    rates = terminal.copy_rates_range(symbol, tf, _utc(first), _utc(stop))
+    return append_rates(path, rates, after_ns=last, drop_forming=drop_forming and stop > now)
+
+
+def export_all(terminal, exports, start, end=None, drop_forming: bool = True) -> dict:
+    """Run export_incremental for every (symbol, timeframe, path) in one session; {path: bars written}."""
+    return {
+        path: export_incremental(terminal, symbol, timeframe, path, start, end, drop_forming)
+        for symbol, timeframe, path in exports
+    }
@@ -0,0 +1,119 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .bar_cache import is_fresh, load_bars, sidecar_path
+
+# ==========================
+# Day / session / gap index for bar datasets
+# ==========================
+# Built once from the sorted time column and stored next to the bar
+# sidecar. After that, "day X", "all 14:00-18:00 sessions" and "where is the
+# next gap" are offset lookups instead of timestamp scans.
+
+DAY_NS = 86_400 * 10**9
+MINUTE_NS = 60 * 10**9
+DEFAULT_GAP_MINUTES = 5
+
+
+def _clock_ns(value) -> int:
+    t = pd.Timedelta(value + ':00' if value.count(':') == 1 else value)
+    return int(t.value)
+
+
+class BarIndex:
+    """Row offsets of day boundaries and gaps in a sorted int64-ns time column."""
+
+    def __init__(self, time_ns, gap_minutes: int = DEFAULT_GAP_MINUTES):
+        self.time = np.asarray(time_ns, dtype=np.int64)
+        self.gap_minutes = gap_minutes
+        n = len(self.time)
+
+        day = self.time // DAY_NS
+        starts = np.flatnonzero(np.concatenate(([True], day[1:] != day[:-1]))) if n else np.empty(0, np.int64)
+        self.day_starts = day[starts] * DAY_NS if n else np.empty(0, np.int64)
+        self.day_offsets = np.append(starts, n).astype(np.int64)
+
+        # gap_rows[k] is the first row after a hole longer than gap_minutes
+        step = np.diff(self.time)
+        self.gap_rows = np.flatnonzero(step > gap_minutes * MINUTE_NS).astype(np.int64) + 1
+        self.gap_minutes_before = step[self.gap_rows - 1] // MINUTE_NS
+
+    def __len__(self):
+        return len(self.time)
+
+    # ---- days ----
+    def dates(self) -> list:
+        return [pd.Timestamp(d).date() for d in self.day_starts]
+
+    def day(self, date) -> slice:
+        """Row slice of calendar day `date` (empty slice if absent)."""
+        key = pd.Timestamp(date).normalize().as_unit('ns').value
+        k = np.searchsorted(self.day_starts, key)
+        if k == len(self.day_starts) or self.day_starts[k] != key:
+            return slice(0, 0)
+        return slice(int(self.day_offsets[k]), int(self.day_offsets[k + 1]))
+
+    # ---- sessions ----
+    def session_offsets(self, start: str, end: str) -> np.ndarray:
+        """(days, 2) array of [first, stop) rows for bars in [start, end) each day."""
+        lo = self.day_starts + _clock_ns(start)
+        hi = self.day_starts + _clock_ns(end)
+        return np.stack([np.searchsorted(self.time, lo), np.searchsorted(self.time, hi)], axis=1)
+
+    def sessions(self, start: str, end: str) -> list:
+        """Row slices of every non-empty [start, end) session."""
+        return [slice(int(a), int(b)) for a, b in self.session_offsets(start, end) if b > a]
+
+    def session_mask(self, start: str, end: str) -> np.ndarray:
+        mask = np.zeros(len(self.time), dtype=bool)
+        for s in self.sessions(start, end):
+            mask[s] = True
+        return mask
+
+    # ---- gaps ----
+    def next_gap(self, rows) -> np.ndarray:
+        """First gap row strictly after each row (len(self) when none).
+
+        A look-ahead window starting after `row` that must not run across a
+        weekend or session break ends just before this row.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        k = np.searchsorted(self.gap_rows, rows, side='right')
+        return np.append(self.gap_rows, len(self.time))[k]
+
+    def gaps(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            'row': self.gap_rows,
+            'after': pd.to_datetime(self.time[self.gap_rows - 1]),
+            'before': pd.to_datetime(self.time[self.gap_rows]),
+            'minutes': self.gap_minutes_before,
+        })
+
+    # ---- persistence ----
+    def save(self, path: str):
+        np.savez(path, gap_minutes=self.gap_minutes,
+                 day_starts=self.day_starts, day_offsets=self.day_offsets,
+                 gap_rows=self.gap_rows, gap_minutes_before=self.gap_minutes_before)
+
+    @classmethod
+    def load(cls, path: str, time_ns):
+        data = np.load(path)
+        index = cls.__new__(cls)
+        index.time = np.asarray(time_ns, dtype=np.int64)
+        index.gap_minutes = int(data['gap_minutes'])
+        for name in ('day_starts', 'day_offsets', 'gap_rows', 'gap_minutes_before'):
+            setattr(index, name, data[name])
+        return index
+
+
+def index_for_file(path: str, gap_minutes: int = DEFAULT_GAP_MINUTES, cache_dir: str = None) -> BarIndex:
+    """BarIndex for a bar CSV, stored with (and invalidated by) its sidecar."""
+    bars = load_bars(path, cache_dir)
+    target = os.path.join(sidecar_path(path, cache_dir), f"index_gap{gap_minutes}.npz")
+    if os.path.exists(target) and is_fresh(path, cache_dir):
+        return BarIndex.load(target, bars.time)
+    index = BarIndex(bars.time, gap_minutes)
+    index.save(target)
+    return index
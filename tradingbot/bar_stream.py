@@ -0,0 +1,93 @@
+import os
+from collections import deque
+
+import pandas as pd
+
+from .mt5_csv import csv_options, normalise_bars, sniff
+
+# ==========================
+# Chunked streaming bar reader
+# ==========================
+# Reads a bar CSV in fixed-size row chunks and yields either those chunks
+# or whole calendar days, keeping only one chunk (plus a partial day) in
+# memory. Chunks entirely before `start` are dropped as soon as their
+# timestamps are parsed, and reading stops at the first chunk past `end`,
+# so the file is assumed to be in chronological order (as MT5 writes it).
+
+CHUNK_ROWS = 100_000
+
+
+def _to_ts(value):
+    return None if value is None else pd.Timestamp(value)
+
+
+def _iter_chunks(path, start, end, rows, fmt):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+    fmt = fmt or sniff(path)
+    with pd.read_csv(path, chunksize=rows, engine='c', **csv_options(fmt)) as reader:
+        for raw in reader:
+            df = normalise_bars(raw, fmt)
+            if df.empty:
+                continue
+            ts = df['timestamp']
+            if start is not None and ts.iloc[-1] < start:
+                continue
+            if end is not None and ts.iloc[0] > end:
+                break
+            if start is not None and ts.iloc[0] < start:
+                df = df[ts >= start]
+            if end is not None and ts.iloc[-1] > end:
+                df = df[df['timestamp'] <= end]
+            if not df.empty:
+                yield df.reset_index(drop=True)
+
+
+def iter_bars(path: str, chunk='day', start=None, end=None, rows: int = CHUNK_ROWS, fmt=None):
+    """Yield bars from `path` between `start` and `end` (inclusive).
+
+    chunk='day' yields one frame per calendar day; an integer yields frames
+    of at most that many rows. `rows` is the read size used for day chunks.
+    """
+    start, end = _to_ts(start), _to_ts(end)
+    if chunk != 'day':
+        yield from _iter_chunks(path, start, end, int(chunk), fmt)
+        return
+
+    pending = None
+    for df in _iter_chunks(path, start, end, rows, fmt):
+        if pending is not None:
+            df = pd.concat([pending, df], ignore_index=True)
+        days = df['timestamp'].dt.normalize()
+        # Everything up to the last day in this chunk is complete
+        last_day = days.iloc[-1]
+        done = days < last_day
+        if done.any():
+            for _, day_df in df[done].groupby(days[done], sort=False):
+                yield day_df.reset_index(drop=True)
+        pending = df[~done].reset_index(drop=True)
+    if pending is not None and not pending.empty:
+        yield pending
+
+
+def read_range(path: str, start=None, end=None, rows: int = CHUNK_ROWS, fmt=None) -> pd.DataFrame:
+    """Concatenate only the bars of `path` that fall in [start, end]."""
+    fmt = fmt or sniff(path)
+    parts = list(iter_bars(path, chunk=rows, start=start, end=end, fmt=fmt))
+    if not parts:
+        return normalise_bars(pd.read_csv(path, nrows=0, **csv_options(fmt)), fmt)
+    return pd.concat(parts, ignore_index=True)
+
+
+def tail_bars(path: str, n: int, rows: int = CHUNK_ROWS, fmt=None) -> pd.DataFrame:
+    """Last `n` bars of `path`, holding at most about n + rows bars in memory."""
+    kept = deque()
+    total = 0
+    for df in iter_bars(path, chunk=rows, fmt=fmt):
+        kept.append(df)
+        total += len(df)
+        while kept and total - len(kept[0]) >= n:
+            total -= len(kept.popleft())
+    if not kept:
+        return read_range(path, fmt=fmt)
+    return pd.concat(kept, ignore_index=True).tail(n).reset_index(drop=True)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from .intervals import IntervalIndex
+
+# ==========================
+# Zone confluence map
+# ==========================
+# Built once whenever the zone set changes: the zone edges become sorted
+# breakpoints and every price interval between them carries the number of
+# zones covering it (IntervalIndex.counts). "How many zones contain this
+# price" is then one binary search, and a whole array of prices (e.g. all
+# M1 closes of a backtest) is answered by one searchsorted call.
+
+
+class ConfluenceMap:
+    def __init__(self, zones, min_count: int = 2):
+        """zones: (a, b) price pairs in either order; None entries are skipped."""
+        zones = [z for z in zones if z is not None]
+        self.zones = zones
+        self.min_count = min_count
+        self.index = IntervalIndex([min(z) for z in zones], [max(z) for z in zones])
+
+    def count(self, prices) -> np.ndarray:
+        """Number of zones containing each price (zone edges included)."""
+        return self.index.count(prices)
+
+    def mask(self, prices) -> np.ndarray:
+        """True where at least min_count zones overlap."""
+        return self.count(prices) >= self.min_count
+
+    def __contains__(self, price) -> bool:
+        return bool(self.mask(price))
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+# ==========================
+# Shared indicators
+# ==========================
+# Array versions of the vwap_backtest_* helpers, used by the walk-forward
+# optimizer and the SMC kernels.
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    return pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return pd.Series(tr).rolling(period).mean().to_numpy()
+
+
+def vwap(close: np.ndarray, volume: np.ndarray, tickvol: np.ndarray) -> np.ndarray:
+    vol = np.where(volume == 0, tickvol, volume).astype(float)
+    return np.cumsum(close * vol) / np.cumsum(vol)
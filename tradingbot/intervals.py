@@ -0,0 +1,68 @@
+import numpy as np
+
+# ==========================
+# Static interval index for price zones
+# ==========================
+# Zones are closed price intervals [low, high]. All their edges are sorted
+# into breakpoints b_0 < b_1 < ... and the price line is cut into slots:
+# slot 2k is the single price b_k, slot 2k+1 the open gap (b_k, b_k+1).
+# Every price in a slot is inside exactly the same zones, so each slot
+# stores its zone ids (CSR layout) and their count. A lookup is one binary
+# search to find the slot.
+
+
+class IntervalIndex:
+    """Which of a fixed set of closed intervals contain a price."""
+
+    def __init__(self, low, high):
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        if (self.low > self.high).any():
+            raise ValueError("interval low above high")
+        self.breaks = np.unique(np.concatenate([self.low, self.high]))
+        n_slots = 2 * len(self.breaks) - 1 if len(self.breaks) else 0
+
+        # each interval covers slots 2*lo_pos .. 2*hi_pos
+        first = 2 * np.searchsorted(self.breaks, self.low)
+        last = 2 * np.searchsorted(self.breaks, self.high)
+        span = last - first + 1
+        ids = np.repeat(np.arange(len(self.low)), span)
+        slots = np.repeat(first, span) + (np.arange(span.sum()) - np.repeat(np.cumsum(span) - span, span))
+        order = np.lexsort((ids, slots))
+        self.ids = ids[order]
+        self.counts = np.bincount(slots, minlength=n_slots)[:n_slots]
+        self.offsets = np.concatenate(([0], np.cumsum(self.counts)))
+
+    def __len__(self):
+        return len(self.low)
+
+    def slot(self, prices) -> np.ndarray:
+        """Slot of each price (-1 outside every interval's breakpoints)."""
+        prices = np.asarray(prices, dtype=float)
+        pos = np.searchsorted(self.breaks, prices)
+        on_break = (pos < len(self.breaks)) & (self.breaks[np.minimum(pos, len(self.breaks) - 1)] == prices) \
+            if len(self.breaks) else np.zeros(prices.shape, dtype=bool)
+        slot = np.where(on_break, 2 * pos, 2 * pos - 1)
+        return np.where(on_break | ((pos > 0) & (pos < len(self.breaks))), slot, -1)
+
+    def count(self, prices) -> np.ndarray:
+        """Number of intervals containing each price."""
+        slot = self.slot(prices)
+        return np.where(slot >= 0, self.counts[np.maximum(slot, 0)] if len(self.counts) else 0, 0)
+
+    def query(self, price) -> np.ndarray:
+        """Ids (ascending) of the intervals containing one price."""
+        slot = int(self.slot(price))
+        if slot < 0:
+            return np.empty(0, dtype=np.int64)
+        return self.ids[self.offsets[slot]:self.offsets[slot + 1]]
+
+    def query_batch(self, prices):
+        """All (row, id) hits for an array of prices, ordered by row then id."""
+        slot = self.slot(prices)
+        inside = np.flatnonzero(slot >= 0)
+        start = self.offsets[slot[inside]]
+        n_hits = self.offsets[slot[inside] + 1] - start
+        rows = np.repeat(inside, n_hits)
+        at = np.repeat(start - (np.cumsum(n_hits) - n_hits), n_hits) + np.arange(n_hits.sum())
+        return rows, self.ids[at]
@@ -0,0 +1,59 @@
+import numpy as np
+
+from .indicators import atr
+
+# ==========================
+# Liquidity pools (equal highs / equal lows)
+# ==========================
+# Swing prices of one side are sorted once and split wherever two
+# neighbouring levels are more than `tolerance` apart, so every run of
+# levels chained within tolerance is one pool, however far apart in time
+# the swings were. The tolerance is usually a fraction of ATR so the same
+# setting works on GBPUSD, XAUUSD and USTEC.
+
+POOL_DTYPE = np.dtype([
+    ('type', 'U1'), ('level', 'f8'), ('low', 'f8'), ('high', 'f8'), ('touches', 'i8'),
+    ('first_time', 'M8[ns]'), ('last_time', 'M8[ns]'),
+])
+
+
+def atr_tolerance(high, low, close, mult: float = 0.1, period: int = 14) -> float:
+    """`mult` times the latest ATR(period), the default pool tolerance."""
+    values = atr(np.asarray(high, dtype=float), np.asarray(low, dtype=float), np.asarray(close, dtype=float), period)
+    values = values[~np.isnan(values)]
+    return float(mult * values[-1]) if len(values) else 0.0
+
+
+def _cluster(prices, times, tolerance, kind, min_touches):
+    if not len(prices):
+        return np.empty(0, dtype=POOL_DTYPE)
+    order = np.argsort(prices, kind='stable')
+    p, t = prices[order], times[order].astype('int64')
+    starts = np.flatnonzero(np.concatenate(([True], np.diff(p) > tolerance)))
+    touches = np.diff(np.append(starts, len(p)))
+    keep = touches >= min_touches
+
+    out = np.empty(keep.sum(), dtype=POOL_DTYPE)
+    out['type'] = kind
+    out['level'] = (np.add.reduceat(p, starts) / touches)[keep]
+    out['low'] = p[starts][keep]
+    out['high'] = p[starts + touches - 1][keep]
+    out['touches'] = touches[keep]
+    out['first_time'] = np.minimum.reduceat(t, starts)[keep].view('datetime64[ns]')
+    out['last_time'] = np.maximum.reduceat(t, starts)[keep].view('datetime64[ns]')
+    return out
+
+
+def liquidity_pools(swings, tolerance: float, min_touches: int = 2) -> np.ndarray:
+    """Pools of swing highs ('H') and swing lows ('L') as a POOL_DTYPE array.
+
+    `swings` is a SWING_DTYPE array. Each pool has the mean level, its
+    price range, how many swings touched it and the time span of those
+    touches. Highs come first, each side ordered by level.
+    """
+    parts = []
+    for kind in ('H', 'L'):
+        side = swings[swings['type'] == kind]
+        parts.append(_cluster(side['price'].astype(float), side['time'].astype('datetime64[ns]'),
+                              tolerance, kind, min_touches))
+    return np.concatenate(parts)
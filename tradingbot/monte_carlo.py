@@ -0,0 +1,161 @@
+import argparse
+import glob
+
+import numpy as np
+import pandas as pd
+
+# ==========================
+# Monte Carlo bootstrap for trade logs
+# ==========================
+# Resamples trade outcomes (iid per trade, or whole trading days to keep
+# daily clustering) and computes drawdown / expectancy / profit-factor
+# distributions for many paths at once.
+#
+# Every path is a sequence of blocks (a block is one trade, or one day of
+# trades). Each block is reduced up-front to a handful of statistics, and
+# the equity path is rebuilt from those with cumulative sums, so a chunk of
+# paths is evaluated in one vectorised pass regardless of trade count.
+# Paths are processed in chunks sized from `mem_mb`, so 100k+ resamples
+# run in bounded memory.
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def load_trades(pattern: str = "USTEC_trades*.csv") -> pd.DataFrame:
+    """Concatenate trade logs written by the VWAP backtests."""
+    frames = []
+    for file in sorted(glob.glob(pattern)):
+        df = pd.read_csv(file)
+        if 'timestamp_entry' in df.columns:
+            df['timestamp'] = pd.to_datetime(df['timestamp_entry'])
+        elif 'timestamp' in df.columns:
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        else:
+            raise ValueError(f"No timestamp column found in {file}")
+        df['file'] = file
+        frames.append(df[['timestamp', 'result_pips', 'file']])
+    if not frames:
+        return pd.DataFrame(columns=['timestamp', 'result_pips', 'file'])
+    return pd.concat(frames, ignore_index=True).sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+
+def block_stats(pnl: np.ndarray, block_ids: np.ndarray) -> dict:
+    """Reduce each block of consecutive trades to the numbers a path needs.
+
+    For a block with running sum c_1..c_k (c_0 = 0) we keep the total, the
+    highest and lowest running sum, its own max drawdown, trade/win counts
+    and gross profit/loss.
+    """
+    pnl = np.asarray(pnl, dtype=float)
+    _, starts = np.unique(block_ids, return_index=True)
+    starts = np.sort(starts)
+    stats = {k: [] for k in ('total', 'peak', 'trough', 'mdd', 'count', 'wins', 'gross_win', 'gross_loss')}
+    for chunk in np.split(pnl, starts[1:]):
+        cum = np.concatenate(([0.0], np.cumsum(chunk)))
+        stats['total'].append(cum[-1])
+        stats['peak'].append(cum.max())
+        stats['trough'].append(cum.min())
+        stats['mdd'].append((np.maximum.accumulate(cum) - cum).max())
+        stats['count'].append(len(chunk))
+        stats['wins'].append((chunk > 0).sum())
+        stats['gross_win'].append(chunk[chunk > 0].sum())
+        stats['gross_loss'].append(-chunk[chunk < 0].sum())
+    return {k: np.asarray(v, dtype=float) for k, v in stats.items()}
+
+
+def _evaluate_paths(stats: dict, picks: np.ndarray) -> dict:
+    """Metrics for a (paths, blocks) matrix of block indices."""
+    total = stats['total'][picks]
+    # Equity at the start of each block, and the running peak before it
+    end_eq = np.cumsum(total, axis=1)
+    start_eq = end_eq - total
+    block_peak = start_eq + stats['peak'][picks]
+    prior_peak = np.maximum.accumulate(
+        np.concatenate((np.zeros((len(picks), 1)), block_peak[:, :-1]), axis=1), axis=1)
+    prior_peak = np.maximum(prior_peak, 0.0)
+    # Drawdown inside a block is either from an earlier peak or its own
+    dd = np.maximum(prior_peak - (start_eq + stats['trough'][picks]), stats['mdd'][picks])
+    max_dd = dd.max(axis=1)
+
+    count = stats['count'][picks].sum(axis=1)
+    gross_win = stats['gross_win'][picks].sum(axis=1)
+    gross_loss = stats['gross_loss'][picks].sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expectancy = np.where(count > 0, end_eq[:, -1] / count, 0.0)
+        win_rate = np.where(count > 0, stats['wins'][picks].sum(axis=1) / count, 0.0)
+        profit_factor = np.where(gross_loss > 0, gross_win / gross_loss, np.inf)
+    return {
+        'total_pips': end_eq[:, -1],
+        'max_drawdown': max_dd,
+        'expectancy': expectancy,
+        'win_rate': win_rate,
+        'profit_factor': profit_factor,
+    }
+
+
+def bootstrap(trades: pd.DataFrame, n_paths: int = 10000, block: str = 'trade',
+              seed=None, mem_mb: float = 256.0) -> pd.DataFrame:
+    """Resample `trades` into `n_paths` paths and return one row of metrics per path.
+
+    block='trade' draws trades iid; block='day' draws whole trading days so
+    that same-day clustering of wins and losses is preserved. Each path has
+    as many blocks as the history.
+    """
+    pnl = trades['result_pips'].to_numpy(dtype=float)
+    if len(pnl) == 0:
+        raise ValueError("No trades to resample")
+    if block == 'trade':
+        block_ids = np.arange(len(pnl))
+    elif block == 'day':
+        block_ids = pd.to_datetime(trades['timestamp']).dt.normalize().to_numpy()
+    else:
+        raise ValueError(f"Unknown block type: {block}")
+
+    stats = block_stats(pnl, block_ids)
+    n_blocks = len(stats['total'])
+    rng = np.random.default_rng(seed)
+
+    # ~10 float64 (paths, blocks) temporaries live at once in _evaluate_paths
+    chunk = max(1, int(mem_mb * 1024 ** 2 // (n_blocks * 8 * 10)))
+    parts = []
+    for start in range(0, n_paths, chunk):
+        size = min(chunk, n_paths - start)
+        picks = rng.integers(0, n_blocks, size=(size, n_blocks))
+        parts.append(_evaluate_paths(stats, picks))
+    return pd.DataFrame({k: np.concatenate([p[k] for p in parts]) for k in parts[0]})
+
+
+def summarize(paths: pd.DataFrame, percentiles=PERCENTILES) -> pd.DataFrame:
+    """Percentile table of each metric across paths."""
+    paths = paths.replace([np.inf, -np.inf], np.nan)
+    table = paths.quantile([p / 100 for p in percentiles]).T
+    table.columns = [f"p{p}" for p in percentiles]
+    table['mean'] = paths.mean()
+    table['prob_loss'] = np.nan
+    table.loc['total_pips', 'prob_loss'] = (paths['total_pips'] < 0).mean()
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo bootstrap of trade logs")
+    parser.add_argument('--pattern', default="USTEC_trades*.csv")
+    parser.add_argument('--paths', type=int, default=10000)
+    parser.add_argument('--block', choices=['trade', 'day'], default='day')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    trades = load_trades(args.pattern)
+    if trades.empty:
+        print(f"❌ No trade files found for {args.pattern}")
+        return None
+    print(f"📂 {len(trades)} trades from {trades['file'].nunique()} files")
+
+    paths = bootstrap(trades, n_paths=args.paths, block=args.block, seed=args.seed)
+    table = summarize(paths)
+    print(f"\n🎲 Monte Carlo ({args.paths} paths, block={args.block}):")
+    print(table.round(3).to_string())
+    return table
+
+
+if __name__ == "__main__":
+    main()
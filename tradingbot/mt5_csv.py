@@ -0,0 +1,192 @@
+import argparse
+import os
+import time
+from typing import NamedTuple
+
+import pandas as pd
+
+from .timestamps import parse_date_time, parse_datetime, to_datetime64
+
+# ==========================
+# Single-pass MT5 CSV loader
+# ==========================
+# Sniffs encoding, delimiter and column layout from the first few KB of the
+# file, then parses it exactly once with explicit dtypes and an exact
+# datetime format. Handles both the MT5 History Center export
+# (<DATE>\t<TIME>\t<OPEN>...) and the pandas exports written by our own
+# scripts (time,open,high,low,close,tick_volume,spread,real_volume).
+
+SNIFF_BYTES = 64 * 1024
+
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'tickvol', 'volume', 'spread']
+
+# Header aliases -> normalised names
+COLUMN_ALIASES = {
+    'date': 'date', 'time': 'time', 'datetime': 'datetime', 'timestamp': 'datetime',
+    'open': 'open', 'high': 'high', 'low': 'low', 'close': 'close',
+    'tickvol': 'tickvol', 'tick_volume': 'tickvol',
+    'vol': 'volume', 'volume': 'volume', 'real_volume': 'volume',
+    'spread': 'spread',
+}
+
+# Positional layouts for header-less MT5 exports
+SPLIT_LAYOUT = ['date', 'time', 'open', 'high', 'low', 'close', 'tickvol', 'volume', 'spread']
+COMBINED_LAYOUT = ['datetime', 'open', 'high', 'low', 'close', 'tickvol', 'volume', 'spread']
+
+DTYPES = {
+    'date': str, 'time': str, 'datetime': str,
+    'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64',
+    'tickvol': 'int64', 'volume': 'int64', 'spread': 'int64',
+}
+
+
+class CsvFormat(NamedTuple):
+    encoding: str
+    sep: str
+    has_header: bool
+    names: list          # normalised column names, in file order
+    datetime_format: str
+    split_datetime: bool  # True when date and time are separate columns
+
+
+def _detect_encoding(raw: bytes) -> str:
+    if raw.startswith(b'\xff\xfe') or raw.startswith(b'\xfe\xff'):
+        return 'utf-16'
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    head = raw[:256]
+    if head.count(b'\x00') > len(head) // 4:
+        # BOM-less UTF-16: ASCII text has NULs in every other byte
+        return 'utf-16-le' if head[1:2] == b'\x00' else 'utf-16-be'
+    return 'utf-8'
+
+
+def _date_format(date_str: str) -> str:
+    for c in '.-/':
+        if c in date_str:
+            return f"%Y{c}%m{c}%d"
+    raise ValueError(f"Unrecognised date field: {date_str!r}")
+
+
+def _time_format(time_str: str) -> str:
+    return "%H:%M:%S" if time_str.count(':') == 2 else "%H:%M"
+
+
+def sniff(path: str, nbytes: int = SNIFF_BYTES) -> CsvFormat:
+    """Detect encoding, delimiter, header and datetime layout from the file head."""
+    with open(path, 'rb') as f:
+        raw = f.read(nbytes)
+    if not raw:
+        raise ValueError(f"Empty file: {path}")
+
+    encoding = _detect_encoding(raw)
+    text = raw.decode(encoding, errors='ignore')
+    lines = [ln for ln in text.splitlines() if ln.strip()]
+    first = lines[0]
+    sep = max(['\t', ',', ';'], key=first.count)
+
+    fields = [f.strip() for f in first.split(sep)]
+    has_header = not fields[0][:1].isdigit()
+    data = [f.strip() for f in (lines[1] if has_header else first).split(sep)]
+
+    split = len(data) > 1 and ':' in data[1] and ':' not in data[0]
+    if has_header:
+        names = []
+        for f in fields:
+            key = f.strip('<>').lower()
+            names.append(COLUMN_ALIASES.get(key, key))
+        # A lone "time" column holding "YYYY-mm-dd HH:MM" is a combined stamp
+        if not split and names[0] in ('time', 'date'):
+            names[0] = 'datetime'
+    else:
+        layout = SPLIT_LAYOUT if split else COMBINED_LAYOUT
+        names = layout[:len(data)] + [f"col{i}" for i in range(len(layout), len(data))]
+
+    if split:
+        datetime_format = f"{_date_format(data[0])} {_time_format(data[1])}"
+    else:
+        date_part, _, time_part = data[0].partition(' ')
+        datetime_format = _date_format(date_part)
+        if time_part:
+            datetime_format += ' ' + _time_format(time_part)
+
+    return CsvFormat(encoding, sep, has_header, names, datetime_format, split)
+
+
+def _engine(encoding: str) -> str:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return 'c'
+    return 'pyarrow' if encoding in ('utf-8', 'utf-8-sig') else 'c'
+
+
+def csv_options(fmt: CsvFormat) -> dict:
+    """Keyword arguments for pd.read_csv matching a sniffed format."""
+    return {
+        'sep': fmt.sep, 'encoding': fmt.encoding, 'header': 0 if fmt.has_header else None,
+        'names': fmt.names, 'dtype': {n: DTYPES[n] for n in fmt.names if n in DTYPES},
+    }
+
+
+def normalise_bars(df: pd.DataFrame, fmt: CsvFormat) -> pd.DataFrame:
+    """Turn a raw frame read with csv_options(fmt) into the bar schema."""
+    if fmt.split_datetime:
+        stamp = parse_date_time(df['date'], df['time'], fmt.datetime_format.split(' ')[0])
+        df = df.drop(columns=['date', 'time'])
+    else:
+        stamp = parse_datetime(df['datetime'], fmt.datetime_format)
+        df = df.drop(columns=['datetime'])
+    df.insert(0, 'timestamp', to_datetime64(stamp))
+
+    for col in ('tickvol', 'volume', 'spread'):
+        if col not in df.columns:
+            df[col] = 0
+    extra = [c for c in df.columns if c not in BAR_COLUMNS]
+    return df[BAR_COLUMNS + extra].dropna(subset=['timestamp'])
+
+
+def read_mt5_csv(path: str, fmt: CsvFormat = None) -> pd.DataFrame:
+    """Load an MT5/pandas bar CSV into the normalised bar schema.
+
+    Returns a frame with BAR_COLUMNS first (``timestamp`` as datetime64,
+    OHLC float64, volumes int64) followed by any extra columns in the file,
+    sorted by time.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+    fmt = fmt or sniff(path)
+
+    df = normalise_bars(pd.read_csv(path, engine=_engine(fmt.encoding), **csv_options(fmt)), fmt)
+    if not df['timestamp'].is_monotonic_increasing:
+        df = df.sort_values('timestamp', kind='stable')
+    return df.reset_index(drop=True)
+
+
+# ==========================
+# Benchmark against the legacy loader
+# ==========================
+def benchmark(path: str, repeat: int = 5) -> pd.DataFrame:
+    """Time read_mt5_csv against vwap_backtest_october.load_mt5_csv on `path`."""
+    from vwap_backtest_october import load_mt5_csv
+
+    rows = []
+    for name, loader in (('legacy load_mt5_csv', load_mt5_csv), ('read_mt5_csv', read_mt5_csv)):
+        best = float('inf')
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            df = loader(path)
+            best = min(best, time.perf_counter() - t0)
+        rows.append({'loader': name, 'rows': len(df), 'best_ms': round(best * 1000, 2)})
+    out = pd.DataFrame(rows)
+    out['speedup'] = (out['best_ms'].iloc[0] / out['best_ms']).round(2)
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MT5 CSV loaders")
+    parser.add_argument('path', nargs='?', default='XAUUSD_1min.csv')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    print(sniff(args.path))
+    print(benchmark(args.path, args.repeat).to_string(index=False))
@@ -0,0 +1,144 @@
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+# ==========================
+# Offline daily price cache
+# ==========================
+# Daily close prices are fetched from a PriceSource once and stored per
+# symbol as .npy columns (int64 ns dates, float64 closes) with a meta.json
+# recording the date range already covered. Later requests are served from
+# disk; only the part of the range that is not covered yet (normally the
+# tail since the last run) goes back to the source. The covered range only
+# extends to the day after the last close actually returned, and never past
+# today, so unpublished days and today's intraday close are fetched again.
+
+CACHE_DIR = ".price_cache"
+DAY_NS = 86_400 * 10**9
+
+
+class PriceSource(ABC):
+    """Where daily closes come from. fetch() returns a date-indexed frame, one column per symbol."""
+
+    @abstractmethod
+    def fetch(self, symbols: list, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        ...
+
+
+class YahooSource(PriceSource):
+    """Daily closes from Yahoo Finance (yfinance is imported on first fetch)."""
+
+    def fetch(self, symbols, start, end):
+        import yfinance as yf
+        close = yf.download(symbols, start=start, end=end, progress=False)["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(symbols[0])
+        return close
+
+
+class CsvSource(PriceSource):
+    """File-backed stand-in: a wide CSV with a date column and one column per symbol."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.requests = []  # (start, end) of every fetch, for inspecting cache behaviour
+
+    def fetch(self, symbols, start, end):
+        self.requests.append((start, end))
+        df = pd.read_csv(self.path, index_col=0, parse_dates=True)
+        return df.loc[(df.index >= start) & (df.index < end), list(symbols)]
+
+
+def _symbol_dir(cache_dir: str, symbol: str) -> str:
+    return os.path.join(cache_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', symbol))
+
+
+class PriceCache:
+    """Serves close prices for [start, end) from disk, fetching only uncovered dates."""
+
+    def __init__(self, source: PriceSource = None, cache_dir: str = CACHE_DIR):
+        self.source = source or YahooSource()
+        self.cache_dir = cache_dir
+
+    # ---- storage ----
+    def _load(self, symbol):
+        folder = _symbol_dir(self.cache_dir, symbol)
+        meta_file = os.path.join(folder, 'meta.json')
+        if not os.path.exists(meta_file):
+            return None, np.empty(0, np.int64), np.empty(0)
+        with open(meta_file) as f:
+            meta = json.load(f)
+        return ((meta['start'], meta['end']),
+                np.load(os.path.join(folder, 'time.npy')), np.load(os.path.join(folder, 'close.npy')))
+
+    def _store(self, symbol, covered, time, close):
+        folder = _symbol_dir(self.cache_dir, symbol)
+        os.makedirs(folder, exist_ok=True)
+        np.save(os.path.join(folder, 'time.npy'), time)
+        np.save(os.path.join(folder, 'close.npy'), close)
+        # meta last: a crash mid-write leaves the old range, which is refetched
+        with open(os.path.join(folder, 'meta.json'), 'w') as f:
+            json.dump({'symbol': symbol, 'start': int(covered[0]), 'end': int(covered[1])}, f)
+
+    # ---- fetching ----
+    def _missing(self, covered, start_ns, end_ns) -> list:
+        if covered is None:
+            return [(start_ns, end_ns)]
+        gaps = []
+        if start_ns < covered[0]:
+            gaps.append((start_ns, covered[0]))
+        if end_ns > covered[1]:
+            gaps.append((covered[1], end_ns))
+        return gaps
+
+    def _update(self, symbols, start_ns, end_ns):
+        state = {s: self._load(s) for s in symbols}
+        # Group symbols needing the same range so each range is one request
+        pending = {}
+        for s, (covered, _, _) in state.items():
+            for gap in self._missing(covered, start_ns, end_ns):
+                pending.setdefault(gap, []).append(s)
+
+        today_ns = pd.Timestamp.now().normalize().as_unit('ns').value
+        for (lo, hi), group in pending.items():
+            fetched = self.source.fetch(group, pd.Timestamp(lo), pd.Timestamp(hi))
+            for s in group:
+                covered, time, close = state[s]
+                col = fetched[s].dropna() if s in fetched.columns else pd.Series(dtype=float)
+                new_time = pd.DatetimeIndex(col.index).as_unit('ns').asi8
+                merged_time = np.concatenate([time, new_time])
+                merged_close = np.concatenate([close, col.to_numpy(dtype=float)])
+                order = np.argsort(merged_time, kind='stable')
+                merged_time, merged_close = merged_time[order], merged_close[order]
+                # on duplicate dates the newer fetch wins (e.g. a refetched final close)
+                keep = np.concatenate((merged_time[1:] != merged_time[:-1], [True]))
+                end = hi
+                if covered is None or hi > covered[1]:
+                    # a range reaching past the cached tail is covered only up to what was returned
+                    end = min(hi, today_ns, int(new_time.max()) + DAY_NS if len(new_time) else lo)
+                if end > lo:
+                    covered = (lo, end) if covered is None else (min(covered[0], lo), max(covered[1], end))
+                state[s] = (covered, merged_time[keep], merged_close[keep])
+                if covered is not None:
+                    self._store(s, *state[s])
+        return state
+
+    def get(self, symbols, start, end) -> pd.DataFrame:
+        """Close prices for `symbols` on dates in [start, end), one column per symbol."""
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        start_ns = pd.Timestamp(start).as_unit('ns').value
+        end_ns = pd.Timestamp(end).as_unit('ns').value
+        state = self._update(symbols, start_ns, end_ns)
+
+        columns = {}
+        for s in symbols:
+            _, time, close = state[s]
+            lo, hi = np.searchsorted(time, [start_ns, end_ns])
+            columns[s] = pd.Series(close[lo:hi], index=pd.DatetimeIndex(time[lo:hi].view('datetime64[ns]')))
+        out = pd.DataFrame(columns)
+        out.index.name = 'Date'
+        return out
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+from .bar_cache import Bars
+
+# ==========================
+# M1 -> higher timeframe resampler
+# ==========================
+# Builds M5/M15/H1/... bars from M1 the way MT5 does: buckets are aligned to
+# the clock (optionally shifted by a session offset), a bucket with no M1
+# bars produces no bar, open/close are the first/last M1 prices,
+# high/low the extremes, and tick/real volumes are summed. Spread is the
+# smallest M1 spread in the bucket, which is what the MT5 exports show.
+
+TIMEFRAME_MINUTES = {'M1': 1, 'M5': 5, 'M15': 15, 'M30': 30, 'H1': 60, 'H4': 240, 'D1': 1440}
+MINUTE_NS = 60 * 10**9
+BAR_FIELDS = ['time', 'open', 'high', 'low', 'close', 'tickvol', 'volume', 'spread']
+
+
+def period_ns(timeframe) -> int:
+    minutes = TIMEFRAME_MINUTES[timeframe.upper()] if isinstance(timeframe, str) else int(timeframe)
+    return minutes * MINUTE_NS
+
+
+def bucket_start(time_ns, timeframe, offset_minutes: int = 0):
+    """Start of the higher-timeframe bucket each timestamp falls in."""
+    period = period_ns(timeframe)
+    offset = offset_minutes * MINUTE_NS
+    return (np.asarray(time_ns, dtype=np.int64) - offset) // period * period + offset
+
+
+def bucket_bounds(time_ns, bar_time_ns, timeframe):
+    """Row range [starts[k], ends[k]) of the sorted `time_ns` inside each bar [t, t + period).
+
+    Two binary searches assign every lower-timeframe row to its bar, so
+    each bucket is a contiguous slice instead of a boolean filter.
+    """
+    time_ns = np.asarray(time_ns, dtype=np.int64)
+    bar_time_ns = np.asarray(bar_time_ns, dtype=np.int64)
+    starts = np.searchsorted(time_ns, bar_time_ns, side='left')
+    ends = np.searchsorted(time_ns, bar_time_ns + period_ns(timeframe), side='left')
+    return starts, ends
+
+
+def resample(bars, timeframe, offset_minutes: int = 0) -> Bars:
+    """Aggregate sorted M1 bars (a Bars or dict of arrays) into `timeframe` bars."""
+    time = np.asarray(bars['time'], dtype=np.int64)
+    if len(time) == 0:
+        return Bars({f: np.empty(0, dtype=np.asarray(bars[f]).dtype) for f in BAR_FIELDS})
+
+    buckets = bucket_start(time, timeframe, offset_minutes)
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [len(time)])) - 1
+
+    out = {
+        'time': buckets[starts],
+        'open': np.asarray(bars['open'])[starts],
+        'high': np.maximum.reduceat(np.asarray(bars['high']), starts),
+        'low': np.minimum.reduceat(np.asarray(bars['low']), starts),
+        'close': np.asarray(bars['close'])[ends],
+        'tickvol': np.add.reduceat(np.asarray(bars['tickvol']), starts),
+        'volume': np.add.reduceat(np.asarray(bars['volume']), starts),
+        'spread': np.minimum.reduceat(np.asarray(bars['spread']), starts),
+    }
+    return Bars(out)
+
+
+def resample_frame(df: pd.DataFrame, timeframe, offset_minutes: int = 0, time_col: str = 'time') -> pd.DataFrame:
+    """resample() for DataFrames with a datetime column and MT5 bar columns."""
+    cols = {'time': df[time_col].to_numpy(dtype='datetime64[ns]').view('int64')}
+    for f in BAR_FIELDS[1:]:
+        cols[f] = df[f].to_numpy() if f in df.columns else np.zeros(len(df), dtype=np.int64)
+    out = resample(cols, timeframe, offset_minutes).frame()
+    return out.rename(columns={'timestamp': time_col})
+
+
+class IncrementalResampler:
+    """Feeds closed M1 bars one at a time and emits higher-timeframe bars.
+
+    update() returns the finished bar (a dict) when an M1 bar opens a new
+    bucket, otherwise None. `current` is the bar still being built.
+    """
+
+    def __init__(self, timeframe, offset_minutes: int = 0):
+        self.period = period_ns(timeframe)
+        self.offset = offset_minutes * MINUTE_NS
+        self.current = None
+
+    def _bucket(self, time_ns):
+        return (time_ns - self.offset) // self.period * self.period + self.offset
+
+    def update(self, time_ns, open_, high, low, close, tickvol=0, volume=0, spread=0):
+        time_ns = int(time_ns)
+        bucket = self._bucket(time_ns)
+        cur = self.current
+        if cur is not None and bucket == cur['time']:
+            cur['high'] = max(cur['high'], high)
+            cur['low'] = min(cur['low'], low)
+            cur['close'] = close
+            cur['tickvol'] += tickvol
+            cur['volume'] += volume
+            cur['spread'] = min(cur['spread'], spread)
+            return None
+        if cur is not None and bucket < cur['time']:
+            raise ValueError("M1 bars must be fed in time order")
+        self.current = {'time': bucket, 'open': open_, 'high': high, 'low': low, 'close': close,
+                        'tickvol': tickvol, 'volume': volume, 'spread': spread}
+        return cur
+
+    def flush(self):
+        """Return and clear the partially built bar."""
+        cur, self.current = self.current, None
+        return cur
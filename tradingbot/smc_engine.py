@@ -0,0 +1,159 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import NamedTuple
+
+import numpy as np
+
+# ==========================
+# Incremental SMC structure engine
+# ==========================
+# Consumes one closed bar at a time and keeps only what the rules need: the
+# last left+right+1 bars for pivot confirmation, the last swing levels and
+# trend, and the active zones sorted by price. Work per bar is constant
+# (plus a bisect per zone list), so a bot that has been running for weeks
+# spends the same CPU per cycle as one that just started.
+#
+# Rules (as smc_chart_live.py used to recompute them each refresh):
+# - swing high/low: strict pivot with `left`/`right` neighbours, confirmed
+#   when bar i + right closes
+# - BOS_up when a swing high exceeds the last broken high (BOS_down
+#   mirrors it on lows); CHoCH when that flips the trend
+# - supply zone at a swing high whose bar i+2 closes below bar i+1's low;
+#   demand zone at a swing low whose bar i+2 closes above bar i+1's high
+# - a demand zone is broken by a close below its low, supply by a close
+#   above its high
+
+
+class Event(NamedTuple):
+    kind: str        # swing_high, swing_low, BOS_up, BOS_down, CHoCH_up, CHoCH_down, zone, zone_broken
+    index: int       # bar index the event refers to
+    time: np.datetime64
+    price: float
+    zone: dict = None
+
+
+class StructureEngine:
+    def __init__(self, left: int = 3, right: int = 3, max_zones: int = 200):
+        self.left, self.right = left, right
+        self.max_zones = max_zones
+        self.bars = deque(maxlen=max(left + right + 1, 3))   # (index, time, high, low, close)
+        self.count = 0
+        self.last_high = self.last_low = None
+        self.trend = None
+        self.pending = []         # swings waiting for bar i+2 to decide a zone
+        self.zones = {}           # id -> zone dict, active only
+        self._demand = []         # sorted (low, id)
+        self._supply = []         # sorted (high, id)
+        self._next_id = 0
+
+    @property
+    def last_time(self):
+        return self.bars[-1][1] if self.bars else None
+
+    # ---- per-bar update ----
+    def update(self, time, high, low, close) -> list:
+        """Add one closed bar; returns the events it caused (empty if nothing changed)."""
+        bar = (self.count, np.datetime64(time, 'ns'), float(high), float(low), float(close))
+        self.count += 1
+        self.bars.append(bar)
+        events = self._invalidate(bar)
+        events += self._confirm_swing()
+        events += self._resolve_pending(bar)
+        return events
+
+    def update_many(self, time, high, low, close) -> list:
+        """Feed a history (e.g. at start-up); returns all events."""
+        events = []
+        for t, h, l, c in zip(time, high, low, close):
+            events += self.update(t, h, l, c)
+        return events
+
+    # ---- swings and structure ----
+    def _confirm_swing(self):
+        if len(self.bars) < self.left + self.right + 1:
+            return []
+        bars = list(self.bars)[-(self.left + self.right + 1):]
+        i, t, h, l, _ = bars[self.left]
+        others = bars[:self.left] + bars[self.left + 1:]
+        events = []
+        if all(h > b[2] for b in others):
+            events.append(Event('swing_high', i, t, h))
+            events += self._structure('H', i, t, h)
+            self.pending.append(('H', i))
+        if all(l < b[3] for b in others):
+            events.append(Event('swing_low', i, t, l))
+            events += self._structure('L', i, t, l)
+            self.pending.append(('L', i))
+        return events
+
+    def _structure(self, kind, i, t, price):
+        events = []
+        if kind == 'H':
+            if self.last_high is None:
+                self.last_high = price
+            elif price > self.last_high:
+                events.append(Event('BOS_up', i, t, price))
+                if self.trend == 'down':
+                    events.append(Event('CHoCH_up', i, t, price))
+                self.trend = 'up'
+                self.last_high = price
+        else:
+            if self.last_low is None:
+                self.last_low = price
+            elif price < self.last_low:
+                events.append(Event('BOS_down', i, t, price))
+                if self.trend == 'up':
+                    events.append(Event('CHoCH_down', i, t, price))
+                self.trend = 'down'
+                self.last_low = price
+        return events
+
+    # ---- zones ----
+    def _bar(self, index):
+        return self.bars[index - self.bars[0][0]] if self.bars and index >= self.bars[0][0] else None
+
+    def _resolve_pending(self, bar):
+        events, keep = [], []
+        for kind, i in self.pending:
+            if bar[0] < i + 2:
+                keep.append((kind, i))
+                continue
+            base, nxt, third = self._bar(i), self._bar(i + 1), self._bar(i + 2)
+            if base is None:
+                continue
+            if kind == 'H' and third[4] < nxt[3]:
+                events.append(self._add_zone('supply', base))
+            if kind == 'L' and third[4] > nxt[2]:
+                events.append(self._add_zone('demand', base))
+        self.pending = keep
+        return events
+
+    def _add_zone(self, kind, base):
+        i, t, h, l, _ = base
+        zone = {'id': self._next_id, 'type': kind, 'index': i, 'start': t, 'low': l, 'high': h}
+        self._next_id += 1
+        self.zones[zone['id']] = zone
+        if kind == 'demand':
+            insort(self._demand, (l, zone['id']))
+        else:
+            insort(self._supply, (h, zone['id']))
+        if len(self.zones) > self.max_zones:
+            self._drop(next(iter(self.zones)))  # oldest
+        return Event('zone', i, t, h if kind == 'supply' else l, zone)
+
+    def _drop(self, zone_id):
+        zone = self.zones.pop(zone_id)
+        book, key = (self._demand, zone['low']) if zone['type'] == 'demand' else (self._supply, zone['high'])
+        del book[bisect_left(book, (key, zone_id))]
+        return zone
+
+    def _invalidate(self, bar):
+        i, t, _, _, close = bar
+        # demand zones with low above the close, supply zones with high below it
+        broken = self._demand[bisect_right(self._demand, (close, float('inf'))):]
+        broken += self._supply[:bisect_left(self._supply, (close, -1))]
+        events = []
+        for _, zone_id in sorted(broken, key=lambda k: k[1]):
+            zone = self._drop(zone_id)
+            events.append(Event('zone_broken', i, t, close, zone))
+        return events
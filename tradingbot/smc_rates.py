@@ -0,0 +1,75 @@
+import numpy as np
+
+# ==========================
+# SMC zones on MT5 rate arrays
+# ==========================
+# The live bots call detect_smc_zones() on the structured array returned by
+# mt5.copy_rates_from_pos every cycle. These detectors read the open/high/
+# low/close fields as views of that array (no per-bar Python lists) and
+# reproduce the rules the bots share:
+#
+# - FVG: the last bar i whose next open differs from the previous close;
+#   the zone spans those two prices
+# - liquidity grab: the last bar's high above every earlier high (sell),
+#   else its low below every earlier low (buy)
+# - order block: scanning back from the second-to-last bar, the first
+#   bearish candle followed by a higher close (buy) or bullish candle
+#   followed by a lower close (sell)
+# - break of structure (smc_live_smc_logic.py, smc_live_m15_m1.py): the
+#   last close beyond the prior range
+
+
+def last_fvg(open_, close):
+    """(low, high) of the most recent open/close gap, or None."""
+    prev_close, next_open = close[:-2], open_[2:]
+    hits = np.flatnonzero(next_open != prev_close)
+    if not len(hits):
+        return None
+    k = hits[-1]
+    a, b = prev_close[k], next_open[k]
+    return (a, b) if b > a else (b, a)
+
+
+def liquidity_grab(high, low):
+    """((low, high), signal) for a last-bar sweep of the prior range, or (None, None)."""
+    prev_high, prev_low = high[:-1].max(), low[:-1].min()
+    if high[-1] > prev_high:
+        return (prev_high, high[-1]), "sell"
+    if low[-1] < prev_low:
+        return (low[-1], prev_low), "buy"
+    return None, None
+
+
+def last_order_block(open_, high, low, close):
+    """((low, high), signal) of the most recent order-block candle, or (None, None)."""
+    body, nxt = close[:-1], close[1:]
+    bullish_ob = (body < open_[:-1]) & (nxt > body)
+    bearish_ob = (body > open_[:-1]) & (nxt < body)
+    hits = np.flatnonzero(bullish_ob | bearish_ob)
+    if not len(hits):
+        return None, None
+    i = hits[-1]
+    return (low[i], high[i]), "buy" if bullish_ob[i] else "sell"
+
+
+def smc_zones(rates):
+    """(signal, fvg, liquidity_grab, order_block) for an MT5 rates array of 3+ bars.
+
+    The liquidity-grab direction wins; the order block only sets the
+    signal when there was no grab. signal is None when neither fired.
+    """
+    open_, high, low, close = rates['open'], rates['high'], rates['low'], rates['close']
+    fvg = last_fvg(open_, close)
+    grab, signal = liquidity_grab(high, low)
+    ob, ob_signal = last_order_block(open_, high, low, close)
+    return signal or ob_signal, fvg, grab, ob
+
+
+def break_of_structure(rates):
+    """"buy" when the last close is above every earlier high, "sell" below every earlier low, else None."""
+    high, low, close = rates['high'], rates['low'], rates['close']
+    if close[-1] > high[:-1].max():
+        return "buy"
+    if close[-1] < low[:-1].min():
+        return "sell"
+    return None
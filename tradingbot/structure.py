@@ -0,0 +1,42 @@
+import numpy as np
+
+# ==========================
+# Market structure: BOS / CHoCH
+# ==========================
+# Swing highs and lows are walked as one time-ordered stream. A swing high
+# above the previous swing high is a bullish break of structure (BOS_up), a
+# swing low below the previous swing low a bearish one (BOS_down). When a
+# break goes against the direction of the previous break it is also a
+# change of character (CHoCH_up / CHoCH_down), reported on the same bar
+# right after its BOS.
+
+STRUCTURE_DTYPE = np.dtype([('index', 'i8'), ('time', 'M8[ns]'), ('type', 'U10'), ('price', 'f8')])
+
+
+def bos_choch(swings) -> np.ndarray:
+    """BOS/CHoCH events from a SWING_DTYPE array, as a STRUCTURE_DTYPE array ordered by time."""
+    swings = swings[np.argsort(swings['time'], kind='stable')]
+    is_high = swings['type'] == 'H'
+    events = []
+    for kind, sign in (('H', 1), ('L', -1)):
+        pos = np.flatnonzero(is_high if kind == 'H' else ~is_high)
+        price = swings['price'][pos]
+        brk = pos[1:][sign * price[1:] > sign * price[:-1]]
+        events.append(np.stack([brk, np.full(len(brk), sign)], axis=1))
+    breaks = np.concatenate(events)
+    breaks = breaks[np.argsort(breaks[:, 0], kind='stable')]
+
+    pos, up = breaks[:, 0], breaks[:, 1] > 0
+    flip = np.concatenate(([False], up[1:] != up[:-1]))
+
+    def records(rows, names):
+        rec = np.empty(len(rows), dtype=STRUCTURE_DTYPE)
+        for field in ('index', 'time', 'price'):
+            rec[field] = swings[field][pos[rows]]
+        rec['type'] = np.where(up[rows], *names)
+        return rec
+
+    # each break emits its BOS, followed by a CHoCH when the direction flipped
+    bos_rows, choch_rows = np.arange(len(pos)), np.flatnonzero(flip)
+    out = np.concatenate([records(bos_rows, ('BOS_up', 'BOS_down')), records(choch_rows, ('CHoCH_up', 'CHoCH_down'))])
+    return out[np.argsort(np.concatenate([2 * bos_rows, 2 * choch_rows + 1]), kind='stable')]
@@ -0,0 +1,88 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ==========================
+# Swing-point detection
+# ==========================
+# Works on plain high/low arrays (DataFrame columns or MT5 rate fields) and
+# returns row indices, so callers pick whatever time/price representation
+# they need. Only bars with a full window on both sides can be swings.
+
+
+def window_max(x, window: int) -> np.ndarray:
+    """Max over every full window of `window` consecutive values (len n - window + 1)."""
+    return sliding_window_view(np.asarray(x, dtype=float), window).max(axis=1)
+
+
+def window_min(x, window: int) -> np.ndarray:
+    return sliding_window_view(np.asarray(x, dtype=float), window).min(axis=1)
+
+
+def swing_points(high, low, lookback: int = 2):
+    """Indices of swing highs and swing lows.
+
+    Bar i is a swing high when its high equals the max of the centred
+    window [i - lookback, i + lookback] (ties count), and a swing low when
+    its low equals the window min.
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    span = 2 * lookback + 1
+    if len(high) < span:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    centre = slice(lookback, len(high) - lookback)
+    hi_idx = np.flatnonzero(high[centre] == window_max(high, span)) + lookback
+    lo_idx = np.flatnonzero(low[centre] == window_min(low, span)) + lookback
+    return hi_idx, lo_idx
+
+
+# Swing records: row index, bar time, 'H' or 'L', pivot price
+SWING_DTYPE = np.dtype([('index', 'i8'), ('time', 'M8[ns]'), ('type', 'U1'), ('price', 'f8')])
+
+
+def _side_extreme(x, width, start, count, reduce):
+    # reduce() over x[start + k : start + k + width] for k in range(count)
+    if width == 0:
+        return np.full(count, -np.inf if reduce is window_max else np.inf)
+    return reduce(x, width)[start:start + count]
+
+
+def pivot_points(high, low, left: int = 3, right: int = 3):
+    """Indices of strict pivot highs and lows.
+
+    Bar i is a pivot high when its high is strictly greater than each of
+    the `left` highs before it and the `right` highs after it; pivot lows
+    mirror this on the lows. Equal neighbours disqualify a pivot.
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    count = len(high) - left - right
+    if count <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    centre = slice(left, left + count)
+    is_h = (high[centre] > _side_extreme(high, left, 0, count, window_max)) & \
+           (high[centre] > _side_extreme(high, right, left + 1, count, window_max))
+    is_l = (low[centre] < _side_extreme(low, left, 0, count, window_min)) & \
+           (low[centre] < _side_extreme(low, right, left + 1, count, window_min))
+    return np.flatnonzero(is_h) + left, np.flatnonzero(is_l) + left
+
+
+def swing_records(time, high, low, hi_idx, lo_idx) -> np.ndarray:
+    """SWING_DTYPE array for given swing-high/low indices, ordered by index (H before L on the same bar)."""
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    out = np.empty(len(hi_idx) + len(lo_idx), dtype=SWING_DTYPE)
+    out['index'] = np.concatenate([hi_idx, lo_idx])
+    out['type'] = np.concatenate([np.full(len(hi_idx), 'H'), np.full(len(lo_idx), 'L')])
+    out['price'] = np.concatenate([high[hi_idx], low[lo_idx]])
+    out = out[np.argsort(out['index'], kind='stable')]
+    out['time'] = np.asarray(time).astype('datetime64[ns]')[out['index']]
+    return out
+
+
+def swing_array(time, high, low, left: int = 3, right: int = 3) -> np.ndarray:
+    """Strict pivots as a SWING_DTYPE array ordered by index (H before L on the same bar)."""
+    hi_idx, lo_idx = pivot_points(high, low, left, right)
+    return swing_records(time, high, low, hi_idx, lo_idx)
@@ -0,0 +1,179 @@
+import os
+import struct
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+# ==========================
+# Append-only tick archive
+# ==========================
+# One file per symbol per day: <root>/<SYMBOL>/<YYYY-MM-DD>.ticks
+#
+# Header (32 bytes): magic, version, price digits, first tick time (ms).
+# Records (12 bytes each): uint32 milliseconds since the previous tick and
+# int32 bid/ask scaled by 10**digits. A day of ticks is decoded with one
+# cumulative sum over the memory-mapped records.
+
+MAGIC = b'TICKARC1'
+HEADER = struct.Struct('<8sIIq8x')
+RECORD_DTYPE = np.dtype([('dt', '<u4'), ('bid', '<i4'), ('ask', '<i4')])
+DAY_MS = 86_400_000
+
+
+def _day_of(time_ms: int) -> str:
+    return pd.Timestamp(int(time_ms), unit='ms').strftime('%Y-%m-%d')
+
+
+def _read_header(path):
+    with open(path, 'rb') as f:
+        magic, version, digits, base_ms = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"Not a tick archive: {path}")
+    return digits, base_ms
+
+
+def _open_records(path):
+    digits, base_ms = _read_header(path)
+    size = os.path.getsize(path) - HEADER.size
+    n = size // RECORD_DTYPE.itemsize
+    if n == 0:
+        return digits, base_ms, np.empty(0, dtype=RECORD_DTYPE)
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(n,))
+    return digits, base_ms, records
+
+
+def decode_file(path: str) -> dict:
+    """Decode one daily archive into time_msc (int64) and bid/ask (float64) arrays."""
+    digits, base_ms, rec = _open_records(path)
+    scale = 10.0 ** digits
+    return {
+        'time_msc': base_ms + np.cumsum(rec['dt'], dtype=np.int64),
+        'bid': rec['bid'] / scale,
+        'ask': rec['ask'] / scale,
+    }
+
+
+class TickRecorder:
+    """Appends ticks for one symbol, rotating to a new file each day."""
+
+    def __init__(self, root: str, symbol: str, digits: int):
+        self.folder = os.path.join(root, symbol.upper())
+        self.digits = digits
+        self.scale = 10 ** digits
+        self.last_ms = None
+        self._last_records = []   # (bid, ask) recorded at last_ms
+        self._day = None
+        os.makedirs(self.folder, exist_ok=True)
+
+    def path_for(self, day: str) -> str:
+        return os.path.join(self.folder, f"{day}.ticks")
+
+    def _resume(self, day: str):
+        # Recover the last timestamp (and the records stamped with it) so
+        # deltas continue and overlapping ticks are recognised across restarts
+        path = self.path_for(day)
+        self._day = day
+        self.last_ms = None
+        self._last_records = []
+        if os.path.exists(path):
+            _, base_ms, rec = _open_records(path)
+            if len(rec):
+                times = base_ms + np.cumsum(rec['dt'], dtype=np.int64)
+                self.last_ms = int(times[-1])
+                tail = rec[np.searchsorted(times, self.last_ms, side='left'):]
+                self._last_records = list(zip(tail['bid'].tolist(), tail['ask'].tolist()))
+
+    def append(self, ticks) -> int:
+        """Append MT5 ticks (anything with time_msc, bid and ask fields).
+
+        Ticks before the last recorded one, and ticks at the same
+        millisecond that repeat an already recorded (bid, ask), are
+        skipped per day, so polling copy_ticks_from with overlapping
+        windows and restarting the recorder are safe. Returns the number
+        of ticks written.
+        """
+        if len(ticks) == 0:
+            return 0
+        time_ms = np.asarray(ticks['time_msc'], dtype=np.int64)
+        bid = np.rint(np.asarray(ticks['bid'], dtype=float) * self.scale).astype(np.int32)
+        ask = np.rint(np.asarray(ticks['ask'], dtype=float) * self.scale).astype(np.int32)
+
+        day_idx = time_ms // DAY_MS
+        cuts = np.flatnonzero(np.diff(day_idx)) + 1
+        written = 0
+        for t, b, a in zip(np.split(time_ms, cuts), np.split(bid, cuts), np.split(ask, cuts)):
+            written += self._write_day(t, b, a)
+        return written
+
+    def _new_ticks(self, time_ms, bid, ask):
+        # Mask of ticks not already in the current day's file
+        if self.last_ms is None:
+            return np.ones(len(time_ms), dtype=bool)
+        keep = time_ms > self.last_ms
+        # Same-millisecond ticks: drop one new tick per matching recorded record
+        pending = Counter(self._last_records)
+        for i in np.flatnonzero(time_ms == self.last_ms):
+            key = (int(bid[i]), int(ask[i]))
+            if pending[key]:
+                pending[key] -= 1
+            else:
+                keep[i] = True
+        return keep
+
+    def _write_day(self, time_ms, bid, ask) -> int:
+        day = _day_of(time_ms[0])
+        path = self.path_for(day)
+        if day != self._day:
+            self._resume(day)
+
+        keep = self._new_ticks(time_ms, bid, ask)
+        time_ms, bid, ask = time_ms[keep], bid[keep], ask[keep]
+        if len(time_ms) == 0:
+            return 0
+
+        # no records yet (missing file, or a header-only file left by an
+        # interrupted write): start the day's file afresh
+        new_file = self.last_ms is None
+        prev = time_ms[0] if new_file else self.last_ms
+        rec = np.empty(len(time_ms), dtype=RECORD_DTYPE)
+        rec['dt'] = np.diff(time_ms, prepend=prev)
+        rec['bid'] = bid
+        rec['ask'] = ask
+        with open(path, 'wb' if new_file else 'ab') as f:
+            if new_file:
+                f.write(HEADER.pack(MAGIC, 1, self.digits, int(time_ms[0])))
+            f.write(rec.tobytes())
+
+        last = time_ms[-1]
+        tail = time_ms == last
+        if last != self.last_ms:
+            self._last_records = []
+        self._last_records += list(zip(bid[tail].tolist(), ask[tail].tolist()))
+        self.last_ms = int(last)
+        return len(time_ms)
+
+
+def read_ticks(root: str, symbol: str, start=None, end=None) -> dict:
+    """Decode ticks for `symbol` in [start, end] from the daily archives."""
+    folder = os.path.join(root, symbol.upper())
+    start_ms = None if start is None else pd.Timestamp(start).as_unit('ns').value // 10**6
+    end_ms = None if end is None else pd.Timestamp(end).as_unit('ns').value // 10**6
+    first_day = None if start_ms is None else _day_of(start_ms)
+    last_day = None if end_ms is None else _day_of(end_ms)
+
+    parts = []
+    files = sorted(f for f in os.listdir(folder) if f.endswith('.ticks')) if os.path.isdir(folder) else []
+    for name in files:
+        day = name[:-len('.ticks')]
+        if (first_day and day < first_day) or (last_day and day > last_day):
+            continue
+        data = decode_file(os.path.join(folder, name))
+        t = data['time_msc']
+        lo = 0 if start_ms is None else np.searchsorted(t, start_ms, side='left')
+        hi = len(t) if end_ms is None else np.searchsorted(t, end_ms, side='right')
+        parts.append({k: v[lo:hi] for k, v in data.items()})
+
+    if not parts:
+        return {'time_msc': np.empty(0, np.int64), 'bid': np.empty(0), 'ask': np.empty(0)}
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+# ==========================
+# Shared timestamp layer
+# ==========================
+# Every loader keeps time as int64 epoch nanoseconds. The strptime format
+# is guessed once from the first value and the column goes through pandas'
+# exact-format parser. Split <DATE>/<TIME> files (MT5 history exports) are
+# combined without building per-row strings: dates are parsed once per run
+# (one run per day in a bar file) and fixed-width "HH:MM[:SS]" times are
+# read from their digit bytes.
+
+NS = 10**9
+NAT = np.iinfo(np.int64).min
+
+def guess_format(sample: str) -> str:
+    """strftime format of an MT5-style date or datetime string."""
+    sample = sample.strip()
+    date_part, _, time_part = sample.partition(' ')
+    sep = next((c for c in '.-/' if c in date_part), None)
+    if sep is None:
+        raise ValueError(f"Unrecognised timestamp: {sample!r}")
+    fmt = f"%Y{sep}%m{sep}%d"
+    if time_part:
+        fmt += " %H:%M:%S" if time_part.count(':') == 2 else " %H:%M"
+    return fmt
+
+
+def _byte_rows(values, width: int):
+    # (n, width) uint8 view of the strings joined with newlines, or None
+    # unless every value is an ASCII str of exactly `width` characters
+    try:
+        buf = '\n'.join(values.tolist()).encode('ascii')
+    except (TypeError, UnicodeEncodeError):
+        return None
+    n, stride = len(values), width + 1
+    if len(buf) != n * stride - 1:
+        return None
+    newlines = np.ndarray((n - 1,), dtype=np.uint8, buffer=buf, offset=width, strides=(stride,))
+    if not (newlines == 10).all():
+        return None
+    return np.ndarray((n, width), dtype=np.uint8, buffer=buf, strides=(stride, 1))
+
+
+def _parse_clock(values, seconds: bool):
+    """ns since midnight for fixed-width "HH:MM[:SS]" strings, or None if any row does not fit."""
+    rows = _byte_rows(values, 8 if seconds else 5)
+    if rows is None:
+        return None
+    colons = [2, 5] if seconds else [2]
+    if not (rows[:, colons] == ord(':')).all():
+        return None
+    # any non-digit character lands outside 0-9
+    digits = rows[:, [0, 1, 3, 4, 6, 7] if seconds else [0, 1, 3, 4]].astype(np.int64) - 48
+    if ((digits < 0) | (digits > 9)).any():
+        return None
+    fields = digits[:, 0::2] * 10 + digits[:, 1::2]     # hours, minutes[, seconds]
+    if (fields[:, 0] > 23).any() or (fields[:, 1:] > 59).any():
+        return None
+    scale = np.array([3600, 60, 1][:fields.shape[1]], dtype=np.int64) * NS
+    return fields @ scale
+
+
+def parse_datetime(values, fmt: str = None) -> np.ndarray:
+    """Parse date or datetime strings into int64 epoch ns (NAT for bad rows)."""
+    values = np.asarray(values)
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+    fmt = fmt or guess_format(str(values[0]))
+    parsed = pd.to_datetime(pd.Series(values), format=fmt, errors='coerce')
+    return parsed.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+def parse_time_of_day(values) -> np.ndarray:
+    """Parse "HH:MM[:SS]" strings into int64 ns since midnight."""
+    values = np.asarray(values)
+    sample = str(values[0]) if len(values) else "00:00:00"
+    fmt = "%H:%M:%S" if sample.count(':') == 2 else "%H:%M"
+    fast = _parse_clock(values, fmt.endswith('%S')) if len(values) else None
+    if fast is not None:
+        return fast
+    parsed = pd.to_datetime(pd.Series(values), format=fmt, errors='coerce') - pd.Timestamp('1900-01-01')
+    return parsed.to_numpy(dtype='timedelta64[ns]').view(np.int64)
+
+
+def parse_date_time(dates, times, date_fmt: str = None) -> np.ndarray:
+    """Combine split <DATE>/<TIME> columns into int64 epoch ns.
+
+    Dates come in runs (one per day in a bar file), so only the first
+    row of each run is stripped and parsed; fixed-width times are decoded
+    from their bytes, other times parsed once per distinct value and
+    broadcast back through factorize codes. No per-row string
+    concatenation.
+    """
+    dates, times = np.asarray(dates), np.asarray(times)
+    if len(dates) == 0:
+        return np.empty(0, dtype=np.int64)
+    change = np.ones(len(dates), dtype=bool)
+    change[1:] = dates[1:] != dates[:-1]
+    first = dates[change]
+    day = parse_datetime(pd.Index(first).astype(str).str.strip().to_numpy(), date_fmt)[np.cumsum(change) - 1]
+
+    tod = _parse_clock(times, str(times[0]).count(':') == 2)
+    if tod is None:
+        time_codes, time_uniques = pd.factorize(times)
+        tod = parse_time_of_day(pd.Index(time_uniques).astype(str).str.strip().to_numpy())[time_codes]
+        tod[time_codes < 0] = NAT
+    out = day + tod
+    out[(day == NAT) | (tod == NAT)] = NAT
+    return out
+
+
+def to_epoch_ns(values) -> np.ndarray:
+    """int64 epoch ns for datetime-like arrays, Series or scalars."""
+    if np.isscalar(values) or isinstance(values, (pd.Timestamp, np.datetime64)):
+        return np.int64(pd.Timestamp(values).as_unit('ns').value)
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'i':
+        return arr.astype(np.int64, copy=False)
+    return pd.to_datetime(arr).to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+def to_datetime64(time_ns) -> np.ndarray:
+    """Zero-copy datetime64[ns] view of an int64 ns array."""
+    return np.asarray(time_ns, dtype=np.int64).view('datetime64[ns]')
+
+
+def locate(time_ns, targets) -> np.ndarray:
+    """Row of each target in a sorted time column, or -1 where absent."""
+    time_ns = np.asarray(time_ns, dtype=np.int64)
+    targets = np.atleast_1d(to_epoch_ns(targets))
+    pos = np.searchsorted(time_ns, targets)
+    found = pos < len(time_ns)
+    found[found] = time_ns[pos[found]] == targets[found]
+    return np.where(found, pos, -1)
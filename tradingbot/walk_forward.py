@@ -0,0 +1,284 @@
+import argparse
+import glob
+import os
+import re
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from .bar_index import BarIndex
+from .indicators import atr, ema, vwap
+
+# ==========================
+# Walk-forward optimizer for the weekly VWAP scalper
+# ==========================
+# Tunes the VWAP pullback parameters on week N and scores the best set
+# out-of-sample on week N+1, for every consecutive pair of weeks.
+# Each week's indicators and entry masks are computed once and shared by
+# every fold and every parameter combination that touches that week.
+
+PARAM_NAMES = ['TP_mult', 'SL_mult', 'ATR_min', 'VWAP_tol', 'T_stop']
+
+TP_mults  = [1.5, 2.0]
+SL_mults  = [1.0, 1.5]
+ATR_mins  = [0.2, 0.5]
+VWAP_tols = [0.0008]
+T_stops   = [50, 100]
+PARAM_GRID = list(product(TP_mults, SL_mults, ATR_mins, VWAP_tols, T_stops))
+
+TRADE_COLUMNS = ['timestamp_entry', 'direction', 'entry_price', 'exit_price', 'outcome', 'result_pips']
+METRIC_COLUMNS = ['num_trades', 'win_rate', 'expectancy', 'profit_factor']
+
+# Same warm-up as vwap_backtest_october.generate_signals (EMA50 / ATR14)
+START_IDX = 51
+
+
+# ==========================
+# Per-week feature cache
+# ==========================
+class WeekFeatures:
+    """Indicator arrays for one week plus memoised entry masks."""
+
+    def __init__(self, df: pd.DataFrame):
+        time_col = 'timestamp' if 'timestamp' in df.columns else 'time'
+        self.timestamp = pd.to_datetime(df[time_col]).to_numpy()
+        self.open = df['open'].to_numpy(dtype=float)
+        self.high = df['high'].to_numpy(dtype=float)
+        self.low = df['low'].to_numpy(dtype=float)
+        self.close = df['close'].to_numpy(dtype=float)
+
+        tickvol = df['tickvol'] if 'tickvol' in df.columns else df['tick_volume']
+        volume = df['volume'] if 'volume' in df.columns else df.get('real_volume', tickvol * 0)
+
+        self.ema20 = ema(self.close, 20)
+        self.ema50 = ema(self.close, 50)
+        self.atr = atr(self.high, self.low, self.close, 14)
+        self.vwap = vwap(self.close, volume.to_numpy(dtype=float), tickvol.to_numpy(dtype=float))
+        self._masks = {}
+        self._indexes = {}
+
+    def __len__(self):
+        return len(self.close)
+
+    def entry_masks(self, vwap_tol: float):
+        """Return (long_mask, short_mask) ignoring the ATR floor, cached per tolerance."""
+        if vwap_tol not in self._masks:
+            close, vw, e20, a = self.close, self.vwap, self.ema20, self.atr
+            prev_close = np.concatenate(([np.nan], close[:-1]))
+            band = vw * vwap_tol
+            with np.errstate(invalid='ignore'):
+                distance_ok = np.abs(close - e20) > 0.2 * a
+                long_mask = ((close > vw) & (e20 > self.ema50)
+                             & (np.abs(self.low - vw) <= band)
+                             & (close > prev_close) & distance_ok)
+                short_mask = ((close < vw) & (e20 < self.ema50)
+                              & (np.abs(self.high - vw) <= band)
+                              & (close < prev_close) & distance_ok)
+            self._masks[vwap_tol] = (long_mask, short_mask)
+        return self._masks[vwap_tol]
+
+    def bar_index(self, gap_minutes: int) -> BarIndex:
+        if gap_minutes not in self._indexes:
+            time_ns = self.timestamp.astype('datetime64[ns]').view('int64')
+            self._indexes[gap_minutes] = BarIndex(time_ns, gap_minutes)
+        return self._indexes[gap_minutes]
+
+
+class FeatureCache:
+    """Loads and featurises each week at most once."""
+
+    def __init__(self, sources: dict):
+        # sources: week label -> CSV path or DataFrame
+        self.sources = dict(sources)
+        self._features = {}
+        self.builds = 0
+
+    def __getitem__(self, week) -> WeekFeatures:
+        if week not in self._features:
+            src = self.sources[week]
+            df = pd.read_csv(src) if isinstance(src, str) else src
+            self._features[week] = WeekFeatures(df)
+            self.builds += 1
+        return self._features[week]
+
+    def weeks(self):
+        return list(self.sources)
+
+
+def discover_weeks(folder: str = '.', pattern: str = 'USTEC_Week*_data.csv') -> dict:
+    """Map week number -> file for the weekly exports written by vwap_backtest_october.py."""
+    weeks = {}
+    for path in glob.glob(os.path.join(folder, pattern)):
+        match = re.search(r'Week(\d+)', os.path.basename(path))
+        if match:
+            weeks[int(match.group(1))] = path
+    return dict(sorted(weeks.items()))
+
+
+# ==========================
+# Simulation on cached arrays
+# ==========================
+def simulate(feat: WeekFeatures, params: dict, gap_minutes: int = None) -> pd.DataFrame:
+    """Vectorised equivalent of vwap_backtest_october.generate_signals.
+
+    With `gap_minutes`, look-ahead windows stop at the first gap longer than
+    that (session breaks, weekends) instead of running into the next session.
+    """
+    t_stop = int(params['T_stop'])
+    n = len(feat)
+    stop = n - t_stop - 1
+    if stop <= START_IDX or t_stop < 2:
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
+    long_mask, short_mask = feat.entry_masks(params['VWAP_tol'])
+    with np.errstate(invalid='ignore'):
+        atr_ok = feat.atr >= params['ATR_min']
+    window = np.zeros(n, dtype=bool)
+    window[START_IDX:stop] = True
+    longs = long_mask & atr_ok & window
+    shorts = short_mask & atr_ok & window
+
+    idx = np.flatnonzero(longs | shorts)
+    if len(idx) == 0:
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
+    # Future window is bars i+1 .. i+T_stop-1, as in df.iloc[i+1:i+T_stop]
+    span = t_stop - 1
+    win_high = np.lib.stride_tricks.sliding_window_view(feat.high, span)[idx + 1]
+    win_low = np.lib.stride_tricks.sliding_window_view(feat.low, span)[idx + 1]
+    if gap_minutes is not None:
+        stop_rows = feat.bar_index(gap_minutes).next_gap(idx)
+        valid = (idx[:, None] + 1 + np.arange(span)) < stop_rows[:, None]
+        win_high = np.where(valid, win_high, -np.inf)
+        win_low = np.where(valid, win_low, np.inf)
+    fut_high = win_high.max(axis=1)
+    fut_low = win_low.min(axis=1)
+
+    is_long = longs[idx]
+    entry = feat.close[idx]
+    a = feat.atr[idx]
+    sign = np.where(is_long, 1.0, -1.0)
+    tp = entry + sign * params['TP_mult'] * a
+    sl = entry - sign * params['SL_mult'] * a
+
+    hit_tp = np.where(is_long, fut_high >= tp, fut_low <= tp)
+    hit_sl = np.where(is_long, fut_low <= sl, fut_high >= sl)
+    tp_only = hit_tp & ~hit_sl
+    sl_only = hit_sl & ~hit_tp
+
+    result = np.where(tp_only, sign * (tp - entry), np.where(sl_only, sign * (sl - entry), 0.0))
+    outcome = np.where(tp_only, 'TP', np.where(sl_only, 'SL', 'TIMEOUT'))
+
+    return pd.DataFrame({
+        'timestamp_entry': feat.timestamp[idx],
+        'direction': np.where(is_long, 'LONG', 'SHORT'),
+        'entry_price': entry,
+        'exit_price': entry + sign * result,
+        'outcome': outcome,
+        'result_pips': result,
+    })
+
+
+def summarize(trades: pd.DataFrame) -> dict:
+    pips = trades['result_pips'].to_numpy(dtype=float)
+    num_trades = len(pips)
+    if num_trades == 0:
+        return {'num_trades': 0, 'win_rate': 0.0, 'expectancy': 0.0, 'profit_factor': 0.0}
+    pf = pips[pips > 0].sum() / abs(pips[pips < 0].sum() + 1e-6)
+    return {
+        'num_trades': num_trades,
+        'win_rate': round((pips > 0).sum() / num_trades, 3),
+        'expectancy': round(pips.mean(), 3),
+        'profit_factor': round(pf, 2),
+    }
+
+
+def optimize(feat: WeekFeatures, param_grid=PARAM_GRID, gap_minutes: int = None) -> pd.DataFrame:
+    """Grid search on one week, sorted by expectancy like vwap_backtest_october.backtest."""
+    results = []
+    for combo in param_grid:
+        params = dict(zip(PARAM_NAMES, combo))
+        trades = simulate(feat, params, gap_minutes)
+        if len(trades) == 0:
+            continue
+        results.append({**params, **summarize(trades)})
+    if not results:
+        return pd.DataFrame(columns=PARAM_NAMES + METRIC_COLUMNS)
+    return pd.DataFrame(results).sort_values(by='expectancy', ascending=False)
+
+
+# ==========================
+# Walk-forward driver
+# ==========================
+class WalkForwardOptimizer:
+    def __init__(self, cache: FeatureCache, param_grid=PARAM_GRID, train_weeks: int = 1,
+                 gap_minutes: int = None):
+        self.cache = cache
+        self.param_grid = param_grid
+        self.train_weeks = train_weeks
+        self.gap_minutes = gap_minutes
+
+    def run(self, weeks=None) -> pd.DataFrame:
+        weeks = list(weeks if weeks is not None else self.cache.weeks())
+        folds = []
+        for k in range(self.train_weeks, len(weeks)):
+            train = weeks[k - self.train_weeks:k]
+            test = weeks[k]
+            ranked = self._optimize(train)
+            if ranked.empty:
+                continue
+            best = ranked.iloc[0]
+            params = {name: best[name] for name in PARAM_NAMES}
+            params['T_stop'] = int(params['T_stop'])
+            oos = summarize(simulate(self.cache[test], params, self.gap_minutes))
+            folds.append({
+                'train': ','.join(str(w) for w in train),
+                'test': test,
+                **params,
+                'is_expectancy': best['expectancy'],
+                **{f'oos_{key}': v for key, v in oos.items()},
+            })
+        return pd.DataFrame(folds)
+
+    def _optimize(self, train) -> pd.DataFrame:
+        # Multi-week training windows are scored on their pooled trades
+        feats = [self.cache[w] for w in train]
+        if len(feats) == 1:
+            return optimize(feats[0], self.param_grid, self.gap_minutes)
+        results = []
+        for combo in self.param_grid:
+            params = dict(zip(PARAM_NAMES, combo))
+            trades = pd.concat([simulate(f, params, self.gap_minutes) for f in feats], ignore_index=True)
+            if len(trades) == 0:
+                continue
+            results.append({**params, **summarize(trades)})
+        if not results:
+            return pd.DataFrame(columns=PARAM_NAMES + METRIC_COLUMNS)
+        return pd.DataFrame(results).sort_values(by='expectancy', ascending=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Walk-forward VWAP optimizer over weekly CSVs")
+    parser.add_argument('--folder', default='.')
+    parser.add_argument('--pattern', default='USTEC_Week*_data.csv')
+    parser.add_argument('--train-weeks', type=int, default=1)
+    parser.add_argument('--gap-minutes', type=int, default=None,
+                        help="stop look-ahead windows at gaps longer than this")
+    args = parser.parse_args(argv)
+
+    sources = discover_weeks(args.folder, args.pattern)
+    if len(sources) <= args.train_weeks:
+        print(f"❌ Need more than {args.train_weeks} weekly files, found {len(sources)}.")
+        return None
+
+    cache = FeatureCache(sources)
+    folds = WalkForwardOptimizer(cache, train_weeks=args.train_weeks, gap_minutes=args.gap_minutes).run()
+    print("📊 Walk-forward folds (out-of-sample):")
+    print(folds.to_string(index=False))
+    print(f"✅ {cache.builds} weekly feature sets built for {len(folds)} folds.")
+    return folds
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import time as _time
+from bisect import bisect_left, bisect_right, insort
+
+# ==========================
+# Zone lifecycle registry
+# ==========================
+# Live bots re-detect the same zones every cycle and must not trade one
+# twice. The registry keeps, per symbol, the zones seen so far with a state:
+#
+# - active: detected, not traded yet
+# - traded: an order was placed from it; blocks overlapping entries
+# - invalidated: price closed through it or it outlived `ttl`; dropped
+#
+# Each symbol keeps its zones' lows and highs in sorted lists per state,
+# updated with bisect inserts/deletes as zones are added, traded or
+# dropped. A zone overlaps [low, high] when its low <= high and its high >=
+# low; zones with high < low are a subset of those with low <= high, so
+# the number of overlapping zones is the difference of two bisect counts
+# and is_traded() costs two binary searches. Each symbol keeps at most
+# `max_zones` zones, so a bot running for weeks uses bounded memory: when
+# the book is full, zones past `ttl` are dropped to make room, and if every
+# zone is still live add() refuses the new one (returns None) rather than
+# evicting a zone that may still block trades.
+
+ACTIVE, TRADED, INVALIDATED = 'active', 'traded', 'invalidated'
+
+
+class _Book:
+    def __init__(self):
+        self.zones = {}     # id -> zone dict, insertion (= age) order
+        self.keys = {}      # (low, high, side) -> id
+        self.lows = {ACTIVE: [], TRADED: []}    # state -> sorted (low, id)
+        self.highs = {ACTIVE: [], TRADED: []}   # state -> sorted (high, id)
+
+    def insert(self, zone):
+        insort(self.lows[zone['state']], (zone['low'], zone['id']))
+        insort(self.highs[zone['state']], (zone['high'], zone['id']))
+
+    def discard(self, zone):
+        lows, highs = self.lows[zone['state']], self.highs[zone['state']]
+        del lows[bisect_left(lows, (zone['low'], zone['id']))]
+        del highs[bisect_left(highs, (zone['high'], zone['id']))]
+
+
+class ZoneRegistry:
+    def __init__(self, ttl: float = None, max_zones: int = 500):
+        self.ttl = ttl              # seconds a zone lives after it was first seen (None = forever)
+        self.max_zones = max_zones  # per symbol
+        self.books = {}
+        self._next_id = 0
+
+    def _book(self, symbol) -> _Book:
+        if symbol not in self.books:
+            self.books[symbol] = _Book()
+        return self.books[symbol]
+
+    # ---- lifecycle ----
+    def add(self, symbol, low, high, side=None, now=None) -> dict:
+        """Register a zone (or return the one already registered with the same edges and side).
+
+        Returns None when the symbol holds max_zones zones that are all
+        within ttl.
+        """
+        low, high = float(min(low, high)), float(max(low, high))
+        book = self._book(symbol)
+        key = (low, high, side)
+        if key in book.keys:
+            return book.zones[book.keys[key]]
+        now = _time.time() if now is None else now
+        if len(book.zones) >= self.max_zones:
+            for zone_id in self._expired(book, now):
+                self._remove(book, zone_id)
+            if len(book.zones) >= self.max_zones:
+                return None
+        zone = {'id': self._next_id, 'symbol': symbol, 'low': low, 'high': high, 'side': side,
+                'state': ACTIVE, 'created': now}
+        self._next_id += 1
+        book.zones[zone['id']] = zone
+        book.keys[key] = zone['id']
+        book.insert(zone)
+        return zone
+
+    def mark_traded(self, symbol, low, high, side=None, now=None) -> dict:
+        book = self._book(symbol)
+        zone = self.add(symbol, low, high, side, now)
+        if zone is not None and zone['state'] != TRADED:
+            book.discard(zone)
+            zone['state'] = TRADED
+            book.insert(zone)
+        return zone
+
+    def _remove(self, book, zone_id):
+        zone = book.zones.pop(zone_id)
+        del book.keys[(zone['low'], zone['high'], zone['side'])]
+        book.discard(zone)
+        zone['state'] = INVALIDATED
+        return zone
+
+    def _expired(self, book, now) -> list:
+        if self.ttl is None:
+            return []
+        # zones are kept in the order they were first seen
+        ids = []
+        for zone in book.zones.values():
+            if now - zone['created'] <= self.ttl:
+                break
+            ids.append(zone['id'])
+        return ids
+
+    def update(self, symbol, price=None, now=None) -> list:
+        """Drop zones that expired by `now` or were closed through by `price`; returns them.
+
+        `price` should be a bar close, not a tick. A buy zone is broken by
+        a price below its low, a sell zone by a price above its high; zones
+        without a side only expire by time.
+        """
+        book = self._book(symbol)
+        now = _time.time() if now is None else now
+        doomed = set(self._expired(book, now))
+        if price is not None:
+            for state in (ACTIVE, TRADED):
+                lows, highs = book.lows[state], book.highs[state]
+                above = lows[bisect_right(lows, (price, float('inf'))):]
+                below = highs[:bisect_left(highs, (price, -1))]
+                doomed.update(i for _, i in above if book.zones[i]['side'] == 'buy')
+                doomed.update(i for _, i in below if book.zones[i]['side'] == 'sell')
+        return [self._remove(book, i) for i in sorted(doomed)]
+
+    # ---- queries ----
+    def count(self, symbol, low, high, state=TRADED) -> int:
+        """Number of `state` zones of `symbol` overlapping [low, high]; two binary searches."""
+        low, high = min(low, high), max(low, high)
+        book = self._book(symbol)
+        lows, highs = book.lows[state], book.highs[state]
+        return bisect_right(lows, (high, float('inf'))) - bisect_left(highs, (low, -1))
+
+    def overlapping(self, symbol, low, high, state=None) -> list:
+        """Zones of `symbol` overlapping [low, high] (optionally only those in `state`), oldest first."""
+        low, high = min(low, high), max(low, high)
+        book = self._book(symbol)
+        hits = set()
+        for st in ((state,) if state else (ACTIVE, TRADED)):
+            lows, highs = book.lows[st], book.highs[st]
+            # zones starting inside [low, high], then zones reaching into it from below
+            hits.update(i for _, i in lows[bisect_left(lows, (low, -1)):bisect_right(lows, (high, float('inf')))])
+            hits.update(i for _, i in highs[bisect_left(highs, (low, -1)):] if book.zones[i]['low'] < low)
+        return [book.zones[i] for i in sorted(hits)]
+
+    def is_traded(self, symbol, low, high) -> bool:
+        return self.count(symbol, low, high, TRADED) > 0
+
+    def __len__(self):
+        return sum(len(b.zones) for b in self.books.values())
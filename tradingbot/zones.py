@@ -0,0 +1,184 @@
+import numpy as np
+
+from .swings import window_max, window_min
+
+# ==========================
+# SMC zone kernels
+# ==========================
+# Zone detectors over plain OHLC arrays (DataFrame columns or MT5 rate
+# fields). Each returns a compact structured array ordered by bar index;
+# the per-script wrappers turn rows into whatever tuples/dicts their
+# plotting or entry code expects.
+
+# Fair value gap between candle 1 (start) and candle 3 (end). low/high are
+# the gap edges: for a bullish gap c1.high..c3.low, bearish c3.high..c1.low.
+FVG_DTYPE = np.dtype([
+    ('start', 'i8'), ('end', 'i8'), ('start_time', 'M8[ns]'), ('end_time', 'M8[ns]'),
+    ('type', 'U4'), ('low', 'f8'), ('high', 'f8'),
+])
+
+
+def fvg_zones(time, high, low) -> np.ndarray:
+    """All three-candle fair value gaps as an FVG_DTYPE array."""
+    time = np.asarray(time).astype('datetime64[ns]')
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    if len(high) < 3:
+        return np.empty(0, dtype=FVG_DTYPE)
+
+    h1, l1, h3, l3 = high[:-2], low[:-2], high[2:], low[2:]
+    bull = l3 > h1
+    bear = h3 < l1
+    end = np.flatnonzero(bull | bear) + 2
+    is_bull = bull[end - 2]
+
+    out = np.empty(len(end), dtype=FVG_DTYPE)
+    out['start'] = end - 2
+    out['end'] = end
+    out['start_time'] = time[end - 2]
+    out['end_time'] = time[end]
+    out['type'] = np.where(is_bull, 'bull', 'bear')
+    out['low'] = np.where(is_bull, high[end - 2], high[end])
+    out['high'] = np.where(is_bull, low[end], low[end - 2])
+    return out
+
+
+class FvgStream:
+    """Streaming fvg_zones(): feed closed bars, get the gap each new bar completes."""
+
+    def __init__(self):
+        self.bars = []   # last two (index, time, high, low)
+        self.count = 0
+
+    def update(self, time, high, low):
+        """Add a closed bar; returns an FVG_DTYPE record or None."""
+        bar = (self.count, np.datetime64(time, 'ns'), float(high), float(low))
+        self.count += 1
+        found = None
+        if len(self.bars) == 2:
+            i1, t1, h1, l1 = self.bars[0]
+            if low > h1 or high < l1:
+                bull = low > h1
+                found = np.array((i1, bar[0], t1, bar[1], 'bull' if bull else 'bear',
+                                  h1 if bull else high, low if bull else l1), dtype=FVG_DTYPE)[()]
+        self.bars = (self.bars + [bar])[-2:]
+        return found
+
+
+# Price zones formed at a single bar (`index`). `broken` is the first later
+# bar whose close went through the zone (-1 while it holds); `valid` is
+# broken == -1.
+ZONE_DTYPE = np.dtype([
+    ('index', 'i8'), ('time', 'M8[ns]'), ('type', 'U6'), ('low', 'f8'), ('high', 'f8'),
+    ('valid', '?'), ('broken', 'i8'),
+])
+
+
+def suffix_min(x) -> np.ndarray:
+    """out[k] = min(x[k:])."""
+    return np.minimum.accumulate(np.asarray(x, dtype=float)[::-1])[::-1]
+
+
+def suffix_max(x) -> np.ndarray:
+    return np.maximum.accumulate(np.asarray(x, dtype=float)[::-1])[::-1]
+
+
+def first_cross(x, start, level, below: bool = True) -> np.ndarray:
+    """First index j >= start[k] with x[j] < level[k] (x[j] > level[k] if not below); -1 if none.
+
+    Binary lifting over a sparse table of block minima (maxima), so every
+    query is O(log n) and all queries run together.
+    """
+    x = np.asarray(x, dtype=float)
+    start = np.asarray(start, dtype=np.int64)
+    level = np.asarray(level, dtype=float)
+    n = len(x)
+    sign = 1.0 if below else -1.0
+    # For "above" queries negate everything and search for a crossing below
+    table = [sign * x]
+    while 2 ** len(table) <= n:
+        prev, step = table[-1], 2 ** (len(table) - 1)
+        table.append(np.minimum(prev[:-step], prev[step:]))
+    target = sign * level
+    pos = start.copy()
+    for k in range(len(table) - 1, -1, -1):
+        block = table[k]
+        ok = pos < len(block)
+        hold = np.zeros(len(pos), dtype=bool)
+        hold[ok] = block[pos[ok]] >= target[ok]
+        pos = np.where(hold, pos + 2 ** k, pos)
+    return np.where(pos < n, pos, -1)
+
+
+def supply_demand_zones(time, high, low, close, impulse_factor: float = 1.5) -> np.ndarray:
+    """Demand/supply zones at candles followed by an impulse close.
+
+    Bar i is a demand zone when close[i+1] > high[i] + impulse_factor *
+    mean range, and a supply zone when close[i+1] < low[i] - impulse_factor
+    * mean range. A demand zone is broken by the first close below its low
+    after bar i (supply: above its high); validity comes from one suffix
+    min/max pass, the break bar from first_cross().
+    """
+    time = np.asarray(time).astype('datetime64[ns]')
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    n = len(close)
+    if n < 5:
+        return np.empty(0, dtype=ZONE_DTYPE)
+
+    impulse = (high - low).mean() * impulse_factor
+    i = np.arange(2, n - 2)
+    demand = close[i + 1] > high[i] + impulse
+    supply = close[i + 1] < low[i] - impulse
+    idx = i[demand | supply]
+    is_demand = demand[idx - 2]
+
+    out = np.empty(len(idx), dtype=ZONE_DTYPE)
+    out['index'] = idx
+    out['time'] = time[idx]
+    out['type'] = np.where(is_demand, 'demand', 'supply')
+    out['low'] = low[idx]
+    out['high'] = high[idx]
+
+    after = idx + 1
+    out['valid'] = np.where(is_demand, suffix_min(close)[after] >= low[idx], suffix_max(close)[after] <= high[idx])
+    broken = np.full(len(idx), -1, dtype=np.int64)
+    dz, sz = is_demand & ~out['valid'], ~is_demand & ~out['valid']
+    broken[dz] = first_cross(close, after[dz], low[idx][dz], below=True)
+    broken[sz] = first_cross(close, after[sz], high[idx][sz], below=False)
+    out['broken'] = broken
+    return out
+
+
+def order_block_zones(time, open_, high, low, close, lookahead: int = 8, move_factor: float = 0.5) -> np.ndarray:
+    """Order-block candidates as a ZONE_DTYPE array (type 'bull'/'bear').
+
+    A bearish candle is a bullish OB when the highest high of the next
+    `lookahead` bars exceeds its high by move_factor * mean range; a
+    bullish candle is a bearish OB when the lowest low drops that far below
+    its low. The forward max/min come from one window pass over all bars.
+    """
+    time = np.asarray(time).astype('datetime64[ns]')
+    open_, high, low, close = (np.asarray(a, dtype=float) for a in (open_, high, low, close))
+    n = len(close)
+    if n <= lookahead + 1:
+        return np.empty(0, dtype=ZONE_DTYPE)
+
+    move = (high - low).mean() * move_factor
+    i = np.arange(1, n - lookahead)
+    future_max = window_max(high, lookahead)[i + 1]
+    future_min = window_min(low, lookahead)[i + 1]
+    bull = (close[i] < open_[i]) & (future_max > high[i] + move)
+    bear = (close[i] > open_[i]) & (future_min < low[i] - move)
+    idx = i[bull | bear]
+
+    out = np.empty(len(idx), dtype=ZONE_DTYPE)
+    out['index'] = idx
+    out['time'] = time[idx]
+    out['type'] = np.where(bull[idx - 1], 'bull', 'bear')
+    out['low'] = low[idx]
+    out['high'] = high[idx]
+    out['valid'] = True
+    out['broken'] = -1
+    return out
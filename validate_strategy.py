@@ -1,4 +1,4 @@
-pimport pandas as pd
+import pandas as pd
 import glob
 import numpy as np
 
@@ -92,4 +92,14 @@ if reports:
         print("⚠️ Strategy unstable — win rate too variable or above realistic threshold.")
 else:
     print("❌ No valid reports generated.")
-ython -c "import pandas as pd; print(pd.read_csv('backtest_results.csv').head())"
+
+# --------------------------------------------------------------
+# Monte Carlo bootstrap (daily blocks keep same-day clustering)
+# --------------------------------------------------------------
+from tradingbot.monte_carlo import load_trades, bootstrap, summarize
+
+all_trades = load_trades("USTEC_trades*.csv")
+if not all_trades.empty:
+    paths = bootstrap(all_trades, n_paths=20000, block='day')
+    print("\n🎲 Monte Carlo (20000 paths, daily blocks):")
+    print(summarize(paths).round(3).to_string())
@@ -2,6 +2,9 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib.dates as mdates
+from tradingbot.bar_cache import read_bars_cached
+from tradingbot.bar_index import BarIndex, index_for_file
+from tradingbot.timestamps import to_epoch_ns
 
 # ======================================
 # 1️⃣ Load Trades CSV
@@ -24,7 +27,9 @@ else:
     print("❌ No timestamp column found.")
     exit()
 
+df = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
 df['date_only'] = df['timestamp'].dt.date
+trade_index = BarIndex(to_epoch_ns(df['timestamp']))  # trade rows per day
 
 # ======================================
 # 2️⃣ Summarize Daily Performance
@@ -44,9 +49,8 @@ print(summary)
 # ======================================
 candles_file = "USTEC_candles.csv"
 try:
-    candles = pd.read_csv(candles_file)
-    candles['time'] = pd.to_datetime(candles['time'])
-    candles['date_only'] = candles['time'].dt.date
+    candles = read_bars_cached(candles_file).rename(columns={'timestamp': 'time', 'tickvol': 'tick_volume'})
+    candle_index = index_for_file(candles_file)
     print(f"✅ Candle data loaded with {len(candles)} rows")
 except FileNotFoundError:
     print("⚠️ No candle data found — skipping chart.")
@@ -58,7 +62,7 @@ except FileNotFoundError:
 best_day = None
 if candles is not None:
     trade_days = df['date_only'].unique()
-    candle_days = candles['date_only'].unique()
+    candle_days = candle_index.dates()
     common_days = np.intersect1d(trade_days, candle_days)
 
     if len(common_days) == 0:
@@ -92,8 +96,8 @@ if candles is not None:
 # 6️⃣ Plot Trades + VWAP + ATR for Best Day
 # ======================================
 if best_day is not None and candles is not None:
-    candle_day = candles[candles['date_only'] == pd.to_datetime(best_day).date()]
-    trades_day = df[df['date_only'] == pd.to_datetime(best_day).date()]
+    candle_day = candles.iloc[candle_index.day(best_day)]
+    trades_day = df.iloc[trade_index.day(best_day)]
 
     if not candle_day.empty and not trades_day.empty:
         plt.figure(figsize=(14, 7))
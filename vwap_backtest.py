@@ -3,6 +3,8 @@ import numpy as np
 from itertools import product
 import os
 
+from tradingbot.timestamps import parse_date_time, to_datetime64
+
 # ==========================
 # Utility functions
 # ==========================
@@ -150,10 +152,7 @@ def load_mt5_csv(file_path):
                 # Fallback to split date/time
                 df = pd.read_csv(file_path, sep=sep, skiprows=1, encoding=enc,
                                  names=['date','time','open','high','low','close','tickvol','volume','spread'])
-                df['timestamp'] = pd.to_datetime(
-                    df['date'].astype(str).str.strip() + ' ' + df['time'].astype(str).str.strip(),
-                    format='%Y.%m.%d %H:%M:%S', errors='coerce'
-                )
+                df['timestamp'] = to_datetime64(parse_date_time(df['date'], df['time'], '%Y.%m.%d'))
 
             # Convert numerics
             for col in ['open','high','low','close','tickvol','volume','spread']:
@@ -3,6 +3,8 @@ import numpy as np
 from itertools import product
 import os
 
+from tradingbot.mt5_csv import read_mt5_csv
+
 # ==========================
 # Config
 # ==========================
@@ -215,7 +217,7 @@ def backtest(df, param_grid):
 # Main: load, filter, compute, run
 # ==========================
 if __name__ == "__main__":
-    df = load_mt5_csv(FILE)
+    df = read_mt5_csv(FILE)
     print("✅ CSV loaded. Timestamp range:", df['timestamp'].min(), "→", df['timestamp'].max())
 
     # Week selection